@@ -0,0 +1,75 @@
+from typing import Dict, Iterable, List, Optional
+
+from be.infrastructure.responsesDTO.responses import (
+    ProductResponseDTO, CartResponseDTO, CartProductSummaryDTO, CartSummaryResponseDTO)
+
+
+class ProductIndex:
+    """Hash index of products by id; cart rows reference products by an int product_id."""
+
+    def __init__(self, products: Iterable[ProductResponseDTO]):
+        self._by_id: Dict[str, ProductResponseDTO] = {str(product.id): product for product in products}
+
+    def get(self, product_id) -> Optional[ProductResponseDTO]:
+        return self._by_id.get(str(product_id))
+
+    def __contains__(self, product_id) -> bool:
+        return str(product_id) in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
+class CartAggregator:
+    """Per-product cart totals, updated row by row so rows can be fed straight from a stream."""
+
+    def __init__(self, index: ProductIndex):
+        self.index = index
+        self._quantities: Dict[int, int] = {}
+        self._rows: Dict[int, int] = {}
+        self.total_quantity = 0
+        self.total_price = 0
+
+    def add(self, row: CartResponseDTO):
+        product_id = row.product_id
+        self._quantities[product_id] = self._quantities.get(product_id, 0) + row.quantity
+        self._rows[product_id] = self._rows.get(product_id, 0) + 1
+        self.total_quantity += row.quantity
+        product = self.index.get(product_id)
+        if product is not None:
+            self.total_price += product.price * row.quantity
+
+    def feed(self, rows: Iterable[CartResponseDTO]) -> "CartAggregator":
+        for row in rows:
+            self.add(row)
+        return self
+
+    def quantity_of(self, product_id: int) -> int:
+        return self._quantities.get(product_id, 0)
+
+    def items(self) -> List[CartProductSummaryDTO]:
+        items = []
+        for product_id in sorted(self._quantities):
+            product = self.index.get(product_id)
+            quantity = self._quantities[product_id]
+            items.append(CartProductSummaryDTO(
+                product_id=product_id,
+                name=product.name if product else None,
+                unit_price=product.price if product else None,
+                quantity=quantity,
+                rows=self._rows[product_id],
+                total_price=product.price * quantity if product else None,
+            ))
+        return items
+
+    def summary(self) -> CartSummaryResponseDTO:
+        return CartSummaryResponseDTO(
+            items=self.items(),
+            total_quantity=self.total_quantity,
+            total_price=self.total_price,
+            unknown_product_ids=sorted(product_id for product_id in self._quantities if product_id not in self.index),
+        )
+
+
+def summarize_cart(products: Iterable[ProductResponseDTO], cart_rows: Iterable[CartResponseDTO]) -> CartSummaryResponseDTO:
+    return CartAggregator(ProductIndex(products)).feed(cart_rows).summary()
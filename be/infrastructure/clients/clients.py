@@ -0,0 +1,189 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Iterator, List, Optional, Type
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from be.infrastructure.endpoints.endpoints import get_url, QueryBuilder
+from be.infrastructure.requestsDTO.requests import AddToCartRequestDTO, AddToCartBatchRequestDTO
+from be.infrastructure.aggregation.cart_aggregation import summarize_cart
+from be.infrastructure.responsesDTO.responses import (ProductResponseDTO, CartResponseDTO, CartSummaryResponseDTO,
+                                                     AddToCartResultDTO, AddToCartBatchResponseDTO)
+from be.infrastructure.responsesDTO import decoders
+import sys
+sys.path.append('..')
+from configuration import DEFAULT_TIMEOUT, RETRY_ATTEMPTS, RETRY_DELAY
+
+RETRY_STATUSES = (502, 503, 504)
+STREAM_CHUNK_SIZE = 64 * 1024
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_PREFETCH = 4
+DEFAULT_BATCH_CHUNK_SIZE = 1000
+DEFAULT_BATCH_WORKERS = 10
+
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    # RETRY_ATTEMPTS counts the first try; only idempotent methods are retried on bad statuses,
+    # connection failures are retried for every method since the request never reached the server
+    retry = Retry(
+        total=RETRY_ATTEMPTS - 1,
+        backoff_factor=RETRY_DELAY,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class ApiClient:
+
+    def __init__(self, session: requests.Session, timeout: float = DEFAULT_TIMEOUT):
+        self.session = session
+        self.timeout = timeout
+
+    def get(self, suffix: str, query: QueryBuilder = None, **kwargs) -> requests.Response:
+        return self.session.get(get_url(suffix, query), timeout=self.timeout, **kwargs)
+
+    def post(self, suffix: str, **kwargs) -> requests.Response:
+        return self.session.post(get_url(suffix), timeout=self.timeout, **kwargs)
+
+
+    def iter_pages(self, suffix: str, model: Type[decoders.Model], query: Optional[QueryBuilder] = None,
+                   page_size: int = DEFAULT_PAGE_SIZE, prefetch: int = DEFAULT_PREFETCH) -> Iterator[List]:
+        """Yield decoded pages in order while up to `prefetch` later pages are fetched concurrently.
+
+        At most `prefetch` pages are held in memory, so arbitrarily large collections can be scanned.
+        """
+        query = query or QueryBuilder()
+
+        def fetch(page: int):
+            resp = self.get(suffix, query.page(page, page_size))
+            resp.raise_for_status()
+            return decoders.decode_list(resp.content, model)
+
+        with ThreadPoolExecutor(max_workers=prefetch) as pool:
+            pending = deque(pool.submit(fetch, page) for page in range(1, prefetch + 1))
+            next_page = prefetch + 1
+            try:
+                while pending:
+                    rows = pending.popleft().result()
+                    if rows:
+                        yield rows
+                    if len(rows) < page_size:
+                        return
+                    pending.append(pool.submit(fetch, next_page))
+                    next_page += 1
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+class ProductsClient(ApiClient):
+    path = "/products"
+
+    def get_products_response(self) -> requests.Response:
+        return self.get(self.path)
+
+    def get_products(self) -> List[ProductResponseDTO]:
+        resp = self.get_products_response()
+        resp.raise_for_status()
+        return decoders.decode_products(resp.content)
+
+    def iter_products_paged(self, query: Optional[QueryBuilder] = None, model=ProductResponseDTO,
+                            page_size: int = DEFAULT_PAGE_SIZE, prefetch: int = DEFAULT_PREFETCH) -> Iterator:
+        for page in self.iter_pages(self.path, model, query, page_size, prefetch):
+            yield from page
+
+    def iter_products(self) -> Iterator[ProductResponseDTO]:
+        with self.get(self.path, stream=True) as resp:
+            resp.raise_for_status()
+            yield from decoders.iter_models(resp.iter_content(STREAM_CHUNK_SIZE), ProductResponseDTO)
+
+
+class CartClient(ApiClient):
+    path = "/cart"
+
+    def get_cart_response(self) -> requests.Response:
+        return self.get(self.path)
+
+    def get_cart(self) -> List[CartResponseDTO]:
+        resp = self.get_cart_response()
+        resp.raise_for_status()
+        return decoders.decode_cart_list(resp.content)
+
+    def iter_cart_paged(self, query: Optional[QueryBuilder] = None, model=CartResponseDTO,
+                        page_size: int = DEFAULT_PAGE_SIZE, prefetch: int = DEFAULT_PREFETCH) -> Iterator:
+        for page in self.iter_pages(self.path, model, query, page_size, prefetch):
+            yield from page
+
+    def iter_cart(self) -> Iterator[CartResponseDTO]:
+        with self.get(self.path, stream=True) as resp:
+            resp.raise_for_status()
+            yield from decoders.iter_models(resp.iter_content(STREAM_CHUNK_SIZE), CartResponseDTO)
+
+    def add_to_cart_response(self, request: AddToCartRequestDTO) -> requests.Response:
+        return self.post(self.path, json=request.model_dump())
+
+    def add_to_cart(self, request: AddToCartRequestDTO) -> CartResponseDTO:
+        resp = self.add_to_cart_response(request)
+        resp.raise_for_status()
+        return decoders.decode_cart_item(resp.content)
+
+    def add_to_cart_batch(self, batch: AddToCartBatchRequestDTO, bulk: bool = True,
+                          chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+                          workers: int = DEFAULT_BATCH_WORKERS) -> AddToCartBatchResponseDTO:
+        """Add every item of the batch and report a per-item status, in submission order.
+
+        Uses POST /cart/bulk one chunk at a time; servers without it (json-server, the live API)
+        get concurrent single POSTs over the pooled session instead. Keep `workers` at or below
+        the session's pool size or the extra threads just wait for a connection.
+        """
+        results = []
+        for start in range(0, len(batch.items), chunk_size):
+            chunk = batch.items[start:start + chunk_size]
+            chunk_results = self._add_bulk(chunk) if bulk else None
+            if chunk_results is None:
+                bulk = False
+                chunk_results = self._add_concurrently(chunk, workers)
+            results.extend(chunk_results)
+        return AddToCartBatchResponseDTO(results=results)
+
+    def _add_bulk(self, items: List[AddToCartRequestDTO]) -> Optional[List[AddToCartResultDTO]]:
+        resp = self.post(f"{self.path}/bulk", json=[item.model_dump() for item in items])
+        if resp.status_code in (HTTPStatus.NOT_FOUND, HTTPStatus.METHOD_NOT_ALLOWED):
+            return None
+        resp.raise_for_status()
+        return decoders.decode_list(resp.content, AddToCartResultDTO)
+
+    def _add_concurrently(self, items: List[AddToCartRequestDTO], workers: int) -> List[AddToCartResultDTO]:
+        def add(item: AddToCartRequestDTO) -> AddToCartResultDTO:
+            try:
+                resp = self.add_to_cart_response(item)
+            except requests.RequestException as e:
+                return AddToCartResultDTO(status=0, error=str(e))
+            if not resp.ok:
+                return AddToCartResultDTO(status=resp.status_code, error=resp.text)
+            return AddToCartResultDTO(status=resp.status_code, item=decoders.decode_cart_item(resp.content))
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(add, items))
+
+    def get_summary_response(self) -> requests.Response:
+        return self.get(f"{self.path}/summary")
+
+    def get_summary(self) -> CartSummaryResponseDTO:
+        resp = self.get_summary_response()
+        resp.raise_for_status()
+        return CartSummaryResponseDTO.model_validate_json(resp.content)
+
+    # Client-side equivalent of /cart/summary for servers without it (e.g. json-server);
+    # cart rows are aggregated as they stream in
+    def summarize(self, products: List[ProductResponseDTO]) -> CartSummaryResponseDTO:
+        return summarize_cart(products, self.iter_cart())
@@ -0,0 +1,127 @@
+import argparse
+import json
+import math
+import random
+import shutil
+from pathlib import Path
+from typing import Iterator, Optional
+
+from be.infrastructure.mockServer.mock_server import DEFAULT_DB_PATH
+
+STATIC_STORE_DIR = Path(__file__).resolve().parents[3] / "ui" / "static-store"
+STATIC_STORE_FILES = ("index.html", "prod.html", "cart.html", "store.js", "imgs")
+
+# category -> (product lines per brand, mu and sigma of the log-normal price)
+CATEGORIES = {
+    "phone": ({"Samsung": ("galaxy",), "Nokia": ("lumia",), "Sony": ("xperia",), "Apple": ("iphone",),
+               "LG": ("nexus",), "Motorola": ("moto",), "Xiaomi": ("redmi", "mi")}, 5.9, 0.5),
+    "notebook": ({"Sony": ("vaio",), "Asus": ("zenbook",), "Dell": ("xps",), "Lenovo": ("thinkpad",),
+                  "Apple": ("macbook",), "Acer": ("aspire",), "HP": ("pavilion", "envy")}, 6.7, 0.4),
+    "monitor": ({"Dell": ("ultrasharp",), "Asus": ("proart",), "LG": ("ultragear",), "Samsung": ("odyssey",),
+                 "Apple": ("cinema",), "HP": ("omen",)}, 5.7, 0.6),
+}
+VARIANTS = ("", " 32gb", " 64gb", " 128gb", " pro", " plus", " mini", " max", " i5", " i7")
+
+
+def generate_products(count: int, seed: int = 0) -> Iterator[dict]:
+    """Deterministic products with log-normally distributed prices per category; names are unique."""
+    rng = random.Random(seed)
+    categories = list(CATEGORIES)
+    for i in range(count):
+        category = categories[rng.randrange(len(categories))]
+        brands, mu, sigma = CATEGORIES[category]
+        brand = rng.choice(list(brands))
+        name = f"{brand} {rng.choice(brands[brand])} {i + 1}{rng.choice(VARIANTS)}"
+        price = max(1, int(round(rng.lognormvariate(mu, sigma), -1)))
+        yield {"id": str(i + 1), "name": name, "price": price, "category": category}
+
+
+def generate_cart(count: int, product_count: int, seed: int = 0) -> Iterator[dict]:
+    """Cart rows whose product popularity is log-uniform (Zipf-like): a few products dominate, as in real carts."""
+    # checked here rather than on the first row, so nothing has been written when it fails
+    if count and product_count < 1:
+        raise ValueError(f"{count} cart rows need at least one product, got {product_count}")
+    return _cart_rows(count, product_count, seed)
+
+
+def _cart_rows(count: int, product_count: int, seed: int) -> Iterator[dict]:
+    rng = random.Random(seed + 1)
+    width = max(4, math.ceil(math.log(max(count, 2), 16)))
+    for i in range(count):
+        # (n + 1) ** u lies in [1, n + 1), so every rank from 1 to n can come up
+        rank = min(product_count, int((product_count + 1) ** rng.random()))
+        quantity = rng.choices((1, 2, 3, 4, 5), weights=(60, 20, 10, 6, 4))[0]
+        yield {"id": f"{i:0{width}x}", "product_id": rank, "quantity": quantity}
+
+
+def _write_array(f, rows: Iterator[dict], transform=None):
+    f.write("[")
+    for i, row in enumerate(rows):
+        if i:
+            f.write(",")
+        f.write("\n    ")
+        f.write(json.dumps(transform(row) if transform else row))
+    f.write("\n  ]")
+
+
+def write_db(path, product_count: int, cart_count: int, seed: int = 0):
+    """Streams a json-server db.json; memory use does not grow with the dataset size."""
+    cart = generate_cart(cart_count, product_count, seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    product_fields = ("id", "name", "price")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{\n  "products": ')
+        _write_array(f, generate_products(product_count, seed),
+                     lambda product: {field: product[field] for field in product_fields})
+        f.write(',\n  "cart": ')
+        _write_array(f, cart)
+        f.write("\n}\n")
+
+
+def write_static_store(directory, product_count: int, cart_count: int = 10, seed: int = 0):
+    """Copies ui/static-store and fills it with a generated catalog for the UI page objects."""
+    cart = generate_cart(cart_count, product_count, seed)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in STATIC_STORE_FILES:
+        source = STATIC_STORE_DIR / name
+        if source.is_dir():
+            shutil.copytree(source, directory / name, dirs_exist_ok=True)
+        else:
+            shutil.copy2(source, directory / name)
+
+    def entry(product):
+        return {"id": product["id"], "cat": product["category"], "title": product["name"],
+                "price": product["price"], "desc": f"{product['name']} ({product['category']})",
+                "img": "imgs/product.png"}
+
+    with open(directory / "entries.json", "w", encoding="utf-8") as f:
+        f.write('{\n  "Items": ')
+        _write_array(f, generate_products(product_count, seed), entry)
+        f.write("\n}\n")
+
+    rows = [{"id": row["id"], "prod_id": str(row["product_id"])} for row in cart]
+    (directory / "viewcart.json").write_text(json.dumps({"Items": rows}, indent=2) + "\n")
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Generate large deterministic datasets for scale testing")
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--cart", type=int, default=10_000, help="cart rows in the mock API dataset")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", help=f"write a mock API db.json here (the default one is {DEFAULT_DB_PATH})")
+    parser.add_argument("--static-store", help="write a static store with the generated catalog to this directory")
+    parser.add_argument("--static-cart", type=int, default=10, help="cart rows shown by the static store")
+    args = parser.parse_args(argv)
+
+    if not args.db and not args.static_store:
+        parser.error("nothing to do, pass --db and/or --static-store")
+    if args.db:
+        write_db(args.db, args.products, args.cart, args.seed)
+    if args.static_store:
+        write_static_store(args.static_store, args.products, args.static_cart, args.seed)
+
+
+if __name__ == "__main__":
+    main()
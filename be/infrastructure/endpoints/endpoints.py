@@ -1,8 +1,49 @@
 import os
+from typing import List, Optional, Tuple
+from urllib.parse import urlencode
 
-def get_url(suffix: str = None):
+
+class QueryBuilder:
+    """json-server list query: pagination (_page/_limit, _start/_end), sorting, filters and projection.
+
+    Builders are immutable, so a base query can be shared and refined per request.
+    _fields (projection) is only understood by the in-process mock API; json-server ignores it
+    and the partial DTOs drop the extra fields instead.
+    """
+
+    def __init__(self, params: Tuple[Tuple[str, str], ...] = ()):
+        self._params = params
+
+    def _with(self, *params) -> "QueryBuilder":
+        return QueryBuilder(self._params + tuple((key, str(value)) for key, value in params))
+
+    def page(self, page: int, limit: int) -> "QueryBuilder":
+        return self._with(("_page", page), ("_limit", limit))
+
+    def slice(self, start: int, end: int) -> "QueryBuilder":
+        return self._with(("_start", start), ("_end", end))
+
+    def sort(self, field: str, order: str = "asc") -> "QueryBuilder":
+        return self._with(("_sort", field), ("_order", order))
+
+    def where(self, field: str, value, op: Optional[str] = None) -> "QueryBuilder":
+        # op is one of json-server's suffixes: gte, lte, ne, like
+        return self._with((f"{field}_{op}" if op else field, value))
+
+    def fields(self, *names: str) -> "QueryBuilder":
+        return self._with(("_fields", ",".join(names)))
+
+    def params(self) -> List[Tuple[str, str]]:
+        return list(self._params)
+
+    def __str__(self) -> str:
+        return urlencode(self._params)
+
+
+def get_url(suffix: str = None, query: QueryBuilder = None):
     base_url = os.environ.get("BASE_URL", "http://localhost:3000")
     if suffix is None:
         return base_url
+    if query is not None and query.params():
+        return f"{base_url}{suffix}?{query}"
     return base_url + suffix
-
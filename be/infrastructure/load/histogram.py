@@ -0,0 +1,58 @@
+from typing import Dict
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of integer latencies (microseconds).
+
+    Every power-of-two range is split into the same number of linear sub-buckets, so the
+    relative error stays below 1 / 2 ** (significant_bits - 1) at any magnitude while memory
+    stays proportional to the number of distinct buckets hit.
+    """
+
+    def __init__(self, significant_bits: int = 7):
+        self.significant_bits = significant_bits
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.sum = 0
+
+    def _bucket(self, value: int) -> int:
+        shift = max(0, value.bit_length() - self.significant_bits)
+        return (value >> shift) << shift
+
+    def _bucket_width(self, lower: int) -> int:
+        return 1 << max(0, lower.bit_length() - self.significant_bits)
+
+    def record(self, value: int, count: int = 1):
+        value = max(0, int(value))
+        bucket = self._bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.total += count
+        self.sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram"):
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.total += other.total
+        self.sum += other.sum
+        if other.total:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else 0.0
+
+    def percentile(self, percentile: float) -> int:
+        if not self.total:
+            return 0
+        target = max(1, round(self.total * percentile / 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= target:
+                # highest value that falls in the bucket, capped by what was actually recorded
+                return min(bucket + self._bucket_width(bucket) - 1, self.max)
+        return self.max
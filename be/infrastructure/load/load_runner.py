@@ -0,0 +1,294 @@
+import argparse
+import asyncio
+import json
+import random
+import ssl
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import SplitResult, urlsplit
+
+from be.infrastructure.endpoints.endpoints import get_url
+from be.infrastructure.load.histogram import LatencyHistogram
+from be.infrastructure.requestsDTO.requests import AddToCartRequestDTO
+import sys
+sys.path.append('..')
+from configuration import DEFAULT_TIMEOUT
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    path: str
+    body: Optional[bytes] = None
+    weight: int = 1
+
+
+def default_scenarios() -> List[Scenario]:
+    add_to_cart = AddToCartRequestDTO(product_id=1, quantity=1)
+    return [
+        Scenario("get_products", "GET", "/products"),
+        Scenario("get_cart", "GET", "/cart"),
+        Scenario("add_to_cart", "POST", "/cart", json.dumps(add_to_cart.model_dump()).encode()),
+    ]
+
+
+@dataclass
+class ScenarioStats:
+    requests: int = 0
+    errors: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+@dataclass
+class LoadResult:
+    duration: float
+    stats: Dict[str, ScenarioStats]
+    # requests still in flight when the run ended; neither completed nor failed, so not in stats
+    interrupted: int = 0
+
+    @property
+    def total(self) -> ScenarioStats:
+        total = ScenarioStats()
+        for stats in self.stats.values():
+            total.requests += stats.requests
+            total.errors += stats.errors
+            total.latency.merge(stats.latency)
+        return total
+
+    @property
+    def throughput(self) -> float:
+        return self.total.requests / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        total = self.total
+        return total.errors / total.requests if total.requests else 0.0
+
+    def to_dict(self) -> dict:
+        def summarize(stats: ScenarioStats) -> dict:
+            return {
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "p50_ms": stats.latency.percentile(50) / 1000,
+                "p95_ms": stats.latency.percentile(95) / 1000,
+                "p99_ms": stats.latency.percentile(99) / 1000,
+                "max_ms": (stats.latency.max or 0) / 1000,
+            }
+
+        return {
+            "duration_s": round(self.duration, 3),
+            "throughput_rps": round(self.throughput, 1),
+            "error_rate": self.error_rate,
+            "interrupted": self.interrupted,
+            "total": summarize(self.total),
+            "scenarios": {name: summarize(stats) for name, stats in self.stats.items()},
+        }
+
+    def report(self) -> str:
+        return format_report(self.to_dict())
+
+
+def format_report(data: dict) -> str:
+    """The human-readable table for LoadResult.to_dict() output, e.g. one read back from a test report."""
+    lines = [
+        f"duration {data['duration_s']}s, throughput {data['throughput_rps']} req/s, "
+        f"error rate {data['error_rate']:.2%}, interrupted {data.get('interrupted', 0)}",
+        f"{'scenario':<16}{'requests':>10}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+    ]
+    rows = list(data["scenarios"].items()) + [("total", data["total"])]
+    for name, row in rows:
+        lines.append(
+            f"{name:<16}{row['requests']:>10}{row['errors']:>8}{row['p50_ms']:>10.2f}"
+            f"{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}{row['max_ms']:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+class HttpConnection:
+    """Minimal keep-alive HTTP/1.1 client on asyncio streams, one per virtual user."""
+
+    def __init__(self, host: str, port: int, ssl_context: Optional[ssl.SSLContext] = None):
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.reader = None
+        self.writer = None
+
+    @classmethod
+    def for_url(cls, url: SplitResult) -> "HttpConnection":
+        if url.scheme not in DEFAULT_PORTS:
+            raise ValueError(f"Unsupported URL scheme {url.scheme!r} in {url.geturl()}; use http or https")
+        ssl_context = ssl.create_default_context() if url.scheme == "https" else None
+        return cls(url.hostname, url.port or DEFAULT_PORTS[url.scheme], ssl_context)
+
+    async def request(self, method: str, path: str, body: Optional[bytes] = None,
+                      timeout: Optional[float] = None) -> Tuple[int, bytes]:
+        """(status, body) of one exchange; raises asyncio.TimeoutError after `timeout` seconds."""
+        try:
+            return await asyncio.wait_for(self._exchange(method, path, body), timeout)
+        except Exception:
+            # whatever is left of the response would be read as the start of the next one
+            await self.close()
+            raise
+
+    async def _exchange(self, method: str, path: str, body: Optional[bytes]) -> Tuple[int, bytes]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl_context)
+        headers = f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+        if body is not None:
+            headers += f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+        self.writer.write(headers.encode() + b"\r\n" + (body or b""))
+        return await self._read_response()
+
+    async def _read_response(self) -> Tuple[int, bytes]:
+        status_line = await self.reader.readuntil(b"\r\n")
+        parts = status_line.split()
+        if len(parts) < 2 or not parts[1].isdigit():
+            raise ValueError(f"Malformed status line: {status_line!r}")
+        status = int(parts[1])
+        length = None
+        chunked = False
+        keep_alive = True
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            value = value.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "transfer-encoding" and "chunked" in value:
+                chunked = True
+            elif name == "connection" and value == "close":
+                keep_alive = False
+        if chunked:
+            body = await self._read_chunked()
+        elif length is not None:
+            body = await self.reader.readexactly(length)
+        else:
+            body = await self.reader.read()
+            keep_alive = False
+        if not keep_alive:
+            await self.close()
+        return status, body
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            if size == 0:
+                await self.reader.readuntil(b"\r\n")
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+        self.reader = self.writer = None
+
+
+async def run_load(base_url: Optional[str] = None, concurrency: int = 10, rate: Optional[float] = None,
+                   duration: float = 10.0, scenarios: Optional[Sequence[Scenario]] = None,
+                   seed: int = 0, timeout: float = DEFAULT_TIMEOUT) -> LoadResult:
+    """Drive the scenarios with `concurrency` virtual users for `duration` seconds.
+
+    With a `rate` the run is open-loop: request i is scheduled at start + i / rate and its
+    latency is measured from that scheduled time, so queueing behind a slow server shows up
+    in the percentiles instead of being hidden (coordinated omission).
+
+    A request that takes longer than `timeout` seconds counts as an error. A request still
+    running when the run ends is cut off and counted as interrupted.
+    """
+    url = urlsplit(base_url or get_url())
+    # fail before the run starts rather than count every request as an error
+    HttpConnection.for_url(url)
+    base_path = url.path.rstrip("/")
+    scenarios = list(scenarios or default_scenarios())
+    weighted = [scenario for scenario in scenarios for _ in range(scenario.weight)]
+    stats = {scenario.name: ScenarioStats() for scenario in scenarios}
+    rng = random.Random(seed)
+
+    start = time.perf_counter()
+    deadline = start + duration
+    sent = 0
+    interrupted = 0
+
+    async def virtual_user():
+        nonlocal sent, interrupted
+        connection = HttpConnection.for_url(url)
+        try:
+            while True:
+                slot = sent
+                sent += 1
+                scheduled = start + slot / rate if rate else time.perf_counter()
+                if scheduled >= deadline:
+                    return
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                scenario = rng.choice(weighted)
+                scenario_stats = stats[scenario.name]
+                time_left = deadline - time.perf_counter()
+                try:
+                    status, _ = await connection.request(scenario.method, base_path + scenario.path, scenario.body,
+                                                         timeout=min(timeout, time_left))
+                    failed = status >= 400
+                except asyncio.TimeoutError:
+                    if time_left <= timeout:
+                        interrupted += 1
+                        return
+                    failed = True
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    failed = True
+                scenario_stats.requests += 1
+                scenario_stats.errors += failed
+                scenario_stats.latency.record(int((time.perf_counter() - scheduled) * 1_000_000))
+        finally:
+            await connection.close()
+
+    await asyncio.gather(*(virtual_user() for _ in range(concurrency)))
+    return LoadResult(time.perf_counter() - start, stats, interrupted)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the products and cart endpoints")
+    parser.add_argument("--base-url", help="defaults to BASE_URL / get_url()")
+    parser.add_argument("--mock", action="store_true", help="start the in-process mock API and target it")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rate", type=float, help="total requests per second, unbounded if omitted")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="seconds before a request counts as an error")
+    parser.add_argument("--scenario", action="append", choices=[s.name for s in default_scenarios()],
+                        help="limit the run to these scenarios, may be repeated")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args()
+
+    scenarios = [s for s in default_scenarios() if not args.scenario or s.name in args.scenario]
+    server = None
+    base_url = args.base_url
+    if args.mock:
+        from be.infrastructure.mockServer.mock_server import MockApiServer
+        server = MockApiServer().start()
+        base_url = server.url
+    try:
+        result = asyncio.run(run_load(base_url, args.concurrency, args.rate, args.duration, scenarios,
+                                        timeout=args.timeout))
+    finally:
+        if server:
+            server.stop()
+    print(json.dumps(result.to_dict(), indent=2) if args.json else result.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,462 @@
+import argparse
+import json
+import secrets
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Type
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel, ValidationError
+
+from be.infrastructure.aggregation.cart_aggregation import summarize_cart
+from be.infrastructure.responsesDTO.responses import ProductResponseDTO, CartResponseDTO
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[2] / "mock-api" / "db.json"
+DEFAULT_PAGE_SIZE = 10
+FILTER_OPERATORS = ("gte", "lte", "ne", "like")
+PAGING_PARAMS = {"_page", "_limit", "_start", "_end", "_fields"}
+MAX_CACHED_VIEWS = 32
+
+
+def _matches(value, op: Optional[str], expected: List[str]) -> bool:
+    # json-server semantics: repeated parameters are OR-ed, values compare as strings or numbers
+    for candidate in expected:
+        if op in ("gte", "lte"):
+            try:
+                number, bound = float(value), float(candidate)
+            except (TypeError, ValueError):
+                continue
+            if (number >= bound) if op == "gte" else (number <= bound):
+                return True
+        elif op == "ne":
+            if str(value) != candidate:
+                return True
+        elif op == "like":
+            if candidate.lower() in str(value).lower():
+                return True
+        elif str(value) == candidate:
+            return True
+    return False
+
+
+def _sort_key(value) -> tuple:
+    # rows written through the API can mix types in one field (e.g. int and str ids), so numbers,
+    # strings and everything else sort in separate groups, with missing values last
+    if value is None:
+        return 3, 0
+    if isinstance(value, (int, float)):
+        return 0, value
+    if isinstance(value, str):
+        return 1, value
+    return 2, json.dumps(value, sort_keys=True)
+
+
+def filter_and_sort(rows: List[dict], params: Dict[str, List[str]]) -> List[dict]:
+    for key, values in params.items():
+        if key.startswith("_"):
+            continue
+        field, _, op = key.rpartition("_")
+        if op not in FILTER_OPERATORS:
+            field, op = key, None
+        rows = [row for row in rows if _matches(row.get(field), op, values)]
+
+    if "_sort" in params:
+        fields = params["_sort"][0].split(",")
+        orders = params.get("_order", ["asc"])[0].split(",")
+        # stable sorts applied from the last key to the first give a multi-key sort
+        for i in reversed(range(len(fields))):
+            descending = (orders[i] if i < len(orders) else orders[-1]) == "desc"
+            rows = sorted(rows, key=lambda row, f=fields[i]: _sort_key(row.get(f)), reverse=descending)
+    return rows
+
+
+def paginate(rows: List[dict], params: Dict[str, List[str]]) -> List[dict]:
+    def number(name: str, default=None):
+        return int(params[name][0]) if name in params else default
+
+    if "_start" in params or "_end" in params:
+        start = number("_start", 0)
+        if "_end" in params:
+            end = number("_end")
+        elif "_limit" in params:
+            end = start + number("_limit")
+        else:
+            end = None
+        rows = rows[start:end]
+    elif "_page" in params:
+        limit = number("_limit", DEFAULT_PAGE_SIZE)
+        start = (max(1, number("_page")) - 1) * limit
+        rows = rows[start:start + limit]
+    elif "_limit" in params:
+        rows = rows[:number("_limit")]
+
+    if "_fields" in params:
+        fields = params["_fields"][0].split(",")
+        rows = [{field: row[field] for field in fields if field in row} for row in rows]
+    return rows
+
+
+class MockDatabase:
+    """In-memory copy of a json-server db.json, safe to share between handler threads."""
+
+    def __init__(self, data: Dict[str, List[dict]], path: Optional[Path] = None):
+        self.path = path
+        self.collections = {name: list(rows) for name, rows in data.items()}
+        self.lock = threading.RLock()
+        # collections whose list is still referenced by a snapshot and must be copied before a write
+        self._shared = set()
+        # serialized collections are cached until the next write, so hot GETs skip json.dumps
+        self._encoded: Dict[str, bytes] = {}
+        # filtered/sorted views, so paging through a query does not redo the filter and sort per page
+        self._views: Dict[Tuple[str, tuple], List[dict]] = {}
+        # ids per collection, built on the first insert so generating an id does not rescan the rows
+        self._ids: Dict[str, set] = {}
+
+    @classmethod
+    def from_file(cls, path: Path = DEFAULT_DB_PATH):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f), Path(path))
+
+    def has_collection(self, name: str) -> bool:
+        return name in self.collections
+
+    def encoded_collection(self, name: str) -> bytes:
+        with self.lock:
+            encoded = self._encoded.get(name)
+            if encoded is None:
+                encoded = json.dumps(self.collections[name]).encode()
+                self._encoded[name] = encoded
+            return encoded
+
+    def snapshot(self) -> Dict[str, List[dict]]:
+        """Capture the current state in O(collections); the lists are copied lazily on the next write."""
+        with self.lock:
+            self._shared = set(self.collections)
+            return dict(self.collections)
+
+    def restore(self, snapshot: Dict[str, List[dict]]):
+        with self.lock:
+            for name, rows in snapshot.items():
+                if self.collections.get(name) is not rows:
+                    self._changed(name)
+            self.collections = dict(snapshot)
+            self._shared = set(self.collections)
+            self._ids.clear()
+
+    def rows(self, name: str) -> List[dict]:
+        with self.lock:
+            return list(self.collections[name])
+
+    def query(self, name: str, params: Dict[str, List[str]]) -> Tuple[List[dict], int]:
+        """json-server style filter, sort, pagination and _fields projection; returns (rows, total)."""
+        view_params = {key: values for key, values in params.items() if key not in PAGING_PARAMS}
+        key = (name, tuple(sorted((k, tuple(v)) for k, v in view_params.items())))
+        with self.lock:
+            rows = self._views.get(key)
+            if rows is None:
+                rows = filter_and_sort(self.collections[name], view_params)
+                if len(self._views) >= MAX_CACHED_VIEWS:
+                    self._views.pop(next(iter(self._views)))
+                self._views[key] = rows
+        return paginate(rows, params), len(rows)
+
+    def find(self, name: str, item_id: str) -> Optional[dict]:
+        with self.lock:
+            for row in self.collections[name]:
+                if str(row.get("id")) == item_id:
+                    return row
+        return None
+
+    def insert(self, name: str, item: dict) -> dict:
+        return self.insert_many(name, [item])[0]
+
+    def insert_many(self, name: str, items: List[dict]) -> List[dict]:
+        """Append all items under one lock, invalidating the cached encodings once rather than per item."""
+        with self.lock:
+            rows = self._writable(name)
+            existing = self._ids.get(name)
+            if existing is None:
+                existing = self._ids[name] = {str(row.get("id")) for row in rows}
+            inserted = []
+            for item in items:
+                if "id" not in item:
+                    item = {"id": self._new_id(existing), **item}
+                existing.add(str(item["id"]))
+                rows.append(item)
+                inserted.append(item)
+            self._changed(name)
+            return inserted
+
+    def replace(self, name: str, item_id: str, item: dict, merge: bool = False) -> Optional[dict]:
+        with self.lock:
+            rows = self.collections[name]
+            for i, row in enumerate(rows):
+                if str(row.get("id")) == item_id:
+                    rows = self._writable(name)
+                    # rows are replaced rather than mutated so handed-out references stay stable
+                    updated = {**row, **item} if merge else {**item, "id": row["id"]}
+                    rows[i] = updated
+                    self._changed(name)
+                    return updated
+        return None
+
+    def delete(self, name: str, item_id: str) -> Optional[dict]:
+        with self.lock:
+            rows = self.collections[name]
+            for i, row in enumerate(rows):
+                if str(row.get("id")) == item_id:
+                    rows = self._writable(name)
+                    del rows[i]
+                    self._ids.get(name, set()).discard(str(row.get("id")))
+                    self._changed(name)
+                    return row
+        return None
+
+    def flush(self, path: Optional[Path] = None):
+        target = Path(path or self.path)
+        with self.lock:
+            data = json.dumps(self.collections, indent=2)
+        target.write_text(data, encoding="utf-8")
+
+    @staticmethod
+    def _new_id(existing) -> str:
+        # four hex digits like json-server, widened once the id space gets crowded
+        size = 2
+        while True:
+            for _ in range(8):
+                item_id = secrets.token_hex(size)
+                if item_id not in existing:
+                    return item_id
+            size += 1
+
+    def _writable(self, name: str) -> List[dict]:
+        if name in self._shared:
+            self.collections[name] = list(self.collections[name])
+            self._shared.discard(name)
+        return self.collections[name]
+
+    def _changed(self, name: str):
+        self._encoded.pop(name, None)
+        for key in [key for key in self._views if key[0] == name]:
+            del self._views[key]
+
+
+def _valid_rows(rows: List[dict], model: Type[BaseModel]) -> Tuple[list, int]:
+    """(rows that validate as `model`, number of rows that do not); POST accepts any JSON object."""
+    valid = []
+    for row in rows:
+        try:
+            valid.append(model.model_validate(row))
+        except ValidationError:
+            pass
+    return valid, len(rows) - len(valid)
+
+
+def cart_summary(db: MockDatabase) -> dict:
+    # invalid products drop out of the index, so cart rows referencing them count as unknown products
+    products, _ = _valid_rows(db.rows("products"), ProductResponseDTO)
+    cart, skipped = _valid_rows(db.rows("cart"), CartResponseDTO)
+    summary = summarize_cart(products, cart)
+    summary.skipped_rows = skipped
+    return summary.model_dump()
+
+
+# read-only routes that json-server does not have, keyed by (collection, path segment)
+VIEWS = {
+    ("cart", "summary"): cart_summary,
+}
+# POST /<collection>/bulk takes a JSON array and inserts every valid item in one write
+BULK_SEGMENT = "bulk"
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server_version = "MockApi"
+
+    @property
+    def db(self) -> MockDatabase:
+        return self.server.db
+
+    def log_message(self, format, *args):
+        pass
+
+    def handle_one_request(self):
+        try:
+            super().handle_one_request()
+        except OSError:
+            # the client went away; nothing left to answer
+            raise
+        except Exception as error:
+            # a bug in a route still gets an answer instead of a dropped connection; the request
+            # body may be unread, so the connection is not reused
+            self.close_connection = True
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(error).__name__}: {error}"})
+
+    def do_GET(self):
+        collection, item_id = self._route()
+        if collection is None:
+            return
+        if item_id is None:
+            params = parse_qs(urlsplit(self.path).query)
+            if not params:
+                self._send_encoded(HTTPStatus.OK, self.db.encoded_collection(collection))
+                return
+            try:
+                rows, total = self.db.query(collection, params)
+            except ValueError:
+                self._send_json(HTTPStatus.BAD_REQUEST, {})
+                return
+            self._send_encoded(HTTPStatus.OK, json.dumps(rows).encode(), {"X-Total-Count": str(total)})
+            return
+        view = VIEWS.get((collection, item_id))
+        if view:
+            self._send_json(HTTPStatus.OK, view(self.db))
+            return
+        item = self.db.find(collection, item_id)
+        self._send_json(HTTPStatus.OK if item else HTTPStatus.NOT_FOUND, item or {})
+
+    def do_POST(self):
+        collection, item_id = self._route()
+        if collection is None:
+            return
+        body = self._read_json()
+        if item_id == BULK_SEGMENT and isinstance(body, list):
+            self._send_json(HTTPStatus.OK, self._write(lambda: self._insert_bulk(collection, body)))
+            return
+        if item_id is not None or not isinstance(body, dict):
+            self._send_json(HTTPStatus.BAD_REQUEST, {})
+            return
+        self._send_json(HTTPStatus.CREATED, self._write(lambda: self.db.insert(collection, body)))
+
+    def _insert_bulk(self, collection: str, items: list) -> List[dict]:
+        # per-item results in request order, so one bad item does not fail the whole batch
+        valid = [item for item in items if isinstance(item, dict)]
+        inserted = iter(self.db.insert_many(collection, valid))
+        return [
+            {"status": HTTPStatus.CREATED.value, "item": next(inserted)} if isinstance(item, dict)
+            else {"status": HTTPStatus.BAD_REQUEST.value, "error": "item must be a JSON object"}
+            for item in items
+        ]
+
+    def do_PUT(self):
+        self._update(merge=False)
+
+    def do_PATCH(self):
+        self._update(merge=True)
+
+    def do_DELETE(self):
+        collection, item_id = self._route()
+        if collection is None:
+            return
+        item = self._write(lambda: self.db.delete(collection, item_id)) if item_id else None
+        self._send_json(HTTPStatus.OK if item else HTTPStatus.NOT_FOUND, item or {})
+
+    def _update(self, merge: bool):
+        collection, item_id = self._route()
+        if collection is None:
+            return
+        body = self._read_json()
+        if item_id is None or not isinstance(body, dict):
+            self._send_json(HTTPStatus.BAD_REQUEST, {})
+            return
+        item = self._write(lambda: self.db.replace(collection, item_id, body, merge=merge))
+        self._send_json(HTTPStatus.OK if item else HTTPStatus.NOT_FOUND, item or {})
+
+    def _write(self, operation):
+        result = operation()
+        if result is not None and self.server.flush_on_write:
+            self.db.flush()
+        return result
+
+    def _route(self):
+        parts = [part for part in urlsplit(self.path).path.split("/") if part]
+        if not parts or len(parts) > 2 or not self.db.has_collection(parts[0]):
+            self._send_json(HTTPStatus.NOT_FOUND, {})
+            return None, None
+        return parts[0], parts[1] if len(parts) == 2 else None
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"null")
+        except ValueError:
+            return None
+
+    def _send_json(self, status: HTTPStatus, payload):
+        self._send_encoded(status, json.dumps(payload).encode())
+
+    def _send_encoded(self, status: HTTPStatus, body: bytes, headers: Optional[Dict[str, str]] = None):
+        # headers and body go out in one write to avoid an extra packet per response
+        extra = "".join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"{extra}"
+            "\r\n"
+        ).encode()
+        self.wfile.write(head + body)
+
+
+class MockApiServer:
+    """Serves the json-server routes of a db.json from a background thread in this process."""
+
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH, host: str = "127.0.0.1", port: int = 0,
+                 flush_on_write: bool = False):
+        self.db = MockDatabase.from_file(db_path)
+        self._httpd = ThreadingHTTPServer((host, port), MockApiHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.db = self.db
+        self._httpd.flush_on_write = flush_on_write
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve be/mock-api/db.json without json-server")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--watch", action="store_true", help="write changes back to the db file")
+    args = parser.parse_args()
+
+    server = MockApiServer(Path(args.db), args.host, args.port, flush_on_write=args.watch)
+    print(f"Mock API running at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -8,5 +8,9 @@ class AddToCartRequestDTO(BaseModel):
     quantity: int
 
 
+class AddToCartBatchRequestDTO(BaseModel):
+    items: List[AddToCartRequestDTO]
+
+
 
 
@@ -0,0 +1,125 @@
+import codecs
+import json
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+from be.infrastructure.responsesDTO.responses import ProductResponseDTO, CartResponseDTO
+
+Model = TypeVar("Model", bound=BaseModel)
+
+_WHITESPACE = " \t\r\n"
+# characters that can extend a number that has been decoded up to the end of a chunk
+_NUMBER_CONTINUATION = frozenset("0123456789.eE+-")
+
+
+# Adapters are built once per model; validate_json parses and validates the raw bytes in a single
+# pass inside pydantic-core instead of json.loads followed by per-item model construction
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[Model]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+PRODUCT_LIST_ADAPTER = list_adapter(ProductResponseDTO)
+CART_LIST_ADAPTER = list_adapter(CartResponseDTO)
+
+
+def decode_list(raw: bytes, model: Type[Model]) -> List[Model]:
+    return list_adapter(model).validate_json(raw)
+
+
+def decode_products(raw: bytes) -> List[ProductResponseDTO]:
+    return PRODUCT_LIST_ADAPTER.validate_json(raw)
+
+
+def decode_cart_list(raw: bytes) -> List[CartResponseDTO]:
+    return CART_LIST_ADAPTER.validate_json(raw)
+
+
+def decode_cart_item(raw: bytes) -> CartResponseDTO:
+    return CartResponseDTO.model_validate_json(raw)
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator:
+    """Yield the elements of a top-level JSON array while its bytes are still arriving.
+
+    An element is only yielded once the "," or "]" after it has arrived, since a number at the end
+    of a chunk (e.g. `12.` or `3e`) may continue in the next one.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    started = False
+    finished = False
+    # True right after "[" or ",", i.e. while the next token has to be an element
+    expect_element = True
+    empty = True
+
+    def skip(text: str, index: int) -> int:
+        while index < len(text) and text[index] in _WHITESPACE:
+            index += 1
+        return index
+
+    for chunk in chunks:
+        buffer += utf8.decode(chunk)
+        index = skip(buffer, 0)
+        if finished:
+            if index < len(buffer):
+                raise ValueError("Unexpected data after JSON array")
+            buffer = ""
+            continue
+        if not started:
+            if index == len(buffer):
+                continue
+            if buffer[index] != "[":
+                raise ValueError("Expected a JSON array")
+            started = True
+            index = skip(buffer, index + 1)
+        while index < len(buffer):
+            if not expect_element:
+                # the only tokens between elements are "," and "]"
+                if buffer[index] == "]":
+                    finished = True
+                    index = skip(buffer, index + 1)
+                    break
+                if buffer[index] != ",":
+                    raise ValueError(f"Expected ',' or ']' at offset {index} of the pending JSON array data")
+                expect_element = True
+                index = skip(buffer, index + 1)
+                continue
+            if buffer[index] == "]" and empty:
+                finished = True
+                index = skip(buffer, index + 1)
+                break
+            try:
+                item, end = decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                # the element has not fully arrived yet
+                break
+            following = skip(buffer, end)
+            if following == len(buffer) or (following == end and _NUMBER_CONTINUATION.issuperset(buffer[end:])):
+                break
+            if buffer[following] not in ",]":
+                raise ValueError(f"Expected ',' or ']' at offset {following} of the pending JSON array data")
+            yield item
+            empty = False
+            expect_element = False
+            index = following
+        if finished and index < len(buffer):
+            raise ValueError("Unexpected data after JSON array")
+        buffer = buffer[index:]
+
+    buffer += utf8.decode(b"", final=True)
+    if not finished:
+        if started and buffer.strip():
+            # surfaces the decoder's error for a malformed last element
+            decoder.raw_decode(buffer.strip())
+        raise ValueError("Truncated JSON array")
+    if buffer.strip():
+        raise ValueError("Unexpected data after JSON array")
+
+
+def iter_models(chunks: Iterable[bytes], model: Type[Model]) -> Iterator[Model]:
+    for item in iter_json_array(chunks):
+        yield model.model_validate(item)
@@ -9,11 +9,55 @@ class ProductResponseDTO(BaseModel):
     price: int
 
 
+# Partial-field variants for projected (_fields) or large scans; unknown fields are ignored
+class ProductPriceResponseDTO(BaseModel):
+    id: str
+    price: int
+
+
+class ProductNameResponseDTO(BaseModel):
+    id: str
+    name: str
+
+
 class CartResponseDTO(BaseModel):
     id: str
     product_id: int
     quantity: int
 
 
+class CartProductSummaryDTO(BaseModel):
+    product_id: int
+    name: Optional[str] = None
+    unit_price: Optional[int] = None
+    quantity: int
+    rows: int
+    total_price: Optional[int] = None
+
+
+class CartSummaryResponseDTO(BaseModel):
+    items: List[CartProductSummaryDTO]
+    total_quantity: int
+    total_price: int
+    unknown_product_ids: List[int]
+    # cart rows that are not valid CartResponseDTOs and were left out of the totals
+    skipped_rows: int = 0
+
+
+# One entry per submitted item, in submission order; item is None when that add failed
+class AddToCartResultDTO(BaseModel):
+    status: int
+    item: Optional[CartResponseDTO] = None
+    error: Optional[str] = None
+
+
+class AddToCartBatchResponseDTO(BaseModel):
+    results: List[AddToCartResultDTO]
 
+    @property
+    def created(self) -> List[CartResponseDTO]:
+        return [result.item for result in self.results if result.item is not None]
 
+    @property
+    def failed(self) -> List[AddToCartResultDTO]:
+        return [result for result in self.results if result.item is None]
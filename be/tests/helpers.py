@@ -1,11 +1,21 @@
 from be.infrastructure.responsesDTO.responses import ProductResponseDTO, CartResponseDTO
+from be.infrastructure.responsesDTO import decoders
+
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 def get_products_from_response(resp):
-    return [ProductResponseDTO(**p) for p in resp.json()]
+    return decoders.decode_products(resp.content)
 
 def get_cart_from_response_list(resp):
-    return [CartResponseDTO(**c) for c in resp.json()]
+    return decoders.decode_cart_list(resp.content)
 
 def get_cart_from_response(resp):
-    return CartResponseDTO(**resp.json())
\ No newline at end of file
+    return decoders.decode_cart_item(resp.content)
+
+# Lazy variants - pair with stream=True requests to validate items while the body is still downloading
+def iter_products_from_response(resp):
+    return decoders.iter_models(resp.iter_content(STREAM_CHUNK_SIZE), ProductResponseDTO)
+
+def iter_cart_from_response(resp):
+    return decoders.iter_models(resp.iter_content(STREAM_CHUNK_SIZE), CartResponseDTO)
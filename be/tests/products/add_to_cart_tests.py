@@ -1,15 +1,15 @@
-import requests as request
 from http import HTTPStatus
+import pytest
 from be.infrastructure.responsesDTO.responses import CartResponseDTO
-from be.infrastructure.requestsDTO.requests import AddToCartRequestDTO
+from be.infrastructure.requestsDTO.requests import AddToCartRequestDTO, AddToCartBatchRequestDTO
 from be.tests import helpers as helper
 
 class TestAddCart:
 
-    def test_add_to_cart(self, cart_base_url):
+    def test_add_to_cart(self, cart_client):
         add_to_cart_request = AddToCartRequestDTO(product_id=2, quantity=1)
 
-        resp = request.post(cart_base_url, json=add_to_cart_request.model_dump())
+        resp = cart_client.add_to_cart_response(add_to_cart_request)
 
         assert resp.status_code == HTTPStatus.CREATED
         
@@ -17,13 +17,26 @@ class TestAddCart:
         assert cart_response.product_id == add_to_cart_request.product_id
         assert cart_response.quantity == add_to_cart_request.quantity
 
-    def test_add_different_product_to_cart(self, cart_base_url):
+    def test_add_different_product_to_cart(self, cart_client):
         add_to_cart_request = AddToCartRequestDTO(product_id=1, quantity=3)
 
-        resp = request.post(cart_base_url, json=add_to_cart_request.model_dump())
+        resp = cart_client.add_to_cart_response(add_to_cart_request)
 
         assert resp.status_code == HTTPStatus.CREATED
         
         cart_response = helper.get_cart_from_response(resp)
         assert cart_response.product_id == add_to_cart_request.product_id
         assert cart_response.quantity == add_to_cart_request.quantity
+
+    @pytest.mark.parametrize("bulk", [True, False], ids=["bulk", "concurrent"])
+    def test_add_to_cart_batch(self, cart_client, bulk):
+        items = [AddToCartRequestDTO(product_id=i % 3 + 1, quantity=i % 4 + 1) for i in range(50)]
+
+        batch_response = cart_client.add_to_cart_batch(AddToCartBatchRequestDTO(items=items), bulk=bulk, chunk_size=20)
+
+        assert not batch_response.failed
+        assert [result.status for result in batch_response.results] == [HTTPStatus.CREATED] * len(items)
+        created = batch_response.created
+        assert [(item.product_id, item.quantity) for item in created] == [(i.product_id, i.quantity) for i in items]
+        cart_ids = {item.id for item in cart_client.get_cart()}
+        assert {item.id for item in created} <= cart_ids
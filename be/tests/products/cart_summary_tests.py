@@ -0,0 +1,67 @@
+from http import HTTPStatus
+import pytest
+from be.infrastructure.mockServer import mock_server
+from be.infrastructure.requestsDTO.requests import AddToCartRequestDTO
+
+
+@pytest.fixture
+def summary_endpoint(cart_client):
+    resp = cart_client.get_summary_response()
+    if resp.status_code == HTTPStatus.NOT_FOUND:
+        pytest.skip("Mock API has no /cart/summary endpoint")
+    return resp
+
+
+@pytest.mark.cart
+class TestCartSummary:
+
+    def test_cart_summary_matches_client_side_aggregation(self, summary_endpoint, products_client, cart_client):
+        server_summary = cart_client.get_summary()
+        client_summary = cart_client.summarize(products_client.get_products())
+
+        assert server_summary == client_summary, "Server and client cart summaries differ"
+
+    def test_cart_summary_totals_are_consistent(self, summary_endpoint, cart_client):
+        summary = cart_client.get_summary()
+
+        assert summary.total_quantity == sum(item.quantity for item in summary.items)
+        assert summary.total_price == sum(item.total_price or 0 for item in summary.items)
+        for item in summary.items:
+            if item.unit_price is not None:
+                assert item.total_price == item.unit_price * item.quantity, f"Wrong total for product {item.product_id}"
+
+    def test_cart_summary_tracks_added_items(self, summary_endpoint, cart_client):
+        before = {item.product_id: item.quantity for item in cart_client.get_summary().items}
+
+        cart_client.add_to_cart(AddToCartRequestDTO(product_id=2, quantity=3))
+
+        after = {item.product_id: item.quantity for item in cart_client.get_summary().items}
+        assert after[2] == before.get(2, 0) + 3, "Summary quantity did not include the new cart row"
+
+    def test_cart_summary_skips_rows_that_are_not_cart_items(self, summary_endpoint, cart_client):
+        before = cart_client.get_summary()
+        # the mock accepts any JSON object on POST, e.g. an int id
+        cart_client.post("/cart", json={"id": 987654, "product_id": 1, "quantity": 1})
+
+        resp = cart_client.get_summary_response()
+
+        assert resp.status_code == HTTPStatus.OK
+        summary = cart_client.get_summary()
+        assert summary.skipped_rows == before.skipped_rows + 1
+        assert summary.total_quantity == before.total_quantity, "Skipped row was counted"
+
+
+def test_unexpected_server_error_is_answered_with_json(mock_api_server, cart_client, monkeypatch):
+    if mock_api_server is None:
+        pytest.skip("Needs the in-process mock API")
+
+    def broken_view(db):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(mock_server.VIEWS, ("cart", "broken"), broken_view)
+
+    resp = cart_client.get("/cart/broken")
+
+    assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert resp.json() == {"error": "RuntimeError: boom"}
+    assert cart_client.get_cart_response().status_code == HTTPStatus.OK, "Server stopped answering after the error"
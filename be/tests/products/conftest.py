@@ -1,5 +1,75 @@
+import asyncio
+import os
+
 import pytest
+import requests
+from be.infrastructure.clients.clients import create_session, ProductsClient, CartClient
 from be.infrastructure.endpoints.endpoints import get_url
+from be.infrastructure.load.load_runner import format_report, run_load
+from be.infrastructure.mockServer.mock_server import DEFAULT_DB_PATH, MockApiServer
+from plugins.sharding import worker_id
+import sys
+sys.path.append('..')
+from configuration import DEFAULT_TIMEOUT
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get("LOAD_TESTS") == "1":
+        return
+    skip_load = pytest.mark.skip(reason="load tests run only when LOAD_TESTS=1")
+    for item in items:
+        if item.get_closest_marker("load"):
+            item.add_marker(skip_load)
+
+
+# Starts the mock API in-process on an ephemeral port and points get_url at it.
+# Under pytest-xdist every worker is its own session, so each gets a private server and data set.
+# Set MOCK_API=external to run against an already running json-server on BASE_URL instead,
+# or MOCK_API_DB to serve a different dataset (e.g. one from the data generator).
+@pytest.fixture(scope='session', autouse=True)
+def mock_api_server():
+    if os.environ.get("MOCK_API") == "external":
+        yield None
+        return
+
+    previous_base_url = os.environ.get("BASE_URL")
+    server = MockApiServer(os.environ.get("MOCK_API_DB", DEFAULT_DB_PATH)).start()
+    os.environ["BASE_URL"] = server.url
+    yield server
+    server.stop()
+    if previous_base_url is None:
+        os.environ.pop("BASE_URL", None)
+    else:
+        os.environ["BASE_URL"] = previous_base_url
+
+
+# Every test sees the session's starting data and its writes are rolled back afterwards,
+# so response sizes stay constant and tests can run in any order.
+# Snapshots are copy-on-write, so tests that only read pay nothing.
+@pytest.fixture(autouse=True)
+def mock_db_state(mock_api_server):
+    if mock_api_server is None:
+        yield from _external_cart_cleanup()
+        return
+
+    snapshot = mock_api_server.db.snapshot()
+    yield mock_api_server.db
+    mock_api_server.db.restore(snapshot)
+
+
+# json-server cannot restore state, so rows created by the test are deleted instead.
+# Parallel workers share an external server and cannot tell each other's rows apart,
+# so cleanup only happens in serial runs - use the per-worker in-process server with -n.
+def _external_cart_cleanup():
+    if worker_id() != "master":
+        yield None
+        return
+    cart_url = get_url("/cart")
+    existing_ids = {row["id"] for row in requests.get(cart_url, timeout=DEFAULT_TIMEOUT).json()}
+    yield None
+    for row in requests.get(cart_url, timeout=DEFAULT_TIMEOUT).json():
+        if row["id"] not in existing_ids:
+            requests.delete(f"{cart_url}/{row['id']}", timeout=DEFAULT_TIMEOUT)
 
 
 @pytest.fixture(scope='module')
@@ -11,3 +81,45 @@ def products_base_url():
 def cart_base_url():
     return get_url("/cart")
 
+
+# One pooled keep-alive session shared by every client for the whole run
+@pytest.fixture(scope='session')
+def api_session():
+    session = create_session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope='session')
+def products_client(api_session):
+    return ProductsClient(api_session)
+
+
+@pytest.fixture(scope='session')
+def cart_client(api_session):
+    return CartClient(api_session)
+
+
+# Runs the asyncio load generator against BASE_URL with the settings from @pytest.mark.load(...).
+# Each run's result is recorded as the "load" property and printed in the terminal summary.
+@pytest.fixture
+def load_runner(request, record_property):
+    marker = request.node.get_closest_marker("load")
+    settings = dict(marker.kwargs) if marker else {}
+
+    def run(**overrides):
+        result = asyncio.run(run_load(get_url(), **{**settings, **overrides}))
+        record_property("load", result.to_dict())
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    reports = [report for outcome in ("passed", "failed") for report in terminalreporter.stats.get(outcome, ())
+               if report.when == "call"]
+    for report in reports:
+        for key, value in report.user_properties:
+            if key == "load":
+                terminalreporter.write_sep("-", f"load: {report.nodeid}")
+                terminalreporter.write_line(format_report(value))
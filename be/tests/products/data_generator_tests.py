@@ -0,0 +1,92 @@
+import json
+from collections import Counter
+
+import pytest
+from be.infrastructure.dataGenerator.data_generator import (CATEGORIES, STATIC_STORE_FILES, generate_cart,
+                                                            generate_products, write_db, write_static_store)
+from be.infrastructure.mockServer.mock_server import MockDatabase
+
+
+class TestGenerators:
+
+    def test_same_seed_gives_the_same_data(self):
+        assert list(generate_products(50, seed=3)) == list(generate_products(50, seed=3))
+        assert list(generate_cart(50, 20, seed=3)) == list(generate_cart(50, 20, seed=3))
+
+    def test_other_seed_gives_other_data(self):
+        assert list(generate_products(50, seed=3)) != list(generate_products(50, seed=4))
+        assert list(generate_cart(50, 20, seed=3)) != list(generate_cart(50, 20, seed=4))
+
+    def test_product_names_pair_a_brand_with_one_of_its_lines(self):
+        for product in generate_products(500):
+            brand, line = product["name"].split()[:2]
+            brands, _, _ = CATEGORIES[product["category"]]
+            assert line in brands[brand], product["name"]
+
+    def test_product_ids_and_names_are_unique(self):
+        products = list(generate_products(500))
+
+        assert len({product["id"] for product in products}) == 500
+        assert len({product["name"] for product in products}) == 500
+
+    @pytest.mark.parametrize("product_count", [1, 2, 5])
+    def test_cart_ranks_cover_every_product(self, product_count):
+        ranks = Counter(row["product_id"] for row in generate_cart(2000, product_count))
+
+        assert set(ranks) == set(range(1, product_count + 1))
+
+    def test_cart_popularity_falls_with_rank(self):
+        ranks = Counter(row["product_id"] for row in generate_cart(20_000, 10))
+
+        assert ranks[1] > ranks[2] > ranks[5] > ranks[10]
+
+    def test_cart_row_ids_are_unique(self):
+        ids = [row["id"] for row in generate_cart(5000, 10)]
+
+        assert len(set(ids)) == len(ids)
+
+    def test_cart_rows_need_a_product(self):
+        with pytest.raises(ValueError, match="at least one product"):
+            generate_cart(3, 0)
+
+        assert list(generate_cart(0, 0)) == []
+
+
+class TestWriters:
+
+    def test_db_has_the_mock_api_shape_and_valid_references(self, tmp_path):
+        path = tmp_path / "db.json"
+
+        write_db(path, product_count=30, cart_count=100, seed=1)
+
+        db = json.loads(path.read_text())
+        assert set(db) == {"products", "cart"}
+        assert len(db["products"]) == 30 and len(db["cart"]) == 100
+        assert all(set(product) == {"id", "name", "price"} for product in db["products"])
+        assert all(set(row) == {"id", "product_id", "quantity"} for row in db["cart"])
+        product_ids = {product["id"] for product in db["products"]}
+        assert {str(row["product_id"]) for row in db["cart"]} <= product_ids
+        assert MockDatabase.from_file(path).collections["products"] == db["products"]
+
+    def test_db_is_deterministic(self, tmp_path):
+        write_db(tmp_path / "a.json", 20, 20, seed=5)
+        write_db(tmp_path / "b.json", 20, 20, seed=5)
+
+        assert (tmp_path / "a.json").read_bytes() == (tmp_path / "b.json").read_bytes()
+
+    def test_db_without_products_is_refused_before_writing(self, tmp_path):
+        with pytest.raises(ValueError):
+            write_db(tmp_path / "db.json", product_count=0, cart_count=5)
+
+        assert not (tmp_path / "db.json").exists()
+
+    def test_static_store_has_the_store_files_and_valid_references(self, tmp_path):
+        write_static_store(tmp_path, product_count=12, cart_count=6, seed=2)
+
+        assert all((tmp_path / name).exists() for name in STATIC_STORE_FILES)
+        entries = json.loads((tmp_path / "entries.json").read_text())["Items"]
+        cart = json.loads((tmp_path / "viewcart.json").read_text())["Items"]
+        assert len(entries) == 12 and len(cart) == 6
+        assert all(set(entry) == {"id", "cat", "title", "price", "desc", "img"} for entry in entries)
+        assert {row["prod_id"] for row in cart} <= {entry["id"] for entry in entries}
+        assert all(entry["cat"] in CATEGORIES for entry in entries)
@@ -0,0 +1,27 @@
+from http import HTTPStatus
+import pytest
+from be.infrastructure.mockServer.mock_server import MockDatabase
+from be.infrastructure.requestsDTO.requests import AddToCartRequestDTO
+
+
+class TestMockDbState:
+
+    def test_cart_writes_are_visible_within_the_test(self, cart_client):
+        before = len(cart_client.get_cart())
+
+        resp = cart_client.add_to_cart_response(AddToCartRequestDTO(product_id=1, quantity=1))
+
+        assert resp.status_code == HTTPStatus.CREATED
+        assert len(cart_client.get_cart()) == before + 1
+
+    # runs after the test above (pytest keeps definition order), so the cart row that test added
+    # must already have been rolled back by the autouse mock_db_state fixture
+    def test_cart_writes_do_not_leak_into_later_tests(self, cart_client, mock_api_server):
+        if mock_api_server is None:
+            pytest.skip("Snapshots need the in-process mock API")
+        session_start = MockDatabase.from_file(mock_api_server.db.path).collections["cart"]
+
+        cart = cart_client.get_cart()
+
+        assert [item.id for item in cart] == [row["id"] for row in session_start], \
+            "Cart differs from the session-start data"
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+from be.infrastructure.responsesDTO.decoders import iter_json_array
+
+
+def split(raw: bytes, size: int):
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+class TestIterJsonArray:
+
+    @pytest.mark.parametrize("raw", [
+        b'[{"p":1},12.5]',
+        b'[3e2]',
+        b'[-1.5E+3, 0, 10, 2.25e-2]',
+        b' [ "a,]", {"n": [1, 2]}, true, null , false ] ',
+        '["café", "€"]'.encode(),
+        b'[]',
+    ])
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 64])
+    def test_chunked_input_matches_json_loads(self, raw, size):
+        assert list(iter_json_array(split(raw, size))) == json.loads(raw)
+
+    def test_number_split_after_decimal_point(self):
+        assert list(iter_json_array([b'[{"p":1},12.', b'5]'])) == [{"p": 1}, 12.5]
+
+    def test_number_split_after_exponent(self):
+        assert list(iter_json_array([b'[3e', b'2]'])) == [300.0]
+
+    def test_elements_are_yielded_before_the_array_ends(self):
+        items = iter_json_array(iter([b'[1, 2, ', b'3']))
+        assert next(items) == 1
+        assert next(items) == 2
+
+    @pytest.mark.parametrize("raw", [b'[1, 2]x', b'[1] [2]', b'[]]'])
+    @pytest.mark.parametrize("size", [1, 64])
+    def test_rejects_data_after_the_closing_bracket(self, raw, size):
+        with pytest.raises(ValueError):
+            list(iter_json_array(split(raw, size)))
+
+    @pytest.mark.parametrize("raw", [b'[1, 2', b'[12.', b'[', b'', b'[1 2]', b'[1,]', b'{"a": 1}'])
+    @pytest.mark.parametrize("size", [1, 64])
+    def test_rejects_truncated_or_malformed_arrays(self, raw, size):
+        with pytest.raises(ValueError):
+            list(iter_json_array(split(raw, size)))
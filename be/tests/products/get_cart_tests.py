@@ -1,12 +1,13 @@
-import requests as request
 from http import HTTPStatus
 import pytest
+from be.infrastructure.endpoints.endpoints import QueryBuilder
+from be.infrastructure.mockServer.mock_server import filter_and_sort
 from be.tests import helpers as helper
 
 @pytest.mark.cart
 class TestGetCart:
-    def test_get_cart(self, cart_base_url):
-        resp = request.get(cart_base_url)
+    def test_get_cart(self, cart_client):
+        resp = cart_client.get_cart_response()
 
         assert resp.status_code == HTTPStatus.OK
         cart = helper.get_cart_from_response_list(resp)
@@ -14,8 +15,8 @@ class TestGetCart:
         assert len(cart) > 0
 
 
-    def test_get_cart_has_valid_structure(self, cart_base_url):
-        resp = request.get(cart_base_url)
+    def test_get_cart_has_valid_structure(self, cart_client):
+        resp = cart_client.get_cart_response()
 
         assert resp.status_code == HTTPStatus.OK
 
@@ -26,3 +27,25 @@ class TestGetCart:
             assert cart_item_data.product_id is not None, "Cart item missing 'product_id' field"
             assert cart_item_data.quantity is not None, "Cart item missing 'quantity' field"
 
+
+    def test_get_cart_sorts_mixed_id_types(self, cart_client):
+        # the mock accepts any JSON object on POST, so one field can hold ints and strings
+        cart_client.post("/cart", json={"id": 987654, "product_id": 1, "quantity": 1})
+
+        resp = cart_client.get(cart_client.path, QueryBuilder().sort("id"))
+
+        assert resp.status_code == HTTPStatus.OK
+        ids = [row["id"] for row in resp.json()]
+        assert 987654 in ids and len(ids) == len(cart_client.get_cart_response().json())
+
+
+@pytest.mark.parametrize("order, expected", [
+    ("asc", [1, 2.5, 10, "10", "a", {"k": 1}, None]),
+    ("desc", [None, {"k": 1}, "a", "10", 10, 2.5, 1]),
+])
+def test_filter_and_sort_orders_mixed_types(order, expected):
+    rows = [{"v": value} for value in ("a", None, 10, {"k": 1}, "10", 2.5, 1)]
+
+    ordered = filter_and_sort(rows, {"_sort": ["v"], "_order": [order]})
+
+    assert [row["v"] for row in ordered] == expected
@@ -1,13 +1,14 @@
-import requests as request
 from http import HTTPStatus as status
 import pytest
+from be.infrastructure.endpoints.endpoints import QueryBuilder
+from be.infrastructure.responsesDTO.responses import ProductPriceResponseDTO
 from be.tests import helpers as helper
 
 
 @pytest.mark.products
 class TestGetProduct:
-    def test_get_products(self, products_base_url):
-        resp = request.get(products_base_url)
+    def test_get_products(self, products_client):
+        resp = products_client.get_products_response()
 
         assert resp.status_code == status.OK
 
@@ -16,8 +17,8 @@ class TestGetProduct:
         assert products[0].name == "Laptop"
 
 
-    def test_get_products_has_valid_structure(self, products_base_url):
-        resp = request.get(products_base_url)
+    def test_get_products_has_valid_structure(self, products_client):
+        resp = products_client.get_products_response()
 
         assert resp.status_code == status.OK
 
@@ -29,8 +30,8 @@ class TestGetProduct:
             assert product.name is not None, f"Product missing 'name' field"
             assert product.price is not None, f"Product missing 'price' field"
 
-    def test_get_products_data_types(self, products_base_url):
-        resp = request.get(products_base_url)
+    def test_get_products_data_types(self, products_client):
+        resp = products_client.get_products_response()
 
         assert resp.status_code == status.OK
 
@@ -42,13 +43,33 @@ class TestGetProduct:
             assert isinstance(product.price, int), f"Expected int price, got {type(product.price)}"
 
 
-    def test_get_products_prices_are_positive(self, products_base_url):
-        resp = request.get(products_base_url)
+    def test_get_products_prices_are_positive(self, products_client):
+        query = QueryBuilder().fields("id", "price")
+
+        for product in products_client.iter_products_paged(query, model=ProductPriceResponseDTO):
+            assert product.price > 0, f"Price {product.price} should be positive for product {product.id}"
+
+    def test_get_products_streamed_matches_bulk_decode(self, products_client):
+        resp = products_client.get_products_response()
 
         assert resp.status_code == status.OK
 
-        products = helper.get_products_from_response(resp)
+        streamed = list(helper.iter_products_from_response(resp))
+        assert streamed == helper.get_products_from_response(resp), "Streamed products differ from bulk decode"
 
-        for product in products:
-            assert product.price > 0, f"Price {product.price} should be positive for product {product.name}"
+    def test_get_products_paged_matches_full_list(self, products_client):
+        products = products_client.get_products()
+        page_size = max(1, len(products) // 3)  # always several pages, whatever the dataset size
+
+        paged = list(products_client.iter_products_paged(page_size=page_size, prefetch=2))
+
+        assert paged == products, "Paged products differ from the full list"
+
+    def test_get_products_filtered_by_price(self, products_client):
+        query = QueryBuilder().where("price", 1000, op="gte").sort("price")
+
+        products = list(products_client.iter_products_paged(query))
 
+        assert products, "No products matched the price filter"
+        assert all(product.price >= 1000 for product in products), "Filter returned cheaper products"
+        assert [p.price for p in products] == sorted(p.price for p in products), "Products are not sorted by price"
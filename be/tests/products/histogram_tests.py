@@ -0,0 +1,84 @@
+import random
+
+import pytest
+from be.infrastructure.load.histogram import LatencyHistogram
+
+
+def filled(values, significant_bits: int = 7) -> LatencyHistogram:
+    histogram = LatencyHistogram(significant_bits)
+    for value in values:
+        histogram.record(value)
+    return histogram
+
+
+class TestLatencyHistogram:
+
+    def test_record_keeps_count_sum_min_and_max(self):
+        histogram = filled([30, 10, 20])
+        histogram.record(5, count=2)
+
+        assert histogram.total == 5
+        assert histogram.sum == 70
+        assert (histogram.min, histogram.max) == (5, 30)
+        assert histogram.mean() == 14
+
+    def test_negative_values_are_recorded_as_zero(self):
+        histogram = filled([-3])
+
+        assert (histogram.min, histogram.max, histogram.percentile(50)) == (0, 0, 0)
+
+    def test_small_values_are_exact(self):
+        histogram = filled(range(1, 101))
+
+        assert histogram.percentile(50) == 50
+        assert histogram.percentile(99) == 99
+        assert histogram.percentile(100) == 100
+
+    @pytest.mark.parametrize("significant_bits", [5, 7, 10])
+    def test_percentiles_stay_within_the_relative_error(self, significant_bits):
+        rng = random.Random(7)
+        values = sorted(int(rng.lognormvariate(9, 1.5)) for _ in range(5000))
+        histogram = filled(values, significant_bits)
+
+        for percentile in (50, 90, 95, 99, 99.9):
+            exact = values[max(1, round(len(values) * percentile / 100)) - 1]
+            assert histogram.percentile(percentile) >= exact
+            assert histogram.percentile(percentile) <= exact * (1 + 1 / 2 ** (significant_bits - 1))
+
+    def test_percentile_never_exceeds_the_recorded_max(self):
+        histogram = filled([1000, 1001])
+
+        assert histogram.percentile(100) == 1001
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        assert histogram.percentile(99) == 0
+        assert histogram.mean() == 0.0
+        assert histogram.max is None
+
+    def test_merge_matches_recording_everything_in_one(self):
+        rng = random.Random(3)
+        first = [rng.randrange(1, 1_000_000) for _ in range(500)]
+        second = [rng.randrange(1, 1_000_000) for _ in range(300)]
+
+        merged = filled(first)
+        merged.merge(filled(second))
+        combined = filled(first + second)
+
+        assert merged.counts == combined.counts
+        assert (merged.total, merged.sum, merged.min, merged.max) == \
+            (combined.total, combined.sum, combined.min, combined.max)
+        assert merged.percentile(95) == combined.percentile(95)
+
+    def test_merging_an_empty_histogram_changes_nothing(self):
+        histogram = filled([10, 20])
+        histogram.merge(LatencyHistogram())
+
+        assert (histogram.total, histogram.min, histogram.max) == (2, 10, 20)
+
+    def test_merging_into_an_empty_histogram_takes_the_other_bounds(self):
+        histogram = LatencyHistogram()
+        histogram.merge(filled([10, 20]))
+
+        assert (histogram.total, histogram.min, histogram.max) == (2, 10, 20)
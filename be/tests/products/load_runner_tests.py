@@ -0,0 +1,96 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+import pytest
+from be.infrastructure.load.load_runner import HttpConnection, Scenario, run_load
+
+SCENARIOS = [Scenario("get_products", "GET", "/products")]
+
+
+async def serve(handler):
+    server = await asyncio.start_server(handler, "127.0.0.1", 0)
+    return server, f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+
+async def never_answer(reader, writer):
+    await reader.read()
+
+
+def answer_with(response: bytes):
+    async def handler(reader, writer):
+        while await reader.readuntil(b"\r\n\r\n"):
+            writer.write(response)
+            await writer.drain()
+
+    return handler
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestLoadRunner:
+
+    def test_requests_slower_than_the_timeout_count_as_errors(self):
+        async def scenario():
+            server, url = await serve(never_answer)
+            async with server:
+                return await run_load(url, concurrency=2, duration=0.5, scenarios=SCENARIOS, timeout=0.1)
+
+        result = run(scenario())
+
+        assert result.total.requests > 0
+        assert result.error_rate == 1
+
+    def test_run_ends_on_time_when_the_server_never_answers(self):
+        async def scenario():
+            server, url = await serve(never_answer)
+            async with server:
+                return await run_load(url, concurrency=3, duration=0.3, scenarios=SCENARIOS)
+
+        start = time.perf_counter()
+        result = run(scenario())
+
+        assert time.perf_counter() - start < 2
+        assert result.interrupted == 3
+        assert result.total.requests == 0
+        assert result.to_dict()["interrupted"] == 3
+
+    def test_answered_requests_are_not_errors(self):
+        async def scenario():
+            server, url = await serve(answer_with(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n[]"))
+            async with server:
+                return await run_load(url, concurrency=2, duration=0.3, scenarios=SCENARIOS)
+
+        result = run(scenario())
+
+        assert result.total.requests > 0
+        assert result.error_rate == 0
+
+    @pytest.mark.parametrize("response", [b"garbage\r\n\r\n", b"HTTP/1.1 OK\r\n\r\n"])
+    def test_malformed_status_line_closes_the_connection(self, response):
+        async def scenario():
+            server, url = await serve(answer_with(response))
+            async with server:
+                connection = HttpConnection.for_url(urlsplit(url))
+                with pytest.raises(ValueError, match="Malformed status line"):
+                    await connection.request("GET", "/products", timeout=1)
+                return connection
+
+        assert run(scenario()).writer is None
+
+    def test_timed_out_request_closes_the_connection(self):
+        async def scenario():
+            server, url = await serve(never_answer)
+            async with server:
+                connection = HttpConnection.for_url(urlsplit(url))
+                with pytest.raises(asyncio.TimeoutError):
+                    await connection.request("GET", "/products", timeout=0.05)
+                return connection
+
+        assert run(scenario()).writer is None
+
+    def test_unsupported_scheme_is_rejected_before_the_run(self):
+        with pytest.raises(ValueError, match="Unsupported URL scheme"):
+            run(run_load("ftp://127.0.0.1/", duration=0.1))
@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.mark.load(concurrency=20, rate=500, duration=5)
+class TestLoad:
+    def test_products_and_cart_under_load(self, load_runner):
+        result = load_runner()
+
+        assert result.total.requests > 0, "Load run sent no requests"
+        assert result.error_rate == 0, f"Error rate {result.error_rate:.2%} under load"
+        assert result.total.latency.percentile(99) < 500_000, "p99 latency above 500ms"
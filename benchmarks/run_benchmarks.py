@@ -0,0 +1,145 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from be.infrastructure.responsesDTO import decoders
+from be.infrastructure.responsesDTO.responses import ProductResponseDTO, CartResponseDTO
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.2  # fail when a metric is more than 20% slower than its baseline
+DEFAULT_SIZES = (1_000, 10_000)
+
+
+def measure(func, repeat: int) -> float:
+    """Median wall-clock seconds of `repeat` calls - the median keeps one noisy run from tripping the gate."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def synthetic_payloads(size: int):
+    products = [{"id": str(i), "name": f"Product {i}", "price": 100 + i % 900} for i in range(size)]
+    cart = [{"id": f"{i:04x}", "product_id": i % 100 + 1, "quantity": i % 5 + 1} for i in range(size)]
+    return json.dumps(products).encode(), json.dumps(cart).encode()
+
+
+def chunked(raw: bytes, size: int = 64 * 1024):
+    return (raw[i:i + size] for i in range(0, len(raw), size))
+
+
+def dto_benchmarks(sizes, repeat: int) -> dict:
+    results = {}
+    for size in sizes:
+        products, cart = synthetic_payloads(size)
+        results[f"dto.decode_products[{size}]"] = measure(lambda: decoders.decode_products(products), repeat)
+        results[f"dto.decode_cart_list[{size}]"] = measure(lambda: decoders.decode_cart_list(cart), repeat)
+        results[f"dto.iter_products[{size}]"] = measure(
+            lambda: sum(1 for _ in decoders.iter_models(chunked(products), ProductResponseDTO)), repeat)
+        results[f"dto.iter_cart[{size}]"] = measure(
+            lambda: sum(1 for _ in decoders.iter_models(chunked(cart), CartResponseDTO)), repeat)
+    return results
+
+
+def ui_benchmarks(repeat: int, static_store=None) -> dict:
+    from playwright.sync_api import sync_playwright
+    from configuration import BROWSER_TYPE
+    from ui.helpers.static_store import STATIC_STORE_DIR, StaticStoreServer
+    from ui.pages.home_page import HomePage
+    from ui.pages.cart_page import CartPage
+
+    results = {}
+    with sync_playwright() as p, StaticStoreServer(static_store or STATIC_STORE_DIR) as store:
+        browser_type = getattr(p, BROWSER_TYPE)
+        results["ui.browser_launch"] = measure(lambda: browser_type.launch(headless=True).close(), min(repeat, 3))
+
+        browser = browser_type.launch(headless=True)
+
+        def new_context_and_page():
+            context = browser.new_context()
+            context.new_page()
+            context.close()
+
+        results["ui.context_creation"] = measure(new_context_and_page, repeat)
+
+        context = browser.new_context()
+        page = context.new_page()
+        home_page = HomePage(page)
+        home_page.base_url = store.url
+        results["ui.home_navigate"] = measure(home_page.navigate, repeat)
+        results["ui.get_all_product_names"] = measure(home_page.get_all_product_names, repeat)
+        results["ui.validate_product_display"] = measure(home_page.validate_product_display, repeat)
+
+        home_page.click_cart()
+        cart_page = CartPage(page)
+        cart_page.wait_for_item_count(len(json.loads((Path(static_store or STATIC_STORE_DIR) / "viewcart.json")
+                                                     .read_text())["Items"]))
+        last_item = cart_page.get_cart_snapshot()[-1]
+        results["ui.validate_cart_item"] = measure(
+            lambda: cart_page.validate_cart_item(last_item.name, last_item.price), repeat)
+        context.close()
+        browser.close()
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for name, value in current.items():
+        reference = baseline.get(name)
+        if reference and value > reference * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+
+def report(current: dict, baseline: dict, regressions: list):
+    print(f"{'metric':<36}{'baseline ms':>14}{'current ms':>14}{'change':>10}")
+    for name, value in sorted(current.items()):
+        reference = baseline.get(name)
+        change = f"{(value / reference - 1):+.1%}" if reference else "new"
+        flag = "  REGRESSION" if name in regressions else ""
+        reference_ms = f"{reference * 1000:.3f}" if reference else "-"
+        print(f"{name:<36}{reference_ms:>14}{value * 1000:>14.3f}{change:>10}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the automation framework and gate on regressions")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown relative to the baseline, 0.2 = 20%%")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="product / cart row counts for the DTO decoding benchmarks")
+    parser.add_argument("--skip-ui", action="store_true", help="only run the DTO benchmarks")
+    parser.add_argument("--static-store", help="run the UI benchmarks against a generated static store")
+    args = parser.parse_args()
+
+    current = dto_benchmarks(args.sizes, args.repeat)
+    if not args.skip_ui:
+        current.update(ui_benchmarks(args.repeat, args.static_store))
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    regressions = compare(current, baseline, args.threshold)
+    report(current, baseline, regressions)
+
+    if args.update_baseline or not baseline:
+        baseline_path.write_text(json.dumps({**baseline, **current}, indent=2, sort_keys=True))
+        print(f"baseline written to {baseline_path}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
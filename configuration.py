@@ -1,5 +1,8 @@
+import os
+
 # BASE_URL
 BASE_URL = "https://www.demoblaze.com"
+API_URL = "https://api.demoblaze.com"  # store API behind BASE_URL, used to seed carts directly
 
 
 # Test Configuration
@@ -14,3 +17,20 @@ BROWSER_TYPE = "chromium"  # chromium, firefox, webkit
 RETRY_ATTEMPTS = 3
 RETRY_DELAY = 1  # seconds
 
+# Per-page performance budgets for UI tests; scale loosens every time budget (e.g. 2 on slow CI machines)
+PERFORMANCE_BUDGETS_ENABLED = os.environ.get("PERFORMANCE_BUDGETS", "1") == "1"
+PERFORMANCE_BUDGET_SCALE = float(os.environ.get("PERFORMANCE_BUDGET_SCALE", "1"))
+
+# Static asset cache for UI tests
+ASSET_CACHE_ENABLED = True
+ASSET_CACHE_DIR = ".asset_cache"
+ASSET_CACHE_REVALIDATE = True  # send If-None-Match once max-age is up; False serves cached assets blindly
+BLOCKED_HOSTS = ()  # e.g. ("www.google-analytics.com", "www.googletagmanager.com")
+
+# HAR record/replay for UI tests: "off", "record" (capture traffic per test module) or "replay" (serve it offline)
+HAR_MODE = os.environ.get("HAR_MODE", "off")
+HAR_DIR = os.environ.get("HAR_DIR", "ui/hars")
+
+# Optional store account for seeded cart contexts; anonymous carts are used when unset
+STORE_USERNAME = os.environ.get("STORE_USERNAME")
+STORE_PASSWORD = os.environ.get("STORE_PASSWORD")
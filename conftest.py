@@ -0,0 +1,9 @@
+# Project-wide pytest plugins shared by the ui and be suites
+pytest_plugins = [
+    "plugins.sharding",
+    "plugins.timing",
+    "plugins.retry",
+    "plugins.impact",
+    # runs pytest inside the plugins' own tests
+    "pytester",
+]
@@ -0,0 +1,261 @@
+import ast
+import hashlib
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+DEFAULT_MAP_PATH = ".test_impact.json"
+MAP_VERSION = 1
+# changes here can affect any test without showing up in a trace, so they force a full run
+GLOBAL_PATTERNS = ("pytest.ini", "conftest.py", "requirements.txt", "plugins/*.py")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact")
+    group.addoption("--impact", action="store_true",
+                    help="run only tests whose traced dependencies changed since the last --impact run "
+                         "(everything when there is no usable map), and refresh the map")
+    group.addoption("--impact-map", default=DEFAULT_MAP_PATH, help="where per-test dependencies are stored")
+
+
+def file_hash(path: Path):
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _module_file(root: Path, module: str):
+    base = root.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def project_imports(path: Path, root: Path) -> set:
+    """Project files imported by `path`. Classes whose work happens in C (pydantic models,
+    dataclasses) never show up in a call trace, so the import edges of traced files count too."""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError):
+        return set()
+    package = path.parent.relative_to(root).parts
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            prefix = list(package[:len(package) - node.level + 1]) if node.level else []
+            base = ".".join(prefix + ([node.module] if node.module else []))
+            modules = [base] + [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for module in modules:
+            module_file = _module_file(root, module) if module else None
+            if module_file:
+                found.add(module_file)
+    return found
+
+
+class DependencyTracer:
+    """Collects the project files whose code runs or which are opened while tracing is on."""
+
+    def __init__(self, root: Path):
+        self.root = str(root) + os.sep
+        self.files = None
+
+    def install(self):
+        sys.setprofile(self._profile)
+        # threads started from now on (mock API handlers, prefetch pools, the async Playwright loop)
+        threading.setprofile(self._profile)
+        sys.addaudithook(self._audit)
+
+    def uninstall(self):
+        sys.setprofile(None)
+        threading.setprofile(None)
+        # audit hooks cannot be removed; it is a no-op while files is None
+        self.files = None
+
+    def swap(self, files):
+        previous, self.files = self.files, files
+        return previous
+
+    def _add(self, filename):
+        if self.files is not None and filename.startswith(self.root):
+            self.files.add(filename)
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            self._add(frame.f_code.co_filename)
+
+    def _audit(self, event, args):
+        if event == "open" and isinstance(args[0], str):
+            self._add(os.path.abspath(args[0]))
+
+
+class ImpactPlugin:
+
+    def __init__(self, config):
+        self.config = config
+        self.root = Path(config.rootpath).resolve()
+        # relative to the rootdir, so runs started from a subdirectory share one map
+        self.map_path = self.root / config.getoption("impact_map")
+        self.map = self._load_map()
+        self.tracer = DependencyTracer(self.root)
+        # (fixture name, defining node id) -> files traced while setting the fixture up
+        self.fixture_files = {}
+        self.deps = {}
+        self.failed = set()
+        self.passed = set()
+        self.changed, self.full_run_reason = self._plan()
+        self.summary = None
+
+    def _load_map(self):
+        try:
+            data = json.loads(self.map_path.read_text())
+        except (OSError, ValueError):
+            return None
+        return data if data.get("version") == MAP_VERSION else None
+
+    def _relative(self, filename: str):
+        path = Path(filename)
+        try:
+            relative = path.relative_to(self.root)
+        except ValueError:
+            return None
+        # caches, recordings in progress, bytecode and this plugin's own outputs are not inputs
+        if any(part.startswith(".") or part == "__pycache__" for part in relative.parts) or not path.is_file():
+            return None
+        return relative.as_posix()
+
+    def _global_files(self) -> set:
+        return {path.relative_to(self.root).as_posix()
+                for pattern in GLOBAL_PATTERNS for path in self.root.glob(pattern)}
+
+    def _changed_files(self) -> set:
+        return {path for path, digest in self.map["files"].items() if file_hash(self.root / path) != digest}
+
+    def _plan(self):
+        """(changed files, reason for a full run or None); computed up front so the xdist
+        controller, which never collects, reaches the same conclusion as its workers."""
+        if self.map is None:
+            return set(), f"no usable impact map at {self.map_path}"
+        changed = self._changed_files()
+        global_files = self._global_files()
+        # an added plugin or ini file is as global as an edited one
+        global_changes = sorted((changed & global_files) | (global_files - set(self.map["files"])))
+        if global_changes:
+            return changed, f"{', '.join(global_changes)} changed"
+        return changed, None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if self.full_run_reason:
+            return
+        tests = self.map["tests"]
+        failed = set(self.map.get("failed", []))
+        selected, deselected = [], []
+        for item in items:
+            # unknown tests have never been traced and last run's failures are always rerun
+            if item.nodeid not in tests or item.nodeid in failed or self.changed.intersection(tests[item.nodeid]):
+                selected.append(item)
+            else:
+                deselected.append(item)
+        items[:] = selected
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        self.summary = f"{len(selected)} of {len(items) + len(deselected)} tests affected"
+
+    def pytest_sessionstart(self, session):
+        self.tracer.install()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef):
+        outer = self.tracer.swap(set())
+        yield
+        files = self.tracer.swap(outer)
+        if files is not None:
+            self.fixture_files.setdefault((fixturedef.argname, fixturedef.baseid), set()).update(files)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self.tracer.swap(set())
+        yield
+        self.tracer.swap(None)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        if call.when != "teardown" or self.tracer.files is None:
+            return
+        files = set(self.tracer.files)
+        for name in item.fixturenames:
+            for fixturedef in item._fixtureinfo.name2fixturedefs.get(name, ()):
+                files |= self.fixture_files.get((fixturedef.argname, fixturedef.baseid), set())
+        relative = {self._relative(filename) for filename in files}
+        # travels with the report, so xdist workers' traces reach the controller
+        outcome.get_result().user_properties.append(("impact", sorted(path for path in relative if path)))
+
+    def pytest_runtest_logreport(self, report):
+        for key, value in report.user_properties:
+            if key == "impact":
+                self.deps[report.nodeid] = value
+        if report.failed:
+            self.failed.add(report.nodeid)
+        elif report.when == "call" and report.passed:
+            self.passed.add(report.nodeid)
+
+    def pytest_sessionfinish(self, session):
+        self.tracer.uninstall()
+        if not self.full_run_reason and session.exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+            # no affected tests is a pass, not a collection problem
+            session.exitstatus = pytest.ExitCode.OK
+        if hasattr(self.config, "workerinput") or not self.deps:
+            return
+        previous = self.map or {"tests": {}, "failed": []}
+        global_files = self._global_files()
+        imports = {}
+        traced = {}
+        for nodeid, paths in self.deps.items():
+            direct = set(paths) - global_files
+            for path in direct:
+                if path not in imports:
+                    imports[path] = self._imported_by(path)
+            traced[nodeid] = sorted(direct.union(*(imports[path] for path in direct)))
+        tests = {**previous["tests"], **traced}
+        failed = (set(previous["failed"]) - self.passed) | self.failed
+
+        files = sorted(set().union(*tests.values()) | global_files)
+        self.map_path.write_text(json.dumps({
+            "version": MAP_VERSION,
+            "files": {path: file_hash(self.root / path) for path in files},
+            "tests": tests,
+            "failed": sorted(failed),
+        }, indent=2, sort_keys=True))
+
+    def _imported_by(self, path: str) -> set:
+        # one hop only: conftest files import every fixture's dependencies, and those that matter
+        # were traced when the fixtures ran
+        if not path.endswith(".py") or Path(path).name == "conftest.py":
+            return set()
+        relative = (self._relative(str(imported)) for imported in project_imports(self.root / path, self.root))
+        return {imported for imported in relative if imported}
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep("-", "impact analysis")
+        if self.full_run_reason:
+            terminalreporter.write_line(f"full run: {self.full_run_reason}")
+            return
+        changed = sorted(self.changed)
+        terminalreporter.write_line(f"{len(changed)} changed file(s): {', '.join(changed[:10]) or 'none'}")
+        if self.summary:
+            terminalreporter.write_line(self.summary)
+
+def pytest_configure(config):
+    if config.getoption("impact"):
+        config.pluginmanager.register(ImpactPlugin(config), "impact-plugin")
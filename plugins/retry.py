@@ -0,0 +1,186 @@
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from _pytest.runner import runtestprotocol
+
+sys.path.append('..')
+from configuration import RETRY_ATTEMPTS, RETRY_DELAY
+
+DEFAULT_HISTORY_PATH = ".test_flakes.json"
+HISTORY_LENGTH = 10
+QUARANTINE_THRESHOLD = 3
+# this many identical runs in a row (clean, failed, or skipped while quarantined) end a quarantine
+RELEASE_AFTER = 3
+MAX_BACKOFF = 30.0
+OUTCOME_SEVERITY = ("skipped", "passed", "flaky", "failed")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("retry")
+    group.addoption("--max-attempts", type=int, default=RETRY_ATTEMPTS,
+                    help="runs per failing test, counting the first one; 1 disables retries")
+    group.addoption("--retry-delay", type=float, default=RETRY_DELAY,
+                    help="base backoff in seconds, doubled per retry with full jitter")
+    group.addoption("--flaky-history", default=DEFAULT_HISTORY_PATH,
+                    help="where per-test outcomes of recent runs are kept")
+    group.addoption("--quarantine", choices=("xfail", "skip", "off"), default="xfail",
+                    help=f"how tests that were flaky in {QUARANTINE_THRESHOLD} of their last {HISTORY_LENGTH} "
+                         "runs are treated: run once as non-strict xfail, skip, or run normally; "
+                         f"{RELEASE_AFTER} clean or failed runs in a row release them")
+
+
+def load_history(path) -> dict:
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def is_chronic(outcomes: list) -> bool:
+    return outcomes[-HISTORY_LENGTH:].count("flaky") >= QUARANTINE_THRESHOLD
+
+
+def is_quarantined(outcomes: list) -> bool:
+    """Chronically flaky, unless the latest runs settled: clean runs mean it was fixed, failed runs mean it
+    is really broken now and has to fail the build, and skipped runs are due for another try."""
+    if not is_chronic(outcomes):
+        return False
+    latest = outcomes[-RELEASE_AFTER:]
+    return not (len(latest) == RELEASE_AFTER and len(set(latest)) == 1 and latest[0] != "flaky")
+
+
+def _wider_scope_failed(item) -> bool:
+    # session/module/class fixtures and collector setups cache their failure, so a retry would
+    # only raise the same exception again
+    for fixturedefs in item._fixtureinfo.name2fixturedefs.values():
+        for fixturedef in fixturedefs:
+            cached = fixturedef.cached_result
+            if fixturedef.scope != "function" and cached is not None and cached[2] is not None:
+                return True
+    return any(exc is not None for node, (_, exc) in item.session._setupstate.stack.items() if node is not item)
+
+
+def backoff(attempt: int, base: float) -> float:
+    # full jitter: tests that failed together (e.g. on a shared outage) do not retry in lockstep
+    return random.uniform(0, min(MAX_BACKOFF, base * 2 ** (attempt - 1)))
+
+
+class RetryPlugin:
+
+    def __init__(self, config):
+        self.config = config
+        self.max_attempts = max(1, config.getoption("max_attempts"))
+        self.delay = config.getoption("retry_delay")
+        # the history belongs to the project, wherever pytest is started from
+        self.history_path = Path(config.rootpath) / config.getoption("flaky_history")
+        self.history = load_history(self.history_path)
+        self.quarantine = config.getoption("quarantine")
+        self.quarantined = set()
+        self.released = set()
+        # tests whose setup failed in a fixture or collector shared with other tests
+        self.not_retryable = set()
+        # nodeid -> outcome of this run: skipped (while quarantined), passed, flaky or failed
+        self.outcomes = {}
+
+    def pytest_collection_modifyitems(self, config, items):
+        if self.quarantine == "off":
+            return
+        for item in items:
+            outcomes = self.history.get(item.nodeid, [])
+            if not is_quarantined(outcomes):
+                if is_chronic(outcomes):
+                    self.released.add(item.nodeid)
+                continue
+            self.quarantined.add(item.nodeid)
+            reason = f"quarantined: flaky in recent runs, see {self.history_path}"
+            if self.quarantine == "skip":
+                item.add_marker(pytest.mark.skip(reason=reason))
+            else:
+                item.add_marker(pytest.mark.xfail(reason=reason, strict=False))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self.max_attempts == 1 or item.nodeid in self.quarantined:
+            return None
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for attempt in range(1, self.max_attempts + 1):
+            # every attempt gets its own function-scoped fixtures; wider scopes stay cached as long
+            # as the next test needs them
+            if attempt > 1:
+                item._initrequest()
+            reports = runtestprotocol(item, nextitem=nextitem, log=False)
+            failed = any(report.failed and not hasattr(report, "wasxfail") for report in reports)
+            final = not failed or attempt == self.max_attempts or item.nodeid in self.not_retryable
+            for report in reports:
+                report.user_properties.append(("attempt", attempt))
+                if not final and report.failed:
+                    report.outcome = "rerun"
+                item.ihook.pytest_runtest_logreport(report=report)
+            if final:
+                break
+            time.sleep(backoff(attempt, self.delay))
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        yield
+        # checked before teardown, while the failed fixture still holds its cached exception
+        if call.when == "setup" and call.excinfo is not None and _wider_scope_failed(item):
+            self.not_retryable.add(item.nodeid)
+
+    def pytest_report_teststatus(self, report):
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+        return None
+
+    def pytest_runtest_logreport(self, report):
+        # reports reach the xdist controller too, so it sees every worker's outcomes
+        if report.outcome == "rerun":
+            return
+        if report.nodeid in self.quarantined and self.quarantine == "skip":
+            self.outcomes[report.nodeid] = "skipped"
+            return
+        if report.nodeid in self.quarantined and hasattr(report, "wasxfail"):
+            # the xfail marker hides the result from the build, not from the history
+            outcome = "failed" if report.skipped else "passed"
+        elif report.failed:
+            outcome = "failed"
+        elif report.skipped:
+            return
+        else:
+            retried = dict(report.user_properties).get("attempt", 1) > 1
+            outcome = "flaky" if retried else "passed"
+        # setup, call and teardown each report; the worst of them is the test's outcome
+        previous = self.outcomes.get(report.nodeid, "passed")
+        self.outcomes[report.nodeid] = max(previous, outcome, key=OUTCOME_SEVERITY.index)
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or not self.outcomes:
+            return
+        history = load_history(self.history_path)
+        for nodeid, outcome in self.outcomes.items():
+            history[nodeid] = (history.get(nodeid, []) + [outcome])[-HISTORY_LENGTH:]
+        self.history_path.write_text(json.dumps(history, indent=2, sort_keys=True))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        flaky = sorted(nodeid for nodeid, outcome in self.outcomes.items() if outcome == "flaky")
+        quarantined = sorted(self.quarantined)
+        released = sorted(self.released)
+        if not flaky and not quarantined and not released:
+            return
+        terminalreporter.write_sep("-", "flaky tests")
+        for nodeid in flaky:
+            terminalreporter.write_line(f"passed on retry: {nodeid}")
+        for nodeid in quarantined:
+            terminalreporter.write_line(f"quarantined ({self.quarantine}): {nodeid}")
+        for nodeid in released:
+            terminalreporter.write_line(f"released from quarantine after {RELEASE_AFTER} settled runs: {nodeid}")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(RetryPlugin(config), "retry-plugin")
@@ -0,0 +1,137 @@
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+DEFAULT_DURATIONS_PATH = ".test_durations.json"
+DEFAULT_TEST_DURATION = 1.0
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("sharding")
+    group.addoption("--shards", type=int, default=None,
+                    help="split the collected tests into this many shards balanced by recorded duration")
+    group.addoption("--shard-id", type=int, default=0, help="0-based shard to run when --shards is set")
+    group.addoption("--durations-path", default=DEFAULT_DURATIONS_PATH,
+                    help="where per-test durations are read from and stored")
+    group.addoption("--store-durations", action="store_true",
+                    help="record this run's per-test durations into --durations-path")
+    group.addoption("--longest-first", action="store_true",
+                    help="run the slowest tests first so parallel workers finish together")
+
+
+def worker_id() -> str:
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def load_durations(path) -> dict:
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def assign_shards(nodeids, durations: dict, shards: int) -> list:
+    """Longest-processing-time-first: each test goes to the currently lightest shard."""
+    known = [durations[nodeid] for nodeid in nodeids if nodeid in durations]
+    default = sum(known) / len(known) if known else DEFAULT_TEST_DURATION
+    weighted = sorted(nodeids, key=lambda nodeid: (-durations.get(nodeid, default), nodeid))
+    totals = [0.0] * shards
+    assignment = [[] for _ in range(shards)]
+    for nodeid in weighted:
+        shard = totals.index(min(totals))
+        assignment[shard].append(nodeid)
+        totals[shard] += durations.get(nodeid, default)
+    return assignment
+
+
+@pytest.fixture(scope="session")
+def test_worker():
+    return worker_id()
+
+
+class ShardingPlugin:
+
+    def __init__(self, config):
+        self.config = config
+        # relative to the rootdir, so shards started from different directories balance on the same data
+        self.durations_path = Path(config.rootpath) / config.getoption("durations_path")
+        self.durations = load_durations(self.durations_path)
+        self.measured = {}
+        # time spent in session-, package-, module- and class-scoped fixtures during the current phase
+        self._shared_time = 0.0
+        self._in_shared_setup = False
+        # during teardown, when the previous fixture finished
+        self._last_finalized = None
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        shards = config.getoption("shards")
+        if shards is not None:
+            shard_id = config.getoption("shard_id")
+            if shards < 1:
+                raise pytest.UsageError("--shards must be at least 1")
+            if not 0 <= shard_id < shards:
+                raise pytest.UsageError(f"--shard-id must be between 0 and {shards - 1}")
+            selected = set(assign_shards([item.nodeid for item in items], self.durations, shards)[shard_id])
+            deselected = [item for item in items if item.nodeid not in selected]
+            items[:] = [item for item in items if item.nodeid in selected]
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+
+        if config.getoption("longest_first"):
+            # every xdist worker collects the same order, so the scheduler hands out slow tests first
+            items.sort(key=lambda item: -self.durations.get(item.nodeid, DEFAULT_TEST_DURATION))
+
+    # Wider-scoped fixtures are set up by the first test that needs them and torn down by the last,
+    # which says nothing about what either test costs; that time is left out of the recorded durations.
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef):
+        # a shared fixture's own shared dependencies are set up inside it, so only the outermost is timed
+        outermost = fixturedef.scope != "function" and not self._in_shared_setup
+        self._in_shared_setup |= outermost
+        start = time.perf_counter()
+        yield
+        if outermost:
+            self._in_shared_setup = False
+            self._shared_time += time.perf_counter() - start
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        self._last_finalized = time.perf_counter()
+        yield
+        self._last_finalized = None
+
+    def pytest_fixture_post_finalizer(self, fixturedef):
+        # fixtures are finalized one after another, so each one took the time since the previous one
+        if self._last_finalized is None:
+            return
+        now = time.perf_counter()
+        if fixturedef.scope != "function":
+            self._shared_time += now - self._last_finalized
+        self._last_finalized = now
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        shared, self._shared_time = self._shared_time, 0.0
+        if shared:
+            # travels with the report, so xdist workers' measurements reach the controller
+            outcome.get_result().user_properties.append(("shared_fixture_time", round(shared, 6)))
+
+    def pytest_runtest_logreport(self, report):
+        shared = sum(value for key, value in report.user_properties if key == "shared_fixture_time")
+        self.measured[report.nodeid] = self.measured.get(report.nodeid, 0.0) + max(0.0, report.duration - shared)
+
+    def pytest_sessionfinish(self, session):
+        # with xdist the controller receives every worker's reports, so only it writes the file
+        if not self.config.getoption("store_durations") or hasattr(self.config, "workerinput"):
+            return
+        durations = {**self.durations, **{nodeid: round(d, 4) for nodeid, d in self.measured.items()}}
+        self.durations_path.write_text(json.dumps(durations, indent=2, sort_keys=True))
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(ShardingPlugin(config), "sharding-plugin")
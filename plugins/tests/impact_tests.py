@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+MAP = ".test_impact.json"
+
+
+@pytest.fixture
+def run(pytester, request, monkeypatch):
+    pytester.makeini("[pytest]")
+    # the plugin installs a profiler and an audit hook, so every run gets an interpreter of its own
+    monkeypatch.setenv("PYTHONPATH", str(request.config.rootpath))
+
+    def run(*args):
+        return pytester.runpytest_subprocess("-p", "plugins.impact", "--impact", *args)
+
+    return run
+
+
+@pytest.fixture
+def suite(pytester):
+    pytester.makepyfile(
+        helper_a="def value():\n    return 1\n",
+        helper_b="def value():\n    return 2\n",
+        test_a="import helper_a\n\ndef test_a():\n    assert helper_a.value() == 1\n",
+        test_b="import helper_b\n\ndef test_b():\n    assert helper_b.value() == 2\n",
+    )
+    return pytester
+
+
+class TestImpactSelection:
+
+    def test_first_run_traces_every_test(self, suite, run):
+        result = run()
+
+        assert result.parseoutcomes() == {"passed": 2}
+        result.stdout.fnmatch_lines(["full run: no usable impact map*"])
+        tests = json.loads((suite.path / MAP).read_text())["tests"]
+        assert "helper_a.py" in tests["test_a.py::test_a"]
+        assert "helper_a.py" not in tests["test_b.py::test_b"]
+
+    def test_only_tests_of_a_changed_dependency_are_reselected(self, suite, run):
+        run()
+        suite.makepyfile(helper_a="def value():\n    # edited\n    return 1\n")
+
+        result = run("-v")
+
+        assert result.parseoutcomes() == {"passed": 1, "deselected": 1}
+        result.stdout.fnmatch_lines(["*test_a.py::test_a PASSED*",
+                                     "1 changed file(s): helper_a.py", "1 of 2 tests affected"])
+        result.stdout.no_fnmatch_line("*test_b.py::test_b*")
+
+    def test_untraced_change_deselects_everything(self, suite, run):
+        run()
+        suite.makepyfile(unused="def value():\n    return 3\n")
+        suite.makefile(".txt", notes="not read by any test")
+
+        result = run()
+
+        assert result.ret == pytest.ExitCode.OK
+        assert result.parseoutcomes() == {"deselected": 2}
+        result.stdout.fnmatch_lines(["0 changed file(s): none", "0 of 2 tests affected"])
+
+    def test_global_file_change_forces_a_full_run(self, suite, run):
+        run()
+        suite.makeconftest("")
+
+        result = run()
+
+        assert result.parseoutcomes() == {"passed": 2}
+        result.stdout.fnmatch_lines(["full run: conftest.py changed"])
+
+    def test_map_is_kept_at_the_rootdir(self, suite, run, monkeypatch):
+        monkeypatch.chdir(suite.mkdir("sub"))
+
+        run(str(suite.path), "--rootdir", str(suite.path))
+
+        assert (suite.path / MAP).exists()
+        assert not (suite.path / "sub" / MAP).exists()
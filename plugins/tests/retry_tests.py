@@ -0,0 +1,113 @@
+import json
+
+import pytest
+from plugins.retry import RELEASE_AFTER, is_quarantined
+
+NODEID = "test_suite.py::test_it"
+CHRONIC = ["flaky", "passed", "flaky", "passed", "flaky"]
+
+
+@pytest.fixture
+def run(pytester):
+    pytester.makeini("[pytest]")
+
+    def run(*args):
+        return pytester.runpytest("-p", "plugins.retry", "--retry-delay", "0", *args)
+
+    return run
+
+
+def history(pytester) -> dict:
+    return json.loads((pytester.path / ".test_flakes.json").read_text())
+
+
+class TestQuarantineRules:
+
+    def test_flaky_three_times_in_ten_runs_is_quarantined(self):
+        assert is_quarantined(CHRONIC)
+        assert not is_quarantined(["flaky", "passed", "flaky", "passed"])
+
+    @pytest.mark.parametrize("settled", ["passed", "failed", "skipped"])
+    def test_settled_runs_release_the_quarantine(self, settled):
+        assert is_quarantined(CHRONIC + [settled] * (RELEASE_AFTER - 1))
+        assert not is_quarantined(CHRONIC + [settled] * RELEASE_AFTER)
+
+    def test_mixed_runs_keep_the_quarantine(self):
+        assert is_quarantined(CHRONIC + ["passed", "failed", "passed"])
+
+
+class TestRetryPlugin:
+
+    def test_failure_is_retried_and_a_late_pass_recorded_as_flaky(self, pytester, run):
+        pytester.makepyfile(test_suite="""
+            import itertools
+            attempts = itertools.count(1)
+
+            def test_it():
+                assert next(attempts) == 2
+        """)
+
+        result = run("--max-attempts", "3")
+
+        assert result.parseoutcomes() == {"passed": 1, "rerun": 1}
+        assert history(pytester) == {NODEID: ["flaky"]}
+
+    def test_quarantined_regression_is_recorded_as_failed_and_released(self, pytester, run):
+        pytester.makepyfile(test_suite="def test_it(): assert False")
+        (pytester.path / ".test_flakes.json").write_text(json.dumps({NODEID: CHRONIC}))
+
+        for _ in range(RELEASE_AFTER):
+            run().assert_outcomes(xfailed=1)
+
+        assert history(pytester)[NODEID] == CHRONIC + ["failed"] * RELEASE_AFTER
+        result = run("--max-attempts", "2")
+        assert result.parseoutcomes() == {"failed": 1, "rerun": 1}
+        result.stdout.fnmatch_lines(["*released from quarantine*test_it*"])
+
+    def test_skipped_quarantined_test_is_retried_after_settled_runs(self, pytester, run):
+        pytester.makepyfile(test_suite="def test_it(): pass")
+        (pytester.path / ".test_flakes.json").write_text(json.dumps({NODEID: CHRONIC}))
+
+        for _ in range(RELEASE_AFTER):
+            run("--quarantine", "skip").assert_outcomes(skipped=1)
+
+        run("--quarantine", "skip").assert_outcomes(passed=1)
+
+    def test_history_is_kept_at_the_rootdir(self, pytester, run, monkeypatch):
+        pytester.makepyfile(test_suite="def test_it(): pass")
+        subdir = pytester.mkdir("sub")
+        monkeypatch.chdir(subdir)
+
+        run(str(pytester.path / "test_suite.py"), "--rootdir", str(pytester.path))
+
+        assert (pytester.path / ".test_flakes.json").exists()
+        assert not (subdir / ".test_flakes.json").exists()
+
+    @pytest.mark.parametrize("scope", ["session", "module"])
+    def test_shared_fixture_errors_are_not_retried(self, pytester, run, scope):
+        pytester.makepyfile(test_suite=f"""
+            import pytest
+
+            @pytest.fixture(scope="{scope}")
+            def broken():
+                raise RuntimeError("down")
+
+            def test_it(broken):
+                pass
+        """)
+
+        assert run("--max-attempts", "3").parseoutcomes() == {"errors": 1}
+
+    def test_function_fixture_errors_are_retried(self, pytester, run):
+        pytester.makepyfile(test_suite="""
+            import pytest
+
+            @pytest.fixture
+            def broken():
+                raise RuntimeError("down")
+
+            def test_it(broken):
+                pass
+        """)
+
+        assert run("--max-attempts", "3").parseoutcomes() == {"errors": 1, "rerun": 2}
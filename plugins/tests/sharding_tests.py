@@ -0,0 +1,169 @@
+import json
+
+import pytest
+from plugins.sharding import DEFAULT_TEST_DURATION, assign_shards
+
+
+@pytest.fixture
+def suite(pytester):
+    pytester.makepyfile(test_suite="\n".join(f"def test_{i}(): pass" for i in range(5)))
+    return pytester
+
+
+def shard_totals(assignment, durations, default=DEFAULT_TEST_DURATION):
+    return [sum(durations.get(nodeid, default) for nodeid in shard) for shard in assignment]
+
+
+class TestAssignShards:
+
+    @pytest.mark.parametrize("shards", [1, 2, 3, 7, 40])
+    def test_every_test_lands_in_exactly_one_shard(self, shards):
+        nodeids = [f"t{i}" for i in range(25)]
+        durations = {nodeid: (i * 7) % 11 + 0.5 for i, nodeid in enumerate(nodeids)}
+
+        assignment = assign_shards(nodeids, durations, shards)
+
+        assert len(assignment) == shards
+        flat = [nodeid for shard in assignment for nodeid in shard]
+        assert sorted(flat) == sorted(nodeids)
+
+    def test_shard_totals_are_balanced(self):
+        durations = {f"t{i}": duration for i, duration in enumerate([9, 8, 7, 6, 5, 4, 3, 2, 2, 1, 1, 0.5])}
+
+        totals = shard_totals(assign_shards(list(durations), durations, 3), durations)
+
+        # each test goes to the lightest shard, so no shard can end up a whole test ahead of another
+        assert max(totals) - min(totals) <= max(durations.values())
+        assert max(totals) == pytest.approx(sum(durations.values()) / 3, abs=1)
+
+    def test_longest_tests_are_spread_first(self):
+        durations = {"slow_a": 10, "slow_b": 10, "fast_a": 1, "fast_b": 1}
+
+        assignment = assign_shards(list(durations), durations, 2)
+
+        assert sorted(shard[0] for shard in assignment) == ["slow_a", "slow_b"]
+
+    def test_tests_without_durations_weigh_the_mean_of_the_known_ones(self):
+        durations = {"a": 10, "b": 2}
+
+        assignment = assign_shards(["a", "b", "new_1", "new_2"], durations, 2)
+
+        # a=10 | new_1=6, new_2=6 | b=2 goes to the lighter shard holding a
+        assert assignment == [["a", "b"], ["new_1", "new_2"]]
+
+    def test_without_any_durations_tests_are_split_evenly(self):
+        assignment = assign_shards([f"t{i}" for i in range(6)], {}, 3)
+
+        assert [len(shard) for shard in assignment] == [2, 2, 2]
+
+    def test_assignment_does_not_depend_on_collection_order(self):
+        durations = {"a": 3, "b": 3, "c": 1, "d": 1}
+
+        assert assign_shards(["a", "b", "c", "d"], durations, 2) == assign_shards(["d", "c", "b", "a"], durations, 2)
+
+
+class TestShardOptions:
+
+    def test_shards_together_run_every_test_once(self, suite):
+        passed = 0
+        for shard_id in range(2):
+            result = suite.runpytest("-p", "plugins.sharding", "--shards", "2", "--shard-id", str(shard_id))
+            passed += result.parseoutcomes()["passed"]
+
+        assert passed == 5
+
+    @pytest.mark.parametrize("shard_id", ["2", "-1"])
+    def test_shard_id_out_of_range_is_a_usage_error(self, suite, shard_id):
+        result = suite.runpytest("-p", "plugins.sharding", "--shards", "2", "--shard-id", shard_id)
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(["*--shard-id must be between 0 and 1*"])
+
+    def test_zero_shards_is_a_usage_error(self, suite):
+        result = suite.runpytest("-p", "plugins.sharding", "--shards", "0")
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(["*--shards must be at least 1*"])
+
+
+class TestStoredDurations:
+
+    def stored(self, pytester) -> dict:
+        return json.loads((pytester.path / ".test_durations.json").read_text())
+
+    def test_durations_are_kept_at_the_rootdir(self, suite, monkeypatch):
+        suite.makeini("[pytest]")
+        monkeypatch.chdir(suite.mkdir("sub"))
+
+        suite.runpytest("-p", "plugins.sharding", "--store-durations", str(suite.path), "--rootdir", str(suite.path))
+
+        assert len(self.stored(suite)) == 5
+        assert not (suite.path / "sub" / ".test_durations.json").exists()
+
+    def test_shards_started_from_other_directories_read_the_same_durations(self, suite, monkeypatch):
+        suite.makeini("[pytest]")
+        (suite.path / ".test_durations.json").write_text(json.dumps({f"test_suite.py::test_{i}": 100 if i == 0 else 1 for i in range(5)}))
+
+        def shard(shard_id):
+            result = suite.runpytest("-p", "plugins.sharding", "--shards", "2", "--shard-id", shard_id, "-v",
+                                     str(suite.path), "--rootdir", str(suite.path))
+            # -v prints paths relative to the invocation directory, so compare test names only
+            return {line.split()[0].split("::")[-1] for line in result.outlines if " PASSED" in line}
+
+        from_root = shard("0")
+        monkeypatch.chdir(suite.mkdir("sub"))
+
+        assert from_root == {"test_0"}
+        assert shard("1") == {f"test_{i}" for i in range(1, 5)}
+
+    @pytest.mark.parametrize("scope", ["session", "module", "class"])
+    def test_wider_scoped_fixture_time_is_not_charged_to_a_test(self, pytester, scope):
+        pytester.makepyfile(test_suite=f"""
+            import time
+            import pytest
+
+            @pytest.fixture(scope="{scope}")
+            def slow():
+                time.sleep(0.3)
+                yield
+                time.sleep(0.3)
+
+            @pytest.fixture
+            def quick(slow):
+                yield
+
+            class TestSuite:
+                def test_first(self, quick):
+                    pass
+
+                def test_last(self, quick):
+                    pass
+        """)
+
+        pytester.runpytest("-p", "plugins.sharding", "--store-durations").assert_outcomes(passed=2)
+
+        assert all(duration < 0.2 for duration in self.stored(pytester).values())
+
+    def test_function_scoped_fixture_time_is_charged_to_its_test(self, pytester):
+        pytester.makepyfile(test_suite="""
+            import time
+            import pytest
+
+            @pytest.fixture
+            def slow():
+                time.sleep(0.2)
+                yield
+                time.sleep(0.2)
+
+            def test_slow(slow):
+                pass
+
+            def test_fast():
+                pass
+        """)
+
+        pytester.runpytest("-p", "plugins.sharding", "--store-durations").assert_outcomes(passed=2)
+
+        durations = self.stored(pytester)
+        assert durations["test_suite.py::test_slow"] >= 0.4
+        assert durations["test_suite.py::test_fast"] < 0.1
@@ -0,0 +1,125 @@
+import json
+import threading
+import time
+
+import pytest
+from plugins.timing import TimingRecorder
+
+DECODE_PRODUCTS = "be.infrastructure.responsesDTO.decoders.decode_products"
+
+
+@pytest.fixture
+def recorder():
+    recorder = TimingRecorder()
+    recorder.start_test()
+    return recorder
+
+
+class TestTimingRecorder:
+
+    def test_nested_calls_count_self_time_only(self, recorder):
+        inner = recorder.wrap(lambda: time.sleep(0.1), "inner", "http")
+        outer = recorder.wrap(inner, "outer", "page_action")
+
+        outer()
+
+        data = recorder.finish_test()
+        assert data["calls"]["outer"]["total"] >= 0.1
+        assert data["categories"]["http"] >= 0.1
+        assert data["categories"]["page_action"] < 0.05
+
+    def test_concurrent_calls_keep_their_own_self_time(self, recorder):
+        both_running = threading.Barrier(2)
+
+        def slow():
+            both_running.wait()
+            time.sleep(0.1)
+
+        timed = recorder.wrap(slow, "slow", "http")
+        threads = [threading.Thread(target=timed) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        data = recorder.finish_test()
+        assert data["calls"]["slow"]["count"] == 2
+        assert data["categories"]["http"] >= 0.2
+
+    def test_calls_outside_a_test_are_not_recorded(self, recorder):
+        timed = recorder.wrap(lambda: "value", "call", "http")
+        recorder.finish_test()
+
+        assert timed() == "value"
+        assert recorder.current is None
+
+
+class TestTimingPlugin:
+
+    @pytest.fixture
+    def run(self, pytester):
+        pytester.makeini("[pytest]")
+
+        def run(*args):
+            return pytester.runpytest("-p", "plugins.timing", "--timing", *args)
+
+        return run
+
+    def timings(self, pytester) -> dict:
+        return json.loads((pytester.path / ".test_timings.json").read_text())
+
+    def test_breakdown_is_written_per_test(self, pytester, run):
+        pytester.makepyfile(test_suite="""
+            from be.infrastructure.responsesDTO import decoders
+
+            def test_decodes():
+                decoders.decode_products(b"[]")
+                decoders.decode_products(b"[]")
+
+            def test_nothing():
+                pass
+        """)
+
+        result = run()
+
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(["*timing breakdown*", "parsing*"])
+        timings = self.timings(pytester)
+        assert timings["test_suite.py::test_decodes"]["calls"][DECODE_PRODUCTS]["count"] == 2
+        assert timings["test_suite.py::test_nothing"]["calls"] == {}
+        assert set(timings["test_suite.py::test_nothing"]["phases"]) == {"setup", "call", "teardown"}
+
+    def test_retried_test_keeps_the_calls_of_every_attempt(self, pytester, run):
+        pytester.makepyfile(test_suite="""
+            import itertools
+            from be.infrastructure.responsesDTO import decoders
+
+            attempts = itertools.count(1)
+
+            def test_it():
+                decoders.decode_products(b"[]")
+                assert next(attempts) == 3
+        """)
+
+        result = run("-p", "plugins.retry", "--retry-delay", "0", "--max-attempts", "3")
+
+        assert result.parseoutcomes() == {"passed": 1, "rerun": 2}
+        assert self.timings(pytester)["test_suite.py::test_it"]["calls"][DECODE_PRODUCTS]["count"] == 3
+
+    def test_breakdown_is_written_at_the_rootdir(self, pytester, run, monkeypatch):
+        pytester.makepyfile(test_suite="def test_it(): pass")
+        monkeypatch.chdir(pytester.mkdir("sub"))
+
+        run(str(pytester.path), "--rootdir", str(pytester.path))
+
+        assert "test_suite.py::test_it" in self.timings(pytester)
+        assert not (pytester.path / "sub" / ".test_timings.json").exists()
+
+    def test_instrumentation_is_removed_after_the_run(self, pytester, run):
+        from be.infrastructure.responsesDTO import decoders
+        original = decoders.decode_products
+        pytester.makepyfile(test_suite="def test_it(): pass")
+
+        run()
+
+        assert decoders.decode_products is original
@@ -0,0 +1,196 @@
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# (module, class or None, attribute names or None for every public method defined there, category)
+INSTRUMENTED = [
+    ("ui.pages.base_page", "BasePage", ["navigate", "perform_and_wait"], "navigation"),
+    ("ui.pages.base_page", "BasePage", ["wait_for_element"], "selector_wait"),
+    ("ui.pages.base_page", "BasePage", ["click_element", "get_text"], "page_action"),
+    ("ui.pages.home_page", "HomePage", None, "page_action"),
+    ("ui.pages.product_details_page", "ProductDetailsPage", None, "page_action"),
+    ("ui.pages.cart_page", "CartPage", None, "page_action"),
+    ("requests", "Session", ["request"], "http"),
+    ("be.infrastructure.responsesDTO.decoders", None,
+     ["decode_products", "decode_cart_list", "decode_cart_item"], "parsing"),
+    ("be.tests.helpers", None,
+     ["get_products_from_response", "get_cart_from_response_list", "get_cart_from_response"], "parsing"),
+]
+# navigation methods wait on readiness themselves, so count them as navigation rather than actions
+NAVIGATION_METHODS = {"navigate", "click_product", "click_cart", "click_back"}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("timing")
+    group.addoption("--timing", action="store_true", default=os.environ.get("PYTEST_TIMING") == "1",
+                    help="instrument page objects, HTTP calls and decoders and report a per-test breakdown")
+    group.addoption("--timing-json", default=".test_timings.json", help="where the per-test breakdown is written")
+
+
+class TimingRecorder:
+    """Per-test call timings; categories use self time so nested instrumented calls are not double counted.
+
+    Every thread keeps its own call stack, so calls made at the same time by a prefetch or batch pool
+    only subtract their own children.
+    """
+
+    def __init__(self):
+        self.current = None
+        self._threads = threading.local()
+        self._lock = threading.Lock()
+
+    def start_test(self):
+        self.current = {"categories": {}, "calls": {}}
+        self._threads = threading.local()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"categories": dict(self.current["categories"]),
+                    "calls": {name: dict(calls) for name, calls in self.current["calls"].items()}}
+
+    def finish_test(self):
+        data, self.current = self.current, None
+        return data
+
+    def _stack(self) -> list:
+        threads = self._threads
+        if not hasattr(threads, "stack"):
+            threads.stack = []
+        return threads.stack
+
+    def wrap(self, func, name: str, category: str):
+        recorder = self
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            if recorder.current is None:
+                return func(*args, **kwargs)
+            # held on to, so a call still running when the next test starts pops what it pushed
+            stack = recorder._stack()
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                child_time = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                recorder.record(name, category, elapsed, elapsed - child_time)
+
+        timed.__timing_original__ = func
+        return timed
+
+    def record(self, name: str, category: str, elapsed: float, self_time: float):
+        with self._lock:
+            if self.current is None:
+                return
+            calls = self.current["calls"].setdefault(name, {"count": 0, "total": 0.0})
+            calls["count"] += 1
+            calls["total"] += elapsed
+            categories = self.current["categories"]
+            categories[category] = categories.get(category, 0.0) + self_time
+
+
+def _targets(module_name, class_name, names):
+    try:
+        module = __import__(module_name, fromlist=["_"])
+    except ImportError:
+        # optional: the UI or BE dependencies may not be installed for this run
+        return []
+    owner = getattr(module, class_name) if class_name else module
+    if names is None:
+        names = [name for name, value in vars(owner).items() if callable(value) and not name.startswith("_")]
+    return [(owner, name) for name in names]
+
+
+class TimingPlugin:
+
+    def __init__(self, config):
+        self.config = config
+        self.json_path = Path(config.rootpath) / config.getoption("timing_json")
+        self.recorder = TimingRecorder()
+        self.patched = []
+        self.results = {}
+
+    def instrument(self):
+        for module_name, class_name, names, category in INSTRUMENTED:
+            for owner, name in _targets(module_name, class_name, names):
+                original = getattr(owner, name)
+                label = f"{getattr(owner, '__name__', module_name)}.{name}"
+                method_category = "navigation" if class_name and name in NAVIGATION_METHODS else category
+                setattr(owner, name, self.recorder.wrap(original, label, method_category))
+                self.patched.append((owner, name, original))
+
+    def restore(self):
+        for owner, name, original in reversed(self.patched):
+            setattr(owner, name, original)
+        self.patched = []
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        # wraps every retry attempt, so a retried test's record covers all of them
+        self.recorder.start_test()
+        yield
+        self.recorder.finish_test()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef):
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        self.recorder.record(f"fixture:{fixturedef.argname}", "fixture_setup", elapsed, elapsed)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if call.when == "teardown" and self.recorder.current is not None:
+            # everything recorded so far, so the final attempt's report has all of it; travels with the
+            # report, so xdist workers' data reaches the controller
+            report.user_properties.append(("timing", self.recorder.snapshot()))
+
+    def pytest_runtest_logreport(self, report):
+        result = self.results.setdefault(report.nodeid, {"total": 0.0, "phases": {}})
+        result["phases"][report.when] = round(report.duration, 6)
+        result["total"] = round(result["total"] + report.duration, 6)
+        for key, value in report.user_properties:
+            if key == "timing":
+                result.update(value)
+
+    def pytest_sessionfinish(self, session):
+        self.restore()
+        if hasattr(self.config, "workerinput"):
+            return
+        self.json_path.write_text(json.dumps(self.results, indent=2, sort_keys=True))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.results:
+            return
+        categories = {}
+        for result in self.results.values():
+            for category, seconds in result.get("categories", {}).items():
+                categories[category] = categories.get(category, 0.0) + seconds
+        terminalreporter.write_sep("-", "timing breakdown")
+        for category, seconds in sorted(categories.items(), key=lambda entry: -entry[1]):
+            terminalreporter.write_line(f"{category:<16}{seconds:>10.3f}s")
+        terminalreporter.write_line("slowest tests:")
+        slowest = sorted(self.results.items(), key=lambda entry: -entry[1]["total"])[:10]
+        for nodeid, result in slowest:
+            top = sorted(result.get("categories", {}).items(), key=lambda entry: -entry[1])[:3]
+            parts = ", ".join(f"{category} {seconds:.2f}s" for category, seconds in top)
+            terminalreporter.write_line(f"{result['total']:>8.2f}s  {nodeid}  ({parts})")
+        terminalreporter.write_line(f"per-test breakdown written to {self.json_path}")
+
+
+def pytest_configure(config):
+    if not config.getoption("timing"):
+        return
+    plugin = TimingPlugin(config)
+    plugin.instrument()
+    config.pluginmanager.register(plugin, "timing-plugin")
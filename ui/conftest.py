@@ -1,8 +1,30 @@
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+
 import pytest
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
-from pages.home_page import HomePage
-from pages.product_details_page import ProductDetailsPage
-from pages.cart_page import CartPage
+from ui.pages.base_page import BasePage
+from ui.pages.home_page import HomePage
+from ui.pages.product_details_page import ProductDetailsPage
+from ui.pages.cart_page import CartPage
+from ui.pages.performance import PERFORMANCE_INIT_SCRIPT
+import sys
+sys.path.append('..')
+from configuration import (BASE_URL, API_URL, STORE_USERNAME, STORE_PASSWORD, HEADLESS_MODE, BROWSER_TYPE, ASSET_CACHE_ENABLED, ASSET_CACHE_DIR,
+                           ASSET_CACHE_REVALIDATE, BLOCKED_HOSTS, HAR_MODE, HAR_DIR)
+from ui.helpers.asset_cache import AssetCache
+from ui.helpers.async_runner import AsyncRunner
+from ui.helpers.cart_seeding import CartSeeder
+from ui.helpers.har import HarArchive
+from ui.helpers.navigation_state import NavigationState, NavigationStateCache
+
+
+# launch vs test wall-clock, reported at session end
+_timings = {"browser_launch": 0.0, "context_setup": 0.0, "tests": 0.0, "test_count": 0}
+_asset_caches = []
+_performance_marks = {}
 
 
 @pytest.fixture(scope="session")
@@ -13,15 +35,72 @@ def browser_context_args():
     }
 
 
-@pytest.fixture(scope="function")
-def page(browser_context_args):
+@pytest.fixture(scope="session")
+def asset_cache():
+    if not ASSET_CACHE_ENABLED:
+        return None
+    cache = AssetCache(ASSET_CACHE_DIR, BLOCKED_HOSTS, ASSET_CACHE_REVALIDATE)
+    _asset_caches.append(cache)
+    return cache
+
+
+@pytest.fixture(scope="session")
+def har_archive():
+    return HarArchive(HAR_DIR, HAR_MODE, BASE_URL)
+
+
+@pytest.fixture(scope="session")
+def playwright_instance():
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)  # Set to True for headless mode
-        context = browser.new_context(**browser_context_args)
-        page = context.new_page()
-        yield page
+        yield p
+
+
+# One browser per session (and so one per xdist worker, since every worker is its own session)
+@pytest.fixture(scope="session")
+def browser(playwright_instance):
+    start = time.perf_counter()
+    browser = getattr(playwright_instance, BROWSER_TYPE).launch(headless=HEADLESS_MODE)
+    _timings["browser_launch"] += time.perf_counter() - start
+    yield browser
+    browser.close()
+
+
+@contextmanager
+def _browser_context(browser, browser_context_args, asset_cache, har_archive, module: str, name: str,
+                     **context_kwargs):
+    start = time.perf_counter()
+    context = browser.new_context(**browser_context_args, **context_kwargs)
+    context.add_init_script(PERFORMANCE_INIT_SCRIPT)
+    recording = None
+    if har_archive.enabled:
+        # recordings must see real traffic and replays must not touch the network, so no asset cache
+        recording = har_archive.attach(context, module, name)
+    elif asset_cache:
+        asset_cache.attach(context)
+    _timings["context_setup"] += time.perf_counter() - start
+    try:
+        yield context
+    finally:
         context.close()
-        browser.close()
+        if recording:
+            har_archive.merge(recording, module)
+
+
+# Fresh isolated context per test - cookies, storage and the demoblaze cart cookie never leak
+# between tests, or between workers running in parallel
+@pytest.fixture(scope="function")
+def context(request, browser, browser_context_args, asset_cache, har_archive):
+    with _browser_context(browser, browser_context_args, asset_cache, har_archive,
+                          request.node.path.stem, request.node.name) as context:
+        yield context
+
+
+@pytest.fixture(scope="function")
+def page(context):
+    start = time.perf_counter()
+    page = context.new_page()
+    _timings["context_setup"] += time.perf_counter() - start
+    yield page
 
 
 @pytest.fixture(scope="function")
@@ -39,10 +118,188 @@ def cart_page(page):
     return CartPage(page)
 
 
+@pytest.fixture(scope="session")
+def cart_seeder(browser, browser_context_args, har_archive, tmp_path_factory):
+    return CartSeeder(browser, BASE_URL, API_URL, tmp_path_factory.mktemp("storage_state"),
+                      browser_context_args, STORE_USERNAME, STORE_PASSWORD, har_archive.mode)
+
+
+# Starts directly on the cart with the items from @pytest.mark.cart_items(count, product_ids=(...))
+# already in it - one navigation instead of home -> product -> add to cart -> cart per item
+@pytest.fixture(scope="function")
+def seeded_cart_page(request, browser, browser_context_args, cart_seeder, asset_cache, har_archive):
+    marker = request.node.get_closest_marker("cart_items")
+    item_count = marker.args[0] if marker and marker.args else 1
+    product_ids = marker.kwargs.get("product_ids", (1,)) if marker else (1,)
+
+    storage_state = cart_seeder.storage_state_for(item_count, product_ids)
+    with _browser_context(browser, browser_context_args, asset_cache, har_archive, request.node.path.stem,
+                          request.node.name, storage_state=storage_state) as context:
+        cart_page = CartPage(context.new_page())
+        cart_page.navigate()
+        yield cart_page
+
+
+# Page-object paths are walked once per module; tests start from the recorded end state
+@pytest.fixture(scope="module")
+def navigation_states(request, browser, browser_context_args, asset_cache, har_archive, tmp_path_factory):
+    module = request.node.path.stem
+
+    def open_context(name):
+        return _browser_context(browser, browser_context_args, asset_cache, har_archive, module, name)
+
+    # demoblaze keys the server-side cart by the "user" cookie; without it every restored context
+    # gets a cart of its own (a fresh cookie from the store, or the pinned one under HAR_MODE)
+    return NavigationStateCache(open_context, tmp_path_factory.mktemp(f"navigation_{module}"),
+                                exclude_cookies=("user",))
+
+
+def _walk_to_first_product(page):
+    home_page = HomePage(page)
+    home_page.navigate()
+    home_page.click_product(0)
+
+
+@pytest.fixture(scope="module")
+def first_product_state(navigation_states) -> NavigationState:
+    return navigation_states.state_for("home>product[0]", _walk_to_first_product)
+
+
+def _restore(context, state: NavigationState) -> ProductDetailsPage:
+    page = ProductDetailsPage(context.new_page())
+    page.perform_and_wait(lambda: page.page.goto(state.url, wait_until="domcontentloaded"), page, "restore")
+    return page
+
+
+# The first product's details page in a fresh context of its own, for tests that act on it
+@pytest.fixture(scope="function")
+def first_product_page(request, browser, browser_context_args, asset_cache, har_archive, first_product_state):
+    with _browser_context(browser, browser_context_args, asset_cache, har_archive, request.node.path.stem,
+                          request.node.name, storage_state=first_product_state.storage_state) as context:
+        yield _restore(context, first_product_state)
+
+
+# One details page shared by every test of the module - only for tests that just read it
+@pytest.fixture(scope="module")
+def first_product_page_readonly(request, browser, browser_context_args, asset_cache, har_archive,
+                                first_product_state):
+    with _browser_context(browser, browser_context_args, asset_cache, har_archive, request.node.path.stem,
+                          "readonly_first_product", storage_state=first_product_state.storage_state) as context:
+        yield _restore(context, first_product_state)
+
+
+# Async API on its own thread and loop, for tests that drive many pages of one browser at once:
+# build a coroutine around async_context and the ui.pages.async_pages objects, then async_runner.run() it
+@pytest.fixture(scope="session")
+def async_runner():
+    runner = AsyncRunner().start()
+    yield runner
+    runner.stop()
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_runner):
+    async def launch():
+        playwright = await async_playwright().start()
+        browser = await getattr(playwright, BROWSER_TYPE).launch(headless=HEADLESS_MODE)
+        return playwright, browser
+
+    start = time.perf_counter()
+    playwright, browser = async_runner.run(launch())
+    _timings["browser_launch"] += time.perf_counter() - start
+    yield browser
+    async_runner.run(browser.close())
+    async_runner.run(playwright.stop())
+
+
+# Recorded and replayed like the sync contexts under HAR_MODE. The asset cache routes with sync
+# callbacks, so otherwise async contexts always fetch from the network
+@pytest.fixture(scope="function")
+def async_context(request, async_runner, async_browser, browser_context_args, har_archive):
+    module = request.node.path.stem
+
+    async def open_context():
+        context = await async_browser.new_context(**browser_context_args)
+        await context.add_init_script(PERFORMANCE_INIT_SCRIPT)
+        recording = None
+        if har_archive.enabled:
+            recording = await har_archive.attach_async(context, module, request.node.name)
+        return context, recording
+
+    start = time.perf_counter()
+    context, recording = async_runner.run(open_context())
+    _timings["context_setup"] += time.perf_counter() - start
+    try:
+        yield context
+    finally:
+        async_runner.run(context.close())
+        if recording:
+            har_archive.merge(recording, module)
+
+
 @pytest.fixture(scope="function")
 def setup_ui(home_page):
     home_page.navigate()
     return home_page
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    start = time.perf_counter()
+    yield
+    _timings["tests"] += time.perf_counter() - start
+    _timings["test_count"] += 1
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    _performance_marks[item.nodeid] = len(BasePage.performance_metrics)
+
+
+# every navigation's metrics from setup through the call go on the call report (and so into
+# junit properties and through xdist to the controller)
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when != "call":
+        return
+    start = _performance_marks.pop(item.nodeid, len(BasePage.performance_metrics))
+    metrics = BasePage.performance_metrics[start:]
+    if metrics:
+        outcome.get_result().user_properties.append(("performance", [asdict(m) for m in metrics]))
+
+
+def _median(values):
+    values = sorted(value for value in values if value is not None)
+    return values[len(values) // 2]
+
 
+def pytest_terminal_summary(terminalreporter):
+    for cache in _asset_caches:
+        terminalreporter.write_sep("-", "static asset cache")
+        terminalreporter.write_line(", ".join(f"{name}: {count}" for name, count in cache.stats.items()))
+    if BasePage.readiness_timings:
+        terminalreporter.write_sep("-", "page readiness timings")
+        grouped = {}
+        for timing in BasePage.readiness_timings:
+            grouped.setdefault((timing.page, timing.action), []).append(timing.seconds)
+        for (page_name, action), seconds in sorted(grouped.items()):
+            terminalreporter.write_line(
+                f"{page_name}.{action}: {len(seconds)}x, mean {sum(seconds) / len(seconds):.2f}s, max {max(seconds):.2f}s")
+    if BasePage.performance_metrics:
+        terminalreporter.write_sep("-", "page performance")
+        grouped = {}
+        for metrics in BasePage.performance_metrics:
+            grouped.setdefault(metrics.page, []).append(metrics)
+        for page_name, entries in sorted(grouped.items()):
+            terminalreporter.write_line(
+                f"{page_name}: {len(entries)} navigations, " + ", ".join(
+                    f"{name} p50 {_median([getattr(m, name) for m in entries]):.0f}"
+                    for name in ("ttfb_ms", "dom_content_loaded_ms", "lcp_ms")
+                    if any(getattr(m, name) is not None for m in entries)))
+    if not _timings["test_count"]:
+        return
+    terminalreporter.write_sep("-", "browser pool timings")
+    terminalreporter.write_line(f"browser launch: {_timings['browser_launch']:.2f}s (once per session)")
+    terminalreporter.write_line(f"context + page setup: {_timings['context_setup']:.2f}s")
+    terminalreporter.write_line(f"test bodies: {_timings['tests']:.2f}s over {_timings['test_count']} tests")
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Route
+
+CACHEABLE_RESOURCE_TYPES = {"image", "script", "stylesheet", "font", "media"}
+# the cached body is stored decoded, so these no longer describe it
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+# responses the server says must not be kept, or only by the browser of the user they were sent to
+UNCACHEABLE_DIRECTIVES = {"no-store", "private"}
+
+
+def cache_directives(cache_control: str) -> dict:
+    """Cache-Control directives, e.g. "public, max-age=60" -> {"public": "", "max-age": "60"}."""
+    directives = {}
+    for part in cache_control.split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip().strip('"')
+    return directives
+
+
+def max_age(headers: dict) -> int:
+    """Seconds a response may be served without revalidation; 0 without max-age or with no-cache."""
+    directives = cache_directives(headers.get("cache-control", ""))
+    if "no-cache" in directives:
+        return 0
+    try:
+        return max(0, int(directives.get("max-age", 0)) - int(headers.get("age", 0)))
+    except ValueError:
+        return 0
+
+
+class AssetCache:
+    """On-disk cache for static assets, served through Playwright request routing.
+
+    Entries are keyed by URL + ETag. Every URL has its own small metadata file, so parallel
+    workers can share one cache directory without a common index to fight over. With `revalidate`
+    an entry is served as is only while its max-age lasts; after that the server is asked with
+    If-None-Match and the entry is served again on a 304. no-store and private responses are never kept.
+    """
+
+    def __init__(self, cache_dir, blocked_hosts=(), revalidate: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.blocked_hosts = tuple(blocked_hosts)
+        self.revalidate = revalidate
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "blocked": 0}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def attach(self, context: BrowserContext):
+        context.route("**/*", self._handle)
+
+    def _handle(self, route: Route):
+        request = route.request
+        host = urlsplit(request.url).hostname or ""
+        if any(host == blocked or host.endswith("." + blocked) for blocked in self.blocked_hosts):
+            self.stats["blocked"] += 1
+            route.abort()
+            return
+        if request.method != "GET" or request.resource_type not in CACHEABLE_RESOURCE_TYPES:
+            route.fallback()
+            return
+
+        entry = self._load(request.url)
+        if entry and (not self.revalidate or self._is_fresh(entry)):
+            self.stats["hits"] += 1
+            self._fulfill_from_cache(route, entry)
+            return
+
+        headers = dict(request.headers)
+        if entry and entry["etag"]:
+            headers["if-none-match"] = entry["etag"]
+        response = route.fetch(headers=headers)
+        if entry and response.status == 304:
+            self.stats["revalidated"] += 1
+            # the 304 starts a new freshness lifetime for the same body
+            self._write_meta(request.url, {**self._meta(entry), "stored_at": time.time(),
+                                           "max_age": max_age(response.headers)})
+            self._fulfill_from_cache(route, entry)
+            return
+
+        self.stats["misses"] += 1
+        if response.status == 200:
+            if UNCACHEABLE_DIRECTIVES & cache_directives(response.headers.get("cache-control", "")).keys():
+                self._meta_path(request.url).unlink(missing_ok=True)
+            else:
+                self._store(request.url, response)
+        route.fulfill(response=response)
+
+    @staticmethod
+    def _is_fresh(entry: dict) -> bool:
+        # entries written before freshness was tracked have neither field and are always revalidated
+        return time.time() - entry.get("stored_at", 0) < entry.get("max_age", 0)
+
+    @staticmethod
+    def _meta(entry: dict) -> dict:
+        return {name: value for name, value in entry.items() if name != "body"}
+
+    def _fulfill_from_cache(self, route: Route, entry: dict):
+        route.fulfill(status=entry["status"], headers=entry["headers"], body=entry["body"])
+
+    def _meta_path(self, url: str) -> Path:
+        return self.cache_dir / (hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+    def _body_path(self, url: str, etag: str) -> Path:
+        return self.cache_dir / (hashlib.sha256(f"{url}\0{etag}".encode()).hexdigest() + ".body")
+
+    def _load(self, url: str):
+        try:
+            meta = json.loads(self._meta_path(url).read_text())
+            body = self._body_path(url, meta["etag"]).read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+        return {**meta, "body": body}
+
+    def _store(self, url: str, response):
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in DROPPED_HEADERS}
+        etag = response.headers.get("etag", "")
+        meta = {"url": url, "etag": etag, "status": response.status, "headers": headers,
+                "stored_at": time.time(), "max_age": max_age(response.headers)}
+        # body first, then metadata, both via atomic rename, so readers never see half an entry
+        self._write_atomic(self._body_path(url, etag), response.body())
+        self._write_meta(url, meta)
+
+    def _write_meta(self, url: str, meta: dict):
+        self._write_atomic(self._meta_path(url), json.dumps(meta).encode())
+
+    def _write_atomic(self, path: Path, data: bytes):
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
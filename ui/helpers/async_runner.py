@@ -0,0 +1,40 @@
+import asyncio
+import threading
+from typing import Awaitable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncRunner:
+    """An event loop on its own thread, so sync tests can drive the async Playwright API.
+
+    The sync API refuses to run inside an asyncio loop and the async API needs one, so the async
+    browser lives entirely on this thread and tests hand it coroutines through `run`.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="async-playwright", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def run(self, coroutine: Awaitable[T], timeout: float = None) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+async def gather_limited(coroutines: Iterable[Awaitable[T]], limit: int) -> List[T]:
+    """asyncio.gather with at most `limit` coroutines in flight, results in input order."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def limited(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*(limited(coroutine) for coroutine in coroutines))
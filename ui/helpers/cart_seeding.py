@@ -0,0 +1,89 @@
+import base64
+import json
+import uuid
+from pathlib import Path
+
+from playwright.sync_api import Browser
+
+# HAR runs need the same cart behind the same "user" cookie every time, since replayed cart API calls
+# are matched on their request body; owners and item ids are derived from this namespace
+SEEDED_CART_NAMESPACE = uuid.UUID("605d457f-9257-4c5b-a242-a6238aa25ca3")
+
+
+class CartSeeder:
+    """Builds browser storage states whose cart already holds N items.
+
+    Items are added straight through the store API, so seeding needs no page navigation and no
+    "Product added" alert round trips. States are cached per item count for the session; tests
+    sharing a state share the same server-side cart, so tests that remove items should use a
+    count of their own.
+
+    With a HAR mode the cart owner is derived from the item count and products, so recorded cart
+    pages replay: "record" empties that cart before seeding it, and "replay" only sets the cookie,
+    since the cart page's API calls are served from the archive. Store credentials are not used then.
+    """
+
+    def __init__(self, browser: Browser, base_url: str, api_url: str, storage_dir, context_args=None,
+                 username: str = None, password: str = None, har_mode: str = "off"):
+        self.browser = browser
+        self.base_url = base_url
+        self.api_url = api_url.rstrip("/")
+        self.storage_dir = Path(storage_dir)
+        self.context_args = context_args or {}
+        self.username = username
+        self.password = password
+        self.har_mode = har_mode
+        self._states = {}
+
+    def storage_state_for(self, item_count: int, product_ids=(1,)) -> Path:
+        key = (item_count, tuple(product_ids))
+        if key not in self._states:
+            self._states[key] = self._build(item_count, product_ids)
+        return self._states[key]
+
+    def _build(self, item_count: int, product_ids) -> Path:
+        context = self.browser.new_context(**self.context_args)
+        try:
+            if self.har_mode != "off":
+                cart_owner, logged_in = self.recordable_owner(item_count, product_ids), False
+                context.add_cookies([{"name": "user", "value": cart_owner, "url": self.base_url}])
+            elif self.username:
+                cart_owner, logged_in = self._login(context), True
+            else:
+                cart_owner, logged_in = str(uuid.uuid4()), False
+                context.add_cookies([{"name": "user", "value": cart_owner, "url": self.base_url}])
+
+            if self.har_mode == "record":
+                # the owner is the same on every recording, so drop what earlier ones added
+                response = context.request.post(f"{self.api_url}/deletecart", data={"cookie": cart_owner})
+                assert response.ok, f"Emptying the recorded cart failed with status {response.status}"
+
+            for i in range(item_count if self.har_mode != "replay" else 0):
+                response = context.request.post(f"{self.api_url}/addtocart", data={
+                    "id": str(uuid.uuid5(SEEDED_CART_NAMESPACE, f"{cart_owner}/{i}")),
+                    "cookie": cart_owner,
+                    "prod_id": product_ids[i % len(product_ids)],
+                    "flag": logged_in,
+                })
+                assert response.ok, f"Seeding cart item {i} failed with status {response.status}"
+
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            path = self.storage_dir / f"cart_{item_count}_{'_'.join(map(str, product_ids))}.json"
+            context.storage_state(path=path)
+            return path
+        finally:
+            context.close()
+
+    @staticmethod
+    def recordable_owner(item_count: int, product_ids) -> str:
+        return str(uuid.uuid5(SEEDED_CART_NAMESPACE, f"cart/{item_count}/{','.join(map(str, product_ids))}"))
+
+    def _login(self, context) -> str:
+        password = base64.b64encode(self.password.encode()).decode()
+        response = context.request.post(f"{self.api_url}/login",
+                                        data={"username": self.username, "password": password})
+        body = json.loads(response.text())
+        assert response.ok and "Auth_token:" in body, f"Login failed: {body}"
+        token = body.split("Auth_token:")[1].strip()
+        context.add_cookies([{"name": "tokenp_", "value": token, "url": self.base_url}])
+        return token
@@ -0,0 +1,159 @@
+import asyncio
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Union
+
+from playwright.async_api import Dialog as AsyncDialog, Page as AsyncPage
+from playwright.sync_api import Dialog, Page, TimeoutError as PlaywrightTimeoutError
+import sys
+sys.path.append('..')
+from configuration import UI_DEFAULT_TIMEOUT
+
+Matcher = Union[None, str, Callable[["DialogRecord"], bool]]
+
+
+@dataclass(frozen=True)
+class DialogRecord:
+    type: str
+    message: str
+    default_value: str
+    url: str
+    # time.perf_counter() when the dialog was received
+    received_at: float
+
+
+class DialogExpectation:
+    value: Optional[DialogRecord] = None
+
+
+class DialogBroker:
+    """The single dialog listener of a page: accepts every dialog and keeps a record of it.
+
+    Waits look at the records first and only then block on the page's next dialog event, so a
+    dialog that fired while another Playwright call was running is never missed, and a wait
+    returns as soon as the matching dialog arrives.
+    """
+
+    _brokers = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page, accept: bool = True):
+        self.page = page
+        self.accept = accept
+        self.records: List[DialogRecord] = []
+        # records before this index were already returned by a wait
+        self._cursor = 0
+        page.on("dialog", self._handle)
+
+    @classmethod
+    def for_page(cls, page: Page) -> "DialogBroker":
+        broker = cls._brokers.get(page)
+        if broker is None:
+            broker = cls._brokers[page] = cls(page)
+        return broker
+
+    def _record(self, dialog: Union[Dialog, AsyncDialog]):
+        self.records.append(DialogRecord(dialog.type, dialog.message, dialog.default_value,
+                                         self.page.url, time.perf_counter()))
+
+    def _handle(self, dialog: Dialog):
+        self._record(dialog)
+        if self.accept:
+            dialog.accept()
+        else:
+            dialog.dismiss()
+
+    def _claim(self, index: int, match: Matcher, dialog_type: Optional[str]) -> Optional[DialogRecord]:
+        """First record from `index` on that matches, marking everything up to it as returned."""
+        for i in range(index, len(self.records)):
+            record = self.records[i]
+            if dialog_type and record.type != dialog_type:
+                continue
+            if match(record) if callable(match) else match is None or match in record.message:
+                self._cursor = i + 1
+                return record
+        return None
+
+    def _not_found(self, match: Matcher, dialog_type: Optional[str], timeout: float) -> AssertionError:
+        seen = ", ".join(f"{r.type}: {r.message!r}" for r in self.records[self._cursor:]) or "none"
+        return AssertionError(
+            f"No {dialog_type or 'dialog'} matching {match!r} within {timeout:.0f}ms (unclaimed: {seen})")
+
+    def wait_for(self, match: Matcher = None, dialog_type: Optional[str] = "alert",
+                 timeout: float = UI_DEFAULT_TIMEOUT, start: Optional[int] = None) -> DialogRecord:
+        """Next dialog of `dialog_type` whose message contains `match` (or satisfies it, if callable)."""
+        index = self._cursor if start is None else start
+        deadline = time.perf_counter() + timeout / 1000
+        while True:
+            record = self._claim(index, match, dialog_type)
+            if record:
+                return record
+            index = len(self.records)
+            remaining = (deadline - time.perf_counter()) * 1000
+            if remaining > 0:
+                try:
+                    # listeners run in registration order and ours records before accepting, so the
+                    # record exists by the time this returns
+                    self.page.wait_for_event("dialog", timeout=remaining)
+                    continue
+                except PlaywrightTimeoutError:
+                    pass
+            raise self._not_found(match, dialog_type, timeout)
+
+    @contextmanager
+    def expect_dialog(self, match: Matcher = None, dialog_type: Optional[str] = "alert",
+                      timeout: float = UI_DEFAULT_TIMEOUT):
+        """Wait, once the block is done, for a matching dialog raised since it started."""
+        expectation = DialogExpectation()
+        start = len(self.records)
+        yield expectation
+        expectation.value = self.wait_for(match, dialog_type, timeout, start=start)
+
+
+class AsyncDialogBroker(DialogBroker):
+    """DialogBroker for async pages: the same records, matching and accept/dismiss policy, with
+    awaitable waits."""
+
+    _brokers = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: AsyncPage, accept: bool = True):
+        # accept()/dismiss() tasks still running; the loop only keeps weak references to tasks
+        self._responses = set()
+        super().__init__(page, accept)
+
+    def _handle(self, dialog: AsyncDialog):
+        # a plain function, so the dialog is recorded while the event is emitted, before a
+        # wait_for_event that it resolves resumes
+        self._record(dialog)
+        response = asyncio.ensure_future(dialog.accept() if self.accept else dialog.dismiss())
+        self._responses.add(response)
+        response.add_done_callback(self._responses.discard)
+
+    async def wait_for(self, match: Matcher = None, dialog_type: Optional[str] = "alert",
+                       timeout: float = UI_DEFAULT_TIMEOUT, start: Optional[int] = None) -> DialogRecord:
+        """Next dialog of `dialog_type` whose message contains `match` (or satisfies it, if callable)."""
+        index = self._cursor if start is None else start
+        deadline = time.perf_counter() + timeout / 1000
+        while True:
+            record = self._claim(index, match, dialog_type)
+            if record:
+                return record
+            index = len(self.records)
+            remaining = (deadline - time.perf_counter()) * 1000
+            if remaining > 0:
+                try:
+                    await self.page.wait_for_event("dialog", timeout=remaining)
+                    continue
+                except PlaywrightTimeoutError:
+                    pass
+            raise self._not_found(match, dialog_type, timeout)
+
+    @asynccontextmanager
+    async def expect_dialog(self, match: Matcher = None, dialog_type: Optional[str] = "alert",
+                            timeout: float = UI_DEFAULT_TIMEOUT):
+        """Wait, once the block is done, for a matching dialog raised since it started."""
+        expectation = DialogExpectation()
+        start = len(self.records)
+        yield expectation
+        expectation.value = await self.wait_for(match, dialog_type, timeout, start=start)
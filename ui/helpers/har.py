@@ -0,0 +1,90 @@
+import json
+import os
+import re
+from pathlib import Path
+
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.sync_api import BrowserContext
+
+# demoblaze keys the cart by a random "user" cookie; pinning it keeps recorded cart API calls replayable
+HAR_USER_COOKIE = "00000000-0000-4000-8000-000000000000"
+
+
+class HarArchive:
+    """Records UI traffic into one HAR per test module and replays it offline."""
+
+    def __init__(self, har_dir, mode: str, base_url: str):
+        if mode not in ("off", "record", "replay"):
+            raise ValueError(f"Unknown HAR mode: {mode}")
+        self.har_dir = Path(har_dir)
+        self.mode = mode
+        self.base_url = base_url
+        self._recorded_modules = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def module_path(self, module: str) -> Path:
+        return self.har_dir / f"{module}.har"
+
+    def attach(self, context: BrowserContext, module: str, test_name: str):
+        """Returns the path of the per-test recording to merge after the context is closed."""
+        # a cart owner the context already has (from a seeded cart's storage state) is deterministic too
+        if not self._has_user_cookie(context.cookies(self.base_url)):
+            context.add_cookies([self._user_cookie()])
+        if self.mode == "replay":
+            context.route_from_har(self._replay_path(module), not_found="abort")
+            return None
+        recording = self._recording_path(module, test_name)
+        context.route_from_har(recording, update=True, update_content="embed", update_mode="full")
+        return recording
+
+    async def attach_async(self, context: AsyncBrowserContext, module: str, test_name: str):
+        """attach() for contexts of the async API."""
+        if not self._has_user_cookie(await context.cookies(self.base_url)):
+            await context.add_cookies([self._user_cookie()])
+        if self.mode == "replay":
+            await context.route_from_har(self._replay_path(module), not_found="abort")
+            return None
+        recording = self._recording_path(module, test_name)
+        await context.route_from_har(recording, update=True, update_content="embed", update_mode="full")
+        return recording
+
+    @staticmethod
+    def _has_user_cookie(cookies) -> bool:
+        return any(cookie["name"] == "user" for cookie in cookies)
+
+    def _user_cookie(self) -> dict:
+        return {"name": "user", "value": HAR_USER_COOKIE, "url": self.base_url}
+
+    def _replay_path(self, module: str) -> Path:
+        har_path = self.module_path(module)
+        if not har_path.exists():
+            raise FileNotFoundError(f"No HAR recorded for {module}, run with HAR_MODE=record first")
+        return har_path
+
+    def _recording_path(self, module: str, test_name: str) -> Path:
+        self.har_dir.mkdir(parents=True, exist_ok=True)
+        safe_name = re.sub(r"[^\w.-]", "_", test_name)
+        return self.har_dir / f".{module}.{safe_name}.{os.getpid()}.har"
+
+    def merge(self, recording: Path, module: str):
+        # the first test of a module in this session starts the archive over, later ones add to it
+        target = self.module_path(module)
+        new_har = json.loads(recording.read_text())
+        recording.unlink()
+        if module in self._recorded_modules and target.exists():
+            har = json.loads(target.read_text())
+        else:
+            har = new_har
+            har["log"]["entries"] = []
+        self._recorded_modules.add(module)
+
+        entries = {}
+        for entry in har["log"]["entries"] + new_har["log"]["entries"]:
+            request = entry["request"]
+            key = (request["method"], request["url"], (request.get("postData") or {}).get("text"))
+            entries[key] = entry
+        har["log"]["entries"] = list(entries.values())
+        target.write_text(json.dumps(har))
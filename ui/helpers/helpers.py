@@ -1,19 +1,10 @@
-def setup_alert_handler(page, expected_message=None, count_alert=False):
-    alert_message = ""
-    alert_count = 0
+from ui.helpers.dialogs import DialogBroker
 
-    def handle_dialog(dialog):
-        nonlocal alert_message, alert_count
-        alert_message = dialog.message
-        if count_alert:
-            alert_count += 1
-        assert dialog.type == "alert", f"Unexpected dialog type: {dialog.type}"
-        if expected_message:
-            assert expected_message in dialog.message, f"Unexpected alert message: {dialog.message}"
-        dialog.accept()
 
-    page.on("dialog", handle_dialog)
-    return alert_message, alert_count
+# The page's dialog broker: it accepts every dialog and keeps a record of it. Use
+# broker.wait_for(expected_message) or `with broker.expect_dialog(expected_message)` to observe one.
+def setup_alert_handler(page):
+    return DialogBroker.for_page(page)
 
 
 def home_page_displayed(setup_ui):
@@ -0,0 +1,46 @@
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Iterable
+
+from playwright.sync_api import BrowserContext, Page
+
+
+@dataclass(frozen=True)
+class NavigationState:
+    url: str
+    storage_state: Path
+
+
+class NavigationStateCache:
+    """Walks a page-object path (e.g. home -> product[0]) once and remembers where it ended.
+
+    The end state is the final URL plus the context's cookies and localStorage, so a test can get
+    there again with one navigation in a fresh context instead of repeating every step. Cookies named
+    in `exclude_cookies` are left out, so state that belongs to one test (e.g. a cart) is not shared.
+    """
+
+    def __init__(self, open_context: Callable[[str], ContextManager[BrowserContext]], storage_dir,
+                 exclude_cookies: Iterable[str] = ()):
+        self.open_context = open_context
+        self.storage_dir = Path(storage_dir)
+        self.exclude_cookies = frozenset(exclude_cookies)
+        self._states: Dict[str, NavigationState] = {}
+
+    def state_for(self, name: str, walk: Callable[[Page], None]) -> NavigationState:
+        if name not in self._states:
+            self._states[name] = self._record(name, walk)
+        return self._states[name]
+
+    def _record(self, name: str, walk: Callable[[Page], None]) -> NavigationState:
+        safe_name = re.sub(r"[^\w.-]", "_", name)
+        with self.open_context(f"state_{safe_name}") as context:
+            page = context.new_page()
+            walk(page)
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            path = self.storage_dir / f"{safe_name}.json"
+            state = context.storage_state()
+            state["cookies"] = [cookie for cookie in state["cookies"] if cookie["name"] not in self.exclude_cookies]
+            path.write_text(json.dumps(state))
+            return NavigationState(page.url, path)
@@ -0,0 +1,264 @@
+"""Async twins of the page objects for driving many pages of one browser concurrently.
+
+Selectors, paths, ready states, snapshot shaping, validation rules and the readiness and
+performance bookkeeping all come from the sync page objects; the methods here only await the
+Playwright calls in between.
+"""
+import time
+from contextlib import AsyncExitStack
+from typing import Awaitable, Callable, List, Optional
+
+from playwright.async_api import expect
+
+from ui.helpers.dialogs import AsyncDialogBroker, DialogRecord
+from .base_page import BasePage, ReadyState, ready_state_expression, DEFAULT_TIMEOUT
+from .performance import PerformanceMetrics, PERFORMANCE_SNAPSHOT_SCRIPT, IMAGES_SETTLED_SCRIPT
+from .home_page import HomePage, ProductCard, CATALOG_SNAPSHOT_SCRIPT
+from .product_details_page import ProductDetailsPage
+from .cart_page import CartPage, CartItem, CART_SNAPSHOT_SCRIPT
+
+
+class AsyncBasePage(BasePage):
+    # __init__, locator(), url_for() and ready_state() are inherited as is: none of them touch
+    # the browser in either API
+
+    @property
+    def dialogs(self) -> AsyncDialogBroker:
+        return AsyncDialogBroker.for_page(self.page)
+
+    async def navigate(self, url: str = "", wait_until: str = "load"):
+        await self.page.goto(self.url_for(url), wait_until=wait_until)
+
+    async def wait_until_ready(self, timeout: int = DEFAULT_TIMEOUT):
+        await self.perform_and_wait(None, self, "wait", timeout)
+
+    async def perform_and_wait(self, action: Optional[Callable[[], Awaitable]], target: "AsyncBasePage",
+                               label: str, timeout: int = DEFAULT_TIMEOUT):
+        ready = target.ready_state()
+        start = time.perf_counter()
+        async with AsyncExitStack() as stack:
+            for predicate in self._response_predicates(ready, action):
+                await stack.enter_async_context(self.page.expect_response(predicate, timeout=timeout))
+            if action:
+                await action()
+        await self._wait_for_ready_state(ready, self._remaining(timeout, start))
+        self._record_readiness(target, label, start)
+        if action:
+            await target.check_performance(label)
+
+    async def collect_performance(self, label: str) -> PerformanceMetrics:
+        return self._record_performance(label, await self.page.evaluate(PERFORMANCE_SNAPSHOT_SCRIPT))
+
+    async def check_performance(self, label: str) -> PerformanceMetrics:
+        metrics = await self.collect_performance(label)
+        self._assert_within_budget(metrics)
+        return metrics
+
+    async def wait_for_images(self, timeout: int = DEFAULT_TIMEOUT):
+        await self.page.wait_for_function(IMAGES_SETTLED_SCRIPT, timeout=timeout)
+
+    async def _wait_for_ready_state(self, ready: ReadyState, timeout: float):
+        expression = ready_state_expression(ready)
+        if expression:
+            await self.page.wait_for_function(expression, arg=list(ready.selectors), timeout=timeout)
+
+    async def wait_for_element(self, selector: str, timeout: int = DEFAULT_TIMEOUT):
+        await self.page.wait_for_selector(selector, timeout=timeout)
+
+    async def click_element(self, selector: str):
+        await self.page.click(selector)
+
+    async def get_text(self, selector: str) -> str:
+        return await self.page.text_content(selector)
+
+    async def is_visible(self, selector: str) -> bool:
+        return await self.page.is_visible(selector)
+
+    async def is_enabled(self, selector: str) -> bool:
+        return await self.page.is_enabled(selector)
+
+    async def get_attribute(self, selector: str, attribute: str) -> str:
+        return await self.page.get_attribute(selector, attribute)
+
+
+class AsyncHomePage(AsyncBasePage):
+
+    selectors = HomePage.selectors
+    path = HomePage.path
+    ready_state = HomePage.ready_state
+    performance_budget = HomePage.performance_budget
+    _card_selectors = HomePage._card_selectors
+    _product_details = HomePage._product_details
+
+    async def navigate(self):
+        await self.perform_and_wait(
+            lambda: AsyncBasePage.navigate(self, self.path, wait_until="domcontentloaded"), self, "navigate")
+
+    async def get_product_cards(self):
+        return await self.locator("product_cards").all()
+
+    async def get_product_count(self) -> int:
+        return await self.locator("product_cards").count()
+
+    async def get_catalog_snapshot(self) -> List[ProductCard]:
+        cards = self.locator("product_cards")
+        await expect(cards.last).to_be_visible()
+        return HomePage._cards(await cards.evaluate_all(CATALOG_SNAPSHOT_SCRIPT, self._card_selectors()))
+
+    async def get_product_details(self, index: int = 0) -> dict:
+        product_card = self.locator("product_cards").nth(index)
+
+        name = await product_card.locator(self.product_name).text_content()
+        price = await product_card.locator(self.product_price).text_content()
+
+        return self._product_details(product_card, name, price)
+
+    async def click_product(self, index: int = 0):
+        product_card = self.locator("product_cards").nth(index)
+        await self.perform_and_wait(lambda: product_card.locator(self.product_link).click(),
+                                    AsyncProductDetailsPage(self.page), "click_product")
+
+    async def click_cart(self):
+        await self.perform_and_wait(lambda: self.locator("cart_link").first.click(),
+                                    AsyncCartPage(self.page), "click_cart")
+
+    async def validate_product_display(self):
+        products = await self.get_catalog_snapshot()
+        HomePage._validate_cards(products)
+        await self.expect_cards_visible(products)
+
+    async def expect_cards_visible(self, products: List[ProductCard]):
+        for i in HomePage._hidden_cards(products):
+            card = self.locator("product_cards").nth(i)
+            await expect(card.locator(self.product_image)).to_be_visible()
+            await expect(card.locator(self.product_link)).to_be_visible()
+
+    async def is_page_loaded(self) -> bool:
+        try:
+            return await self.locator("navbar_brand").is_visible()
+        except Exception:
+            return False
+
+    async def get_all_product_names(self) -> list:
+        return [product.name for product in await self.get_catalog_snapshot()]
+
+    async def get_all_product_prices(self) -> list:
+        return [product.price for product in await self.get_catalog_snapshot()]
+
+
+class AsyncProductDetailsPage(AsyncBasePage):
+
+    selectors = ProductDetailsPage.selectors
+    ready_state = ProductDetailsPage.ready_state
+    performance_budget = ProductDetailsPage.performance_budget
+
+    async def navigate(self, link_href: str):
+        path = ProductDetailsPage._path_for(link_href)
+        await self.perform_and_wait(
+            lambda: AsyncBasePage.navigate(self, path, wait_until="domcontentloaded"), self, "navigate")
+
+    async def get_product_name(self) -> str:
+        return await self.locator("product_name").first.text_content()
+
+    async def get_product_price(self) -> str:
+        return await self.locator("product_price").first.text_content()
+
+    async def get_product_description(self) -> str:
+        return await self.locator("product_description").first.text_content()
+
+    def get_product_image(self):
+        return self.locator("product_image")
+
+    async def click_add_to_cart(self):
+        await self.locator("add_to_cart_button").first.click()
+
+    async def add_to_cart(self, timeout: int = DEFAULT_TIMEOUT) -> DialogRecord:
+        async with self.dialogs.expect_dialog("Product added", timeout=timeout) as alert:
+            await self.click_add_to_cart()
+        return alert.value
+
+    async def click_back(self):
+        await self.perform_and_wait(lambda: self.locator("back_button").first.click(),
+                                    AsyncHomePage(self.page), "click_back")
+
+    async def click_cart(self):
+        await self.perform_and_wait(lambda: self.locator("cart_link").first.click(),
+                                    AsyncCartPage(self.page), "click_cart")
+
+    async def validate_product_details(self):
+        ProductDetailsPage._validate_texts(
+            await self.get_product_name(), await self.get_product_price(), await self.get_product_description())
+
+        await expect(self.get_product_image()).to_be_visible()
+
+        await expect(self.locator("add_to_cart_button")).to_be_visible()
+        await expect(self.locator("add_to_cart_button")).to_be_enabled()
+
+    async def is_page_loaded(self) -> bool:
+        try:
+            return await self.locator("product_name").is_visible()
+        except Exception:
+            return False
+
+    async def get_add_to_cart_button_text(self) -> str:
+        return await self.locator("add_to_cart_button").first.text_content()
+
+    async def is_add_to_cart_button_enabled(self) -> bool:
+        return await self.locator("add_to_cart_button").first.is_enabled()
+
+
+class AsyncCartPage(AsyncBasePage):
+
+    selectors = CartPage.selectors
+    path = CartPage.path
+    ready_state = CartPage.ready_state
+    performance_budget = CartPage.performance_budget
+    _row_selectors = CartPage._row_selectors
+
+    async def navigate(self):
+        await self.perform_and_wait(
+            lambda: AsyncBasePage.navigate(self, self.path, wait_until="domcontentloaded"), self, "navigate")
+
+    async def get_cart_items(self):
+        return await self.locator("cart_items").all()
+
+    async def get_cart_snapshot(self) -> List[CartItem]:
+        return CartPage._items(await self.locator("cart_items").evaluate_all(CART_SNAPSHOT_SCRIPT,
+                                                                               self._row_selectors()))
+
+    async def get_cart_item_count(self) -> int:
+        return await self.locator("cart_items").count()
+
+    async def get_item_details(self, index: int = 0) -> dict:
+        item = self.locator("cart_items").nth(index)
+
+        name = await item.locator(self.item_name).text_content()
+        price = await item.locator(self.item_price).text_content()
+
+        return CartPage._item_details(name, price)
+
+    async def get_total_price(self) -> str:
+        return await self.locator("total_price").first.text_content()
+
+    async def is_page_loaded(self) -> bool:
+        try:
+            has_items = await self.locator("cart_items").count() > 0
+            has_empty_message = await self.locator("empty_cart_message").is_visible()
+            return has_items or has_empty_message
+        except Exception:
+            return False
+
+    async def validate_cart_item(self, item_name: str, expected_price: str):
+        CartPage._validate_item(await self.get_cart_snapshot(), item_name, expected_price)
+
+    async def get_cart_total(self) -> str:
+        return await self.get_total_price()
+
+    async def wait_for_item_count(self, expected_count: int, timeout: int = DEFAULT_TIMEOUT):
+        await expect(self.locator("cart_items")).to_have_count(expected_count, timeout=timeout)
+
+    async def validate_cart_has_items(self, expected_count: int):
+        CartPage._validate_item_count(await self.get_cart_item_count(), expected_count)
+
+    async def wait_for_alert(self, message: str = "Product added", timeout: int = DEFAULT_TIMEOUT) -> DialogRecord:
+        return await self.dialogs.wait_for(message, timeout=timeout)
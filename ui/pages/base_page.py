@@ -1,18 +1,159 @@
-from playwright.sync_api import Page, expect
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from playwright.sync_api import Locator, Page, expect
 import sys
 sys.path.append('..')
-from configuration import BASE_URL, UI_DEFAULT_TIMEOUT as DEFAULT_TIMEOUT
+from configuration import (BASE_URL, UI_DEFAULT_TIMEOUT as DEFAULT_TIMEOUT, PERFORMANCE_BUDGETS_ENABLED,
+                           PERFORMANCE_BUDGET_SCALE)
+from ui.helpers.dialogs import DialogBroker
+from .performance import PerformanceBudget, PerformanceMetrics, PERFORMANCE_SNAPSHOT_SCRIPT, IMAGES_SETTLED_SCRIPT
+
+
+# What "ready" means for a page: visible selectors, API calls (URL substrings) that must have
+# completed, and/or a JS expression that must be truthy
+@dataclass(frozen=True)
+class ReadyState:
+    selectors: Tuple[str, ...] = ()
+    responses: Tuple[str, ...] = ()
+    predicate: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ReadinessTiming:
+    page: str
+    action: str
+    seconds: float
+
+
+VISIBLE_SELECTORS_SCRIPT = """
+selectors.every((selector) => {
+    const el = document.querySelector(selector);
+    if (!el) return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== "hidden";
+})
+"""
+
+
+def ready_state_expression(ready: ReadyState) -> Optional[str]:
+    """One JS function (taking the selectors) that is truthy once every condition holds, or None."""
+    conditions = []
+    if ready.selectors:
+        conditions.append(f"({VISIBLE_SELECTORS_SCRIPT.strip()})")
+    if ready.predicate:
+        conditions.append(f"({ready.predicate})")
+    if not conditions:
+        return None
+    # one polling wait in the browser for every condition instead of a wait per selector
+    return "(selectors) => " + " && ".join(conditions)
+
 
 class BasePage:
+    # shared across page objects so the session summary covers every page
+    readiness_timings: List[ReadinessTiming] = []
+    # every navigation's metrics, shared like readiness_timings; the UI conftest attaches them to reports
+    performance_metrics: List[PerformanceMetrics] = []
+    performance_budget: Optional[PerformanceBudget] = None
+    # attribute name -> selector; every entry is also set as an instance attribute
+    selectors: Dict[str, str] = {}
 
     def __init__(self, page: Page):
         self.page = page
         self.base_url = BASE_URL
+        for name, selector in self.selectors.items():
+            setattr(self, name, selector)
+        self._locators: Dict[str, Locator] = {}
+        self._locators_url: Optional[str] = None
+
+    def locator(self, name: str) -> Locator:
+        """Locator for a registered selector, built once and reused until the page URL changes."""
+        # page.url is tracked on the Python side, so this check costs no round trip to the browser
+        if self.page.url != self._locators_url:
+            self._locators.clear()
+            self._locators_url = self.page.url
+        locator = self._locators.get(name)
+        if locator is None:
+            locator = self._locators[name] = self.page.locator(getattr(self, name))
+        return locator
+
+    def ready_state(self) -> ReadyState:
+        return ReadyState()
+
+    def url_for(self, path: str = "") -> str:
+        return f"{self.base_url}{path}" if path else self.base_url
 
     #navigate to url
-    def navigate(self, url: str = ""):
-        full_url = f"{self.base_url}{url}" if url else self.base_url
-        self.page.goto(full_url)
+    def navigate(self, url: str = "", wait_until: str = "load"):
+        self.page.goto(self.url_for(url), wait_until=wait_until)
+
+    def wait_until_ready(self, timeout: int = DEFAULT_TIMEOUT):
+        self.perform_and_wait(None, self, "wait", timeout)
+
+    def perform_and_wait(self, action: Optional[Callable[[], None]], target: "BasePage", label: str,
+                         timeout: int = DEFAULT_TIMEOUT):
+        """Run `action` and wait once for `target` to be ready, recording how long it took."""
+        ready = target.ready_state()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            # response waits have to be armed before the action that triggers the requests
+            for predicate in self._response_predicates(ready, action):
+                stack.enter_context(self.page.expect_response(predicate, timeout=timeout))
+            if action:
+                action()
+        self._wait_for_ready_state(ready, self._remaining(timeout, start))
+        self._record_readiness(target, label, start)
+        if action:
+            target.check_performance(label)
+
+    # The bookkeeping around the browser calls, shared with the async page objects
+
+    @staticmethod
+    def _response_predicates(ready: ReadyState, action) -> List[Callable]:
+        # waiting without an action cannot catch responses that already arrived
+        return [lambda response, p=pattern: p in response.url for pattern in ready.responses] if action else []
+
+    @staticmethod
+    def _remaining(timeout: float, start: float) -> float:
+        return max(1, timeout - (time.perf_counter() - start) * 1000)
+
+    @staticmethod
+    def _record_readiness(target: "BasePage", label: str, start: float):
+        BasePage.readiness_timings.append(ReadinessTiming(type(target).__name__, label, time.perf_counter() - start))
+
+    def _record_performance(self, label: str, snapshot: dict) -> PerformanceMetrics:
+        metrics = PerformanceMetrics(type(self).__name__, label, **snapshot)
+        BasePage.performance_metrics.append(metrics)
+        return metrics
+
+    def collect_performance(self, label: str) -> PerformanceMetrics:
+        return self._record_performance(label, self.page.evaluate(PERFORMANCE_SNAPSHOT_SCRIPT))
+
+    def check_performance(self, label: str) -> PerformanceMetrics:
+        """Collect the current document's metrics and fail if they are over this page's budget."""
+        metrics = self.collect_performance(label)
+        self._assert_within_budget(metrics)
+        return metrics
+
+    def _assert_within_budget(self, metrics: PerformanceMetrics):
+        if not (PERFORMANCE_BUDGETS_ENABLED and self.performance_budget):
+            return
+        violations = self.performance_budget.violations(metrics, PERFORMANCE_BUDGET_SCALE)
+        assert not violations, f"{metrics.page}.{metrics.action} over performance budget: {', '.join(violations)}"
+
+    @property
+    def dialogs(self) -> DialogBroker:
+        return DialogBroker.for_page(self.page)
+
+    def wait_for_images(self, timeout: int = DEFAULT_TIMEOUT):
+        self.page.wait_for_function(IMAGES_SETTLED_SCRIPT, timeout=timeout)
+
+    def _wait_for_ready_state(self, ready: ReadyState, timeout: float):
+        expression = ready_state_expression(ready)
+        if expression:
+            self.page.wait_for_function(expression, arg=list(ready.selectors), timeout=timeout)
 
     def wait_for_element(self, selector: str, timeout: int = DEFAULT_TIMEOUT):
         self.page.wait_for_selector(selector, timeout=timeout)
@@ -31,5 +172,3 @@ class BasePage:
 
     def get_attribute(self, selector: str, attribute: str) -> str:
         return self.page.get_attribute(selector, attribute)
-
-
@@ -1,75 +1,121 @@
-from playwright.sync_api import Page, expect
-from .base_page import BasePage
+from dataclasses import dataclass
+from typing import List
+
+from playwright.sync_api import expect
+from .base_page import BasePage, ReadyState, PerformanceBudget, DEFAULT_TIMEOUT
+from ui.helpers.dialogs import DialogRecord
+
+
+# Reads every cart row in a single browser round-trip
+CART_SNAPSHOT_SCRIPT = """
+(rows, sel) => rows.map((row) => {
+    const name = row.querySelector(sel.name);
+    const price = row.querySelector(sel.price);
+    return {
+        name: name ? name.textContent.trim() : "",
+        price: price ? price.textContent.trim() : "",
+    };
+})
+"""
+
+
+@dataclass(frozen=True)
+class CartItem:
+    name: str
+    price: str
 
 
 class CartPage(BasePage):
 
-    def __init__(self, page: Page):
-        super().__init__(page)
+    selectors = {
+        "cart_items": ".success",
+        "item_name": "td:nth-child(2)",
+        "item_price": "td:nth-child(3)",
+        "total_price": "#totalp",
+        "delete_button": ".btn-danger",
+        "place_order_button": ".btn-success",
+        "empty_cart_message": ".text-center",
+    }
+    # rows are rendered after the cart API call, so layout shift is expected but bounded
+    performance_budget = PerformanceBudget(ttfb_ms=2000, dom_content_loaded_ms=5000, cls=0.25)
+
+    path = "/cart.html"
+
+    def ready_state(self) -> ReadyState:
+        return ReadyState(selectors=(self.place_order_button,), responses=("/viewcart",))
 
-        # Selectors
-        self.cart_items = ".success"
-        self.item_name = "td:nth-child(2)"
-        self.item_price = "td:nth-child(3)"
-        self.total_price = "#totalp"
-        self.delete_button = ".btn-danger"
-        self.place_order_button = ".btn-success"
-        self.empty_cart_message = ".text-center"
+    def navigate(self):
+        self.perform_and_wait(lambda: BasePage.navigate(self, self.path, wait_until="domcontentloaded"),
+                              self, "navigate")
 
     def get_cart_items(self):
-        return self.page.locator(self.cart_items).all()
+        return self.locator("cart_items").all()
+
+    def get_cart_snapshot(self) -> List[CartItem]:
+        return self._items(self.locator("cart_items").evaluate_all(CART_SNAPSHOT_SCRIPT, self._row_selectors()))
+
+    def _row_selectors(self) -> dict:
+        return {"name": self.item_name, "price": self.item_price}
+
+    @staticmethod
+    def _items(snapshot: List[dict]) -> List[CartItem]:
+        return [CartItem(**row) for row in snapshot]
 
     def get_cart_item_count(self) -> int:
-        return self.page.locator(self.cart_items).count()
+        return self.locator("cart_items").count()
 
     def get_item_details(self, index: int = 0) -> dict:
-        item = self.page.locator(self.cart_items).nth(index)
+        item = self.locator("cart_items").nth(index)
 
         name = item.locator(self.item_name).text_content()
         price = item.locator(self.item_price).text_content()
 
+        return self._item_details(name, price)
+
+    @staticmethod
+    def _item_details(name: str, price: str) -> dict:
         return {
             "name": name.strip() if name else "",
             "price": price.strip() if price else ""
         }
 
     def get_total_price(self) -> str:
-        return self.page.text_content(self.total_price)
+        return self.locator("total_price").first.text_content()
 
 
     def is_page_loaded(self) -> bool:
         try:
             # Check if cart page is loaded by looking for either items or empty message
-            has_items = self.page.locator(self.cart_items).count() > 0
-            has_empty_message = self.page.locator(self.empty_cart_message).is_visible()
+            has_items = self.locator("cart_items").count() > 0
+            has_empty_message = self.locator("empty_cart_message").is_visible()
             return has_items or has_empty_message
         except Exception:
             return False
 
     def validate_cart_item(self, item_name: str, expected_price: str):
-        items = self.get_cart_items()
-        found = False
+        self._validate_item(self.get_cart_snapshot(), item_name, expected_price)
 
-        for i in range(len(items)):
-            item = self.get_item_details(i)
-            if item["name"] == item_name:
-                assert item["price"] == expected_price, f"Price mismatch for {item_name}"
-                found = True
-                break
+    @staticmethod
+    def _validate_item(items: List[CartItem], item_name: str, expected_price: str):
+        item = next((item for item in items if item.name == item_name), None)
 
-        assert found, f"Item {item_name} not found in cart"
+        assert item is not None, f"Item {item_name} not found in cart"
+        assert item.price == expected_price, f"Price mismatch for {item_name}"
 
     def get_cart_total(self) -> str:
         return self.get_total_price()
 
+    # rows are rendered one by one after the cart API call, so wait for them to settle
+    def wait_for_item_count(self, expected_count: int, timeout: int = DEFAULT_TIMEOUT):
+        expect(self.locator("cart_items")).to_have_count(expected_count, timeout=timeout)
+
     def validate_cart_has_items(self, expected_count: int):
-        actual_count = self.get_cart_item_count()
-        assert actual_count == expected_count, f"Expected {expected_count} items, got {actual_count}"
+        self._validate_item_count(self.get_cart_item_count(), expected_count)
 
+    @staticmethod
+    def _validate_item_count(actual_count: int, expected_count: int):
+        assert actual_count == expected_count, f"Expected {expected_count} items, got {actual_count}"
 
-    def wait_for_alert(self):
-        def handle_dialog(dialog):
-            assert "Product added" in dialog.message, f"Unexpected alert message: {dialog.message}"
-            dialog.accept()
 
-        self.page.on("dialog", handle_dialog)
\ No newline at end of file
+    def wait_for_alert(self, message: str = "Product added", timeout: int = DEFAULT_TIMEOUT) -> DialogRecord:
+        return self.dialogs.wait_for(message, timeout=timeout)
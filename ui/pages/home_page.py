@@ -1,110 +1,159 @@
-from playwright.sync_api import Page, expect
-
-from ui.pages.base_page import BasePage
+from dataclasses import dataclass
+from typing import List
+
+from playwright.sync_api import expect
+
+from .base_page import BasePage, ReadyState, PerformanceBudget
+
+
+# Reads every card in a single browser round-trip instead of one IPC call per card and field
+CATALOG_SNAPSHOT_SCRIPT = """
+(cards, sel) => {
+    const visible = (el) => {
+        if (!el) return false;
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== "hidden";
+    };
+    return cards.map((card) => {
+        const name = card.querySelector(sel.name);
+        const price = card.querySelector(sel.price);
+        const image = card.querySelector(sel.image);
+        const link = card.querySelector(sel.link);
+        return {
+            name: name ? name.textContent.trim() : "",
+            price: price ? price.textContent.trim() : "",
+            image_src: image ? image.getAttribute("src") || "" : "",
+            image_visible: visible(image),
+            link_href: link ? link.getAttribute("href") || "" : "",
+            link_visible: visible(link),
+        };
+    });
+}
+"""
+
+
+@dataclass(frozen=True)
+class ProductCard:
+    name: str
+    price: str
+    image_src: str
+    image_visible: bool
+    link_href: str
+    link_visible: bool
 
 
 class HomePage(BasePage):
 
-    def __init__(self, page: Page):
-        super().__init__(page)
+    selectors = {
+        "product_cards": ".col-lg-4.col-md-6.mb-4",
+        "product_name": ".card-title",
+        "product_price": "h5",
+        "product_image": ".card-img-top",
+        "product_link": ".hrefch",
+        "cart_link": "#cartur",
+        "navbar_brand": ".navbar-brand",
+    }
+    # sized for the live store from a CI runner; PERFORMANCE_BUDGET_SCALE loosens the time limits
+    performance_budget = PerformanceBudget(ttfb_ms=2000, dom_content_loaded_ms=5000, lcp_ms=6000, cls=0.25)
+
+    path = "/"
 
-        # Selectors
-        self.product_cards = ".col-lg-4.col-md-6.mb-4"
-        self.product_name = ".card-title"
-        self.product_price = "h5"
-        self.product_image = ".card-img-top"
-        self.product_link = ".hrefch"
-        self.cart_link = "#cartur"
-        self.navbar_brand = ".navbar-brand"
+    def ready_state(self) -> ReadyState:
+        return ReadyState(selectors=(self.navbar_brand, self.product_cards))
 
     def navigate(self):
-        super().navigate("/")
-        # Wait for either navbar or products to be visible
-        try:
-            self.wait_for_element(self.navbar_brand)
-        except:
-            # If navbar doesn't load, try waiting for products
-            self.wait_for_element(self.product_cards)
+        self.perform_and_wait(lambda: BasePage.navigate(self, self.path, wait_until="domcontentloaded"),
+                              self, "navigate")
 
     def get_product_cards(self):
-        return self.page.locator(self.product_cards).all()
+        return self.locator("product_cards").all()
 
     def get_product_count(self) -> int:
-        return self.page.locator(self.product_cards).count()
+        return self.locator("product_cards").count()
+
+    def get_catalog_snapshot(self) -> List[ProductCard]:
+        cards = self.locator("product_cards")
+        # the snapshot looks once, so let the cards rendered after the catalog API call appear first
+        expect(cards.last).to_be_visible()
+        return self._cards(cards.evaluate_all(CATALOG_SNAPSHOT_SCRIPT, self._card_selectors()))
+
+    def _card_selectors(self) -> dict:
+        return {
+            "name": self.product_name,
+            "price": self.product_price,
+            "image": self.product_image,
+            "link": self.product_link,
+        }
+
+    @staticmethod
+    def _cards(snapshot: List[dict]) -> List[ProductCard]:
+        return [ProductCard(**card) for card in snapshot]
 
     def get_product_details(self, index: int = 0) -> dict:
-        product_card = self.page.locator(self.product_cards).nth(index)
+        product_card = self.locator("product_cards").nth(index)
 
         name = product_card.locator(self.product_name).text_content()
         price = product_card.locator(self.product_price).text_content()
-        image = product_card.locator(self.product_image)
-        link = product_card.locator(self.product_link)
 
+        return self._product_details(product_card, name, price)
+
+    def _product_details(self, product_card, name: str, price: str) -> dict:
         return {
             "name": name.strip() if name else "",
             "price": price.strip() if price else "",
-            "image": image,
-            "link": link
+            "image": product_card.locator(self.product_image),
+            "link": product_card.locator(self.product_link)
         }
 
     def click_product(self, index: int = 0):
-        product_card = self.page.locator(self.product_cards).nth(index)
-        product_card.locator(self.product_link).click()
-        # Wait for page to load with shorter timeout
-        try:
-            self.page.wait_for_load_state("domcontentloaded")
-        except:
-            self.page.wait_for_load_state("load", timeout=5000)
+        from .product_details_page import ProductDetailsPage
 
-    def click_cart(self):
-        self.page.click(self.cart_link)
-        # Wait for page to load with shorter timeout
-        try:
-            self.page.wait_for_load_state("domcontentloaded")
-        except:
-            self.page.wait_for_load_state("load", timeout=5000)
+        product_card = self.locator("product_cards").nth(index)
+        self.perform_and_wait(lambda: product_card.locator(self.product_link).click(),
+                              ProductDetailsPage(self.page), "click_product")
 
-    def validate_product_display(self):
-        products = self.get_product_cards()
+    def click_cart(self):
+        from .cart_page import CartPage
 
-        for i in range(len(products)):
-            product = self.get_product_details(i)
+        self.perform_and_wait(lambda: self.locator("cart_link").first.click(), CartPage(self.page), "click_cart")
 
+    def validate_product_display(self):
+        products = self.get_catalog_snapshot()
+        self._validate_cards(products)
+        self.expect_cards_visible(products)
+
+    def expect_cards_visible(self, products: List[ProductCard]):
+        """Retrying visibility checks, only for the cards the snapshot saw hidden (e.g. lazy images)."""
+        for i in self._hidden_cards(products):
+            card = self.locator("product_cards").nth(i)
+            expect(card.locator(self.product_image)).to_be_visible()
+            expect(card.locator(self.product_link)).to_be_visible()
+
+    @staticmethod
+    def _hidden_cards(products: List[ProductCard]) -> List[int]:
+        return [i for i, product in enumerate(products) if not (product.image_visible and product.link_visible)]
+
+    @staticmethod
+    def _validate_cards(products: List[ProductCard]):
+        for i, product in enumerate(products):
             # Validate product name exists and is not empty
-            assert product["name"], f"Product {i} name is empty"
-            assert len(product["name"]) > 0, f"Product {i} name is empty"
+            assert product.name, f"Product {i} name is empty"
 
             # Validate price exists and contains currency symbol
-            assert product["price"], f"Product {i} price is empty"
-            assert "$" in product["price"], f"Product {i} price doesn't contain $"
-
-            # Validate image is visible
-            expect(product["image"]).to_be_visible()
-
-            # Validate link exists
-            expect(product["link"]).to_be_visible()
+            assert product.price, f"Product {i} price is empty"
+            assert "$" in product.price, f"Product {i} price doesn't contain $"
 
     def is_page_loaded(self) -> bool:
         try:
             # Just check if navbar is visible ]
-            navbar_visible = self.page.locator(self.navbar_brand).is_visible()
+            navbar_visible = self.locator("navbar_brand").is_visible()
             return navbar_visible
         except Exception:
             return False
 
 
     def get_all_product_names(self) -> list:
-        names = []
-        count = self.get_product_count()
-        for i in range(count):
-            product = self.get_product_details(i)
-            names.append(product["name"])
-        return names
+        return [product.name for product in self.get_catalog_snapshot()]
 
     def get_all_product_prices(self) -> list:
-        prices = []
-        count = self.get_product_count()
-        for i in range(count):
-            product = self.get_product_details(i)
-            prices.append(product["price"])
-        return prices
+        return [product.price for product in self.get_catalog_snapshot()]
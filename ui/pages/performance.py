@@ -0,0 +1,101 @@
+from dataclasses import dataclass, fields
+from typing import List, Optional
+
+# Added to every context before any page script runs: LCP and CLS are only observable through
+# PerformanceObserver, so they have to be watched from the start of each document
+PERFORMANCE_INIT_SCRIPT = """
+(() => {
+    const supported = PerformanceObserver.supportedEntryTypes || [];
+    const vitals = window.__perfVitals = {
+        lcp: null,
+        cls: supported.includes("layout-shift") ? 0 : null,
+    };
+    if (supported.includes("largest-contentful-paint")) {
+        new PerformanceObserver((list) => {
+            const entries = list.getEntries();
+            const last = entries[entries.length - 1];
+            vitals.lcp = last.renderTime || last.loadTime || last.startTime;
+        }).observe({type: "largest-contentful-paint", buffered: true});
+    }
+    if (vitals.cls !== null) {
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) {
+                if (!entry.hadRecentInput) vitals.cls += entry.value;
+            }
+        }).observe({type: "layout-shift", buffered: true});
+    }
+})();
+"""
+
+# Navigation Timing, Resource Timing, the observed vitals and image decode status in one call;
+# times are milliseconds from navigation start, null when the browser has not reached them yet
+PERFORMANCE_SNAPSHOT_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    const resources = performance.getEntriesByType("resource");
+    const images = Array.from(document.images).filter((img) => img.currentSrc);
+    const vitals = window.__perfVitals || {};
+    const since = (time) => (nav && time > 0 ? time - nav.startTime : null);
+    return {
+        url: location.href,
+        ttfb_ms: nav ? since(nav.responseStart) : null,
+        dom_content_loaded_ms: nav ? since(nav.domContentLoadedEventEnd) : null,
+        load_ms: nav ? since(nav.loadEventEnd) : null,
+        lcp_ms: vitals.lcp ?? null,
+        cls: vitals.cls ?? null,
+        resource_count: resources.length,
+        transfer_kb: (resources.reduce((sum, r) => sum + (r.transferSize || 0), (nav && nav.transferSize) || 0)) / 1024,
+        slowest_resource_ms: resources.reduce((max, r) => Math.max(max, r.duration), 0),
+        images: images.length,
+        images_pending: images.filter((img) => !img.complete).length,
+        images_broken: images.filter((img) => img.complete && img.naturalWidth === 0).length,
+    };
+}
+"""
+
+IMAGES_SETTLED_SCRIPT = "() => Array.from(document.images).every((img) => img.complete)"
+
+
+@dataclass(frozen=True)
+class PerformanceMetrics:
+    page: str
+    action: str
+    url: str
+    ttfb_ms: Optional[float]
+    dom_content_loaded_ms: Optional[float]
+    load_ms: Optional[float]
+    lcp_ms: Optional[float]
+    cls: Optional[float]
+    resource_count: int
+    transfer_kb: float
+    slowest_resource_ms: float
+    images: int
+    images_pending: int
+    images_broken: int
+
+
+@dataclass(frozen=True)
+class PerformanceBudget:
+    """Upper limits per metric; None means unchecked. Time limits (*_ms) are multiplied by `scale`."""
+    ttfb_ms: Optional[float] = None
+    dom_content_loaded_ms: Optional[float] = None
+    load_ms: Optional[float] = None
+    lcp_ms: Optional[float] = None
+    cls: Optional[float] = None
+    resource_count: Optional[int] = None
+    transfer_kb: Optional[float] = None
+    images_broken: Optional[int] = 0
+
+    def violations(self, metrics: PerformanceMetrics, scale: float = 1.0) -> List[str]:
+        found = []
+        for field in fields(self):
+            limit = getattr(self, field.name)
+            actual = getattr(metrics, field.name)
+            # metrics the browser does not report (yet) cannot be over budget
+            if limit is None or actual is None:
+                continue
+            if field.name.endswith("_ms"):
+                limit *= scale
+            if actual > limit:
+                found.append(f"{field.name} {actual:.4g} > {limit:.4g}")
+        return found
@@ -1,81 +1,101 @@
-from playwright.sync_api import Page, expect
-from .base_page import BasePage
+from playwright.sync_api import expect
+from .base_page import BasePage, ReadyState, PerformanceBudget, DEFAULT_TIMEOUT
+from ui.helpers.dialogs import DialogRecord
 
 
 class ProductDetailsPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
-
-        # Selectors
-        self.product_name = ".name"
-        self.product_price = "h3"
-        self.product_description = ".description"
-        self.add_to_cart_button = ".btn-success"
-        self.product_image = "img[src*='imgs']"
-        self.back_button = "button[onclick='history.back()']"
-        self.cart_link = "#cartur"
+
+    selectors = {
+        "product_name": ".name",
+        "product_price": "h3",
+        "product_description": ".description",
+        "add_to_cart_button": ".btn-success",
+        "product_image": "img[src*='imgs']",
+        "back_button": "button[onclick='history.back()']",
+        "cart_link": "#cartur",
+    }
+    # the product image is the largest paint
+    performance_budget = PerformanceBudget(ttfb_ms=2000, dom_content_loaded_ms=5000, lcp_ms=5000, cls=0.25)
+
+    def ready_state(self) -> ReadyState:
+        # the heading is in the static HTML and only gets its text once the product API call returns
+        return ReadyState(
+            selectors=(self.product_name, self.add_to_cart_button),
+            predicate=f"(document.querySelector({self.product_name!r}) || {{}}).textContent?.trim()",
+        )
 
     def get_product_name(self) -> str:
-        return self.page.text_content(self.product_name)
+        return self.locator("product_name").first.text_content()
 
     def get_product_price(self) -> str:
-        return self.page.text_content(self.product_price)
+        return self.locator("product_price").first.text_content()
 
     def get_product_description(self) -> str:
-        return self.page.text_content(self.product_description)
+        return self.locator("product_description").first.text_content()
 
     def get_product_image(self):
-        return self.page.locator(self.product_image)
+        return self.locator("product_image")
 
     def click_add_to_cart(self):
-        self.page.click(self.add_to_cart_button)
+        self.locator("add_to_cart_button").first.click()
+
+    # the store confirms with an alert once its add-to-cart call returns, so this waits exactly that long
+    def add_to_cart(self, timeout: int = DEFAULT_TIMEOUT) -> DialogRecord:
+        with self.dialogs.expect_dialog("Product added", timeout=timeout) as alert:
+            self.click_add_to_cart()
+        return alert.value
 
     def click_back(self):
-        self.page.click(self.back_button)
-        # Wait for page to load with shorter timeout
-        try:
-            self.page.wait_for_load_state("domcontentloaded")
-        except:
-            self.page.wait_for_load_state("load", timeout=5000)
+        from .home_page import HomePage
+
+        self.perform_and_wait(lambda: self.locator("back_button").first.click(), HomePage(self.page), "click_back")
 
     def click_cart(self):
-        self.page.click(self.cart_link)
-        # Wait for page to load with shorter timeout
-        try:
-            self.page.wait_for_load_state("domcontentloaded")
-        except:
-            self.page.wait_for_load_state("load", timeout=5000)
+        from .cart_page import CartPage
+
+        self.perform_and_wait(lambda: self.locator("cart_link").first.click(), CartPage(self.page), "click_cart")
+
+    def navigate(self, link_href: str):
+        """Open a product directly from its catalog link, e.g. ProductCard.link_href."""
+        self.perform_and_wait(
+            lambda: BasePage.navigate(self, self._path_for(link_href), wait_until="domcontentloaded"),
+            self, "navigate")
+
+    @staticmethod
+    def _path_for(link_href: str) -> str:
+        return "/" + link_href.lstrip("/")
 
     def validate_product_details(self):
+        self._validate_texts(self.get_product_name(), self.get_product_price(), self.get_product_description())
+
+        expect(self.get_product_image()).to_be_visible()
+
+        expect(self.locator("add_to_cart_button")).to_be_visible()
+        expect(self.locator("add_to_cart_button")).to_be_enabled()
+
+    @staticmethod
+    def _validate_texts(name: str, price: str, description: str):
         # Validate product name exists and is not empty
-        name = self.get_product_name()
         assert name, "Product name is empty"
         assert len(name) > 0, "Product name is empty"
 
-        price = self.get_product_price()
         assert price, "Product price is empty"
         assert "$" in price, "Product price doesn't contain $"
 
-        description = self.get_product_description()
         assert description, "Product description is empty"
         assert len(description) > 0, "Product description is empty"
 
-        expect(self.get_product_image()).to_be_visible()
-
-        expect(self.page.locator(self.add_to_cart_button)).to_be_visible()
-        expect(self.page.locator(self.add_to_cart_button)).to_be_enabled()
-
     def is_page_loaded(self) -> bool:
         try:
             # Check if we're on a product details page by looking for the name
-            name_visible = self.page.locator(self.product_name).is_visible()
+            name_visible = self.locator("product_name").is_visible()
             return name_visible
         except Exception:
             return False
 
 
     def get_add_to_cart_button_text(self) -> str:
-        return self.page.text_content(self.add_to_cart_button)
+        return self.locator("add_to_cart_button").first.text_content()
 
     def is_add_to_cart_button_enabled(self) -> bool:
-        return self.page.is_enabled(self.add_to_cart_button)
+        return self.locator("add_to_cart_button").first.is_enabled()
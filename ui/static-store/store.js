@@ -0,0 +1,44 @@
+// Local stand-in for the demoblaze front end: same markup and selectors, data from static JSON files
+function loadEntries() {
+    return fetch("entries.json").then((response) => response.json()).then((data) => data.Items);
+}
+
+function productUrl(item) {
+    return "prod.html?idp_=" + item.id;
+}
+
+function renderCatalog() {
+    loadEntries().then((items) => {
+        document.getElementById("tbodyid").innerHTML = items.map((item) =>
+            '<div class="col-lg-4 col-md-6 mb-4"><div class="card h-100">' +
+            '<a href="' + productUrl(item) + '"><img class="card-img-top img-fluid" src="' + item.img + '" alt=""></a>' +
+            '<div class="card-block"><h4 class="card-title"><a href="' + productUrl(item) + '" class="hrefch">' +
+            item.title + '</a></h4><h5>$' + item.price + '</h5><p class="card-text">' + item.desc + '</p></div>' +
+            '</div></div>').join("");
+    });
+}
+
+function renderProduct() {
+    const id = new URLSearchParams(location.search).get("idp_");
+    loadEntries().then((items) => {
+        const item = items.find((entry) => entry.id === id) || items[0];
+        document.getElementById("imgp").innerHTML = '<img src="' + item.img + '" width="400" height="400">';
+        document.querySelector(".name").textContent = item.title;
+        document.querySelector(".price-container").innerHTML = "$" + item.price + " <small>*includes tax</small>";
+        document.querySelector(".description").textContent = item.desc;
+        document.querySelector(".btn-success").onclick = () => alert("Product added.");
+    });
+}
+
+function renderCart() {
+    Promise.all([fetch("viewcart.json").then((response) => response.json()), loadEntries()]).then(([cart, items]) => {
+        let total = 0;
+        document.getElementById("tbodyid").innerHTML = cart.Items.map((row) => {
+            const item = items.find((entry) => entry.id === row.prod_id);
+            total += item.price;
+            return '<tr class="success"><td><img width="100" height="100" src="' + item.img + '"></td>' +
+                "<td>" + item.title + "</td><td>" + item.price + "</td><td><a href=\"#\">Delete</a></td></tr>";
+        }).join("");
+        document.getElementById("totalp").textContent = total;
+    });
+}
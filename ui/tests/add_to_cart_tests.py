@@ -3,21 +3,20 @@ from ui.helpers import  helpers as test_helpers
 
 @pytest.mark.cart
 class TestAddToCart:
-    def test_add_product_to_cart_with_confirmation_popup(self, setup_ui, product_details_page):
-        home_page = setup_ui
-        home_page.wait_for_element(home_page.product_cards)
-        # Navigate to first product details page
-        home_page.click_product(0)
-        product_details_page.wait_for_element(product_details_page.product_name)
+    def test_add_product_to_cart_with_confirmation_popup(self, first_product_page):
+        # Starts on the first product's details page, restored from the module's home -> product[0] walk
+        product_details_page = first_product_page
         assert product_details_page.is_page_loaded(), "Product details page did not load properly"
-        # Set up alert handler before clicking add to cart (the assert of dialog appear is in the setup function)
-        test_helpers.setup_alert_handler(product_details_page.page, "Product added")
-
-    def test_add_to_cart_button_text_and_state(self, setup_ui, product_details_page):
-        home_page = setup_ui
-        home_page.wait_for_element(home_page.product_cards)
-        home_page.click_product(0)
-        product_details_page.wait_for_element(product_details_page.product_name)
+        dialogs = test_helpers.setup_alert_handler(product_details_page.page)
+
+        with dialogs.expect_dialog("Product added") as alert:
+            product_details_page.click_add_to_cart()
+
+        assert alert.value.type == "alert", f"Unexpected dialog type: {alert.value.type}"
+        assert "Product added" in alert.value.message, f"Unexpected alert message: {alert.value.message}"
+
+    def test_add_to_cart_button_text_and_state(self, first_product_page):
+        product_details_page = first_product_page
 
         assert product_details_page.is_page_loaded(), "Product details page did not load properly"
         button_text = product_details_page.get_add_to_cart_button_text()
@@ -0,0 +1,217 @@
+import json
+
+import pytest
+from ui.helpers.asset_cache import AssetCache, cache_directives, max_age
+
+URL = "https://www.demoblaze.com/imgs/galaxy_s6.jpg"
+ETAG = '"v1"'
+
+
+class StubRequest:
+    def __init__(self, url=URL, method="GET", resource_type="image"):
+        self.url = url
+        self.method = method
+        self.resource_type = resource_type
+        self.headers = {"accept": "image/*"}
+
+
+class StubResponse:
+    def __init__(self, status=200, headers=None, body=b"jpeg"):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class StubServer:
+    """Answers with a fixed asset and 304 when If-None-Match carries its current ETag."""
+
+    def __init__(self, etag=ETAG, cache_control="", body=b"jpeg"):
+        self.etag = etag
+        self.cache_control = cache_control
+        self.body = body
+        self.requests = []
+
+    def fetch(self, headers):
+        self.requests.append(headers)
+        response_headers = {"etag": self.etag, "cache-control": self.cache_control, "content-length": "4"}
+        if headers.get("if-none-match") == self.etag:
+            return StubResponse(304, response_headers, b"")
+        return StubResponse(200, response_headers, self.body)
+
+
+class StubRoute:
+    def __init__(self, server, request=None):
+        self.server = server
+        self.request = request or StubRequest()
+        self.result = None
+
+    def fetch(self, headers):
+        return self.server.fetch(headers)
+
+    def fulfill(self, response=None, status=None, headers=None, body=None):
+        if response is not None:
+            status, headers, body = response.status, response.headers, response.body()
+        self.result = ("fulfilled", status, headers, body)
+
+    def abort(self):
+        self.result = ("aborted",)
+
+    def fallback(self):
+        self.result = ("fallback",)
+
+
+@pytest.fixture
+def server():
+    return StubServer()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    class Clock:
+        now = 1_000_000.0
+
+    monkeypatch.setattr("ui.helpers.asset_cache.time.time", lambda: Clock.now)
+    return Clock
+
+
+def load(cache, server) -> StubRoute:
+    route = StubRoute(server)
+    cache._handle(route)
+    return route
+
+
+class TestCacheControl:
+
+    def test_directives_are_parsed(self):
+        assert cache_directives('Public, max-age="60", no-cache') == {"public": "", "max-age": "60", "no-cache": ""}
+
+    @pytest.mark.parametrize("headers, expected", [
+        ({}, 0),
+        ({"cache-control": "max-age=60"}, 60),
+        ({"cache-control": "max-age=60", "age": "20"}, 40),
+        ({"cache-control": "max-age=60, no-cache"}, 0),
+        ({"cache-control": "max-age=soon"}, 0),
+    ])
+    def test_max_age(self, headers, expected):
+        assert max_age(headers) == expected
+
+
+class TestAssetCache:
+
+    def test_first_load_is_fetched_and_stored(self, tmp_path, server):
+        cache = AssetCache(tmp_path)
+
+        route = load(cache, server)
+
+        assert route.result[:2] == ("fulfilled", 200) and route.result[3] == b"jpeg"
+        assert "if-none-match" not in server.requests[0]
+        assert cache.stats["misses"] == 1
+        assert cache._load(URL)["body"] == b"jpeg"
+
+    def test_stale_entry_is_revalidated_with_its_etag(self, tmp_path, server):
+        cache = AssetCache(tmp_path)
+        load(cache, server)
+
+        route = load(cache, server)
+
+        assert server.requests[-1]["if-none-match"] == ETAG
+        assert route.result[1] == 200 and route.result[3] == b"jpeg"
+        assert "content-length" not in route.result[2]
+        assert cache.stats == {"hits": 0, "revalidated": 1, "misses": 1, "blocked": 0}
+
+    def test_changed_asset_replaces_the_entry(self, tmp_path, server):
+        cache = AssetCache(tmp_path)
+        load(cache, server)
+        server.etag, server.body = '"v2"', b"new jpeg"
+
+        route = load(cache, server)
+
+        assert route.result[3] == b"new jpeg"
+        assert cache._load(URL)["etag"] == '"v2"'
+        assert cache.stats["misses"] == 2
+
+    def test_fresh_entry_is_served_without_asking_the_server(self, tmp_path, clock):
+        server = StubServer(cache_control="max-age=60")
+        cache = AssetCache(tmp_path)
+        load(cache, server)
+
+        clock.now += 59
+        load(cache, server)
+        assert len(server.requests) == 1 and cache.stats["hits"] == 1
+
+        clock.now += 2
+        load(cache, server)
+        assert len(server.requests) == 2 and cache.stats["revalidated"] == 1
+
+    def test_304_starts_a_new_freshness_lifetime(self, tmp_path, clock):
+        server = StubServer(cache_control="max-age=60")
+        cache = AssetCache(tmp_path)
+        load(cache, server)
+        clock.now += 61
+        load(cache, server)
+
+        clock.now += 59
+        load(cache, server)
+
+        assert len(server.requests) == 2
+
+    @pytest.mark.parametrize("cache_control", ["no-store", "private, max-age=600", "No-Store"])
+    def test_uncacheable_responses_are_not_stored(self, tmp_path, cache_control):
+        server = StubServer(cache_control=cache_control)
+        cache = AssetCache(tmp_path)
+
+        load(cache, server)
+        load(cache, server)
+
+        assert "if-none-match" not in server.requests[-1]
+        assert cache._load(URL) is None
+        assert cache.stats["misses"] == 2
+
+    def test_asset_that_becomes_uncacheable_is_dropped(self, tmp_path, server):
+        cache = AssetCache(tmp_path)
+        load(cache, server)
+        server.etag, server.cache_control = '"v2"', "no-store"
+
+        load(cache, server)
+
+        assert cache._load(URL) is None
+
+    def test_without_revalidation_entries_are_served_blindly(self, tmp_path, server):
+        cache = AssetCache(tmp_path, revalidate=False)
+        load(cache, server)
+
+        route = load(cache, server)
+
+        assert len(server.requests) == 1
+        assert route.result[3] == b"jpeg" and cache.stats["hits"] == 1
+
+    def test_entries_from_before_freshness_tracking_are_revalidated(self, tmp_path, server):
+        cache = AssetCache(tmp_path)
+        load(cache, server)
+        meta_path = cache._meta_path(URL)
+        meta = json.loads(meta_path.read_text())
+        del meta["stored_at"], meta["max_age"]
+        meta_path.write_text(json.dumps(meta))
+
+        load(cache, server)
+
+        assert cache.stats["revalidated"] == 1
+
+    def test_blocked_hosts_are_aborted(self, tmp_path, server):
+        cache = AssetCache(tmp_path, blocked_hosts=("googletagmanager.com",))
+        route = StubRoute(server, StubRequest("https://www.googletagmanager.com/gtag.js", resource_type="script"))
+
+        cache._handle(route)
+
+        assert route.result == ("aborted",) and not server.requests
+
+    @pytest.mark.parametrize("request_", [StubRequest(resource_type="document"), StubRequest(method="POST")])
+    def test_documents_and_non_get_requests_are_passed_on(self, tmp_path, server, request_):
+        route = StubRoute(server, request_)
+
+        AssetCache(tmp_path)._handle(route)
+
+        assert route.result == ("fallback",) and not server.requests
@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.mark.cart
+class TestCart:
+
+    @pytest.mark.cart_items(2)
+    def test_preloaded_cart_shows_seeded_items(self, seeded_cart_page):
+        assert seeded_cart_page.is_page_loaded(), "Cart page did not load properly"
+        seeded_cart_page.wait_for_item_count(2)
+        seeded_cart_page.validate_cart_has_items(2)
+
+    @pytest.mark.cart_items(1, product_ids=(1,))
+    def test_preloaded_cart_item_has_name_and_price(self, seeded_cart_page):
+        seeded_cart_page.wait_for_item_count(1)
+        item = seeded_cart_page.get_cart_snapshot()[0]
+
+        assert item.name, "Cart item name is empty"
+        assert item.price, "Cart item price is empty"
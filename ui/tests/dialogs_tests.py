@@ -0,0 +1,228 @@
+import asyncio
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from ui.helpers.dialogs import AsyncDialogBroker, DialogBroker
+
+
+class StubDialog:
+    def __init__(self, message, type="alert"):
+        self.type = type
+        self.message = message
+        self.default_value = ""
+        self.handled = None
+
+    def accept(self):
+        self.handled = "accepted"
+
+    def dismiss(self):
+        self.handled = "dismissed"
+
+
+class StubPage:
+    """Raises dialogs right away with emit(), or queues them for the next wait_for_event()."""
+
+    url = "https://www.demoblaze.com/prod.html?idp_=1"
+
+    def __init__(self):
+        self.listeners = []
+        self.queued = []
+
+    def on(self, event, listener):
+        self.listeners.append(listener)
+
+    def emit(self, dialog):
+        for listener in self.listeners:
+            listener(dialog)
+        return dialog
+
+    def wait_for_event(self, event, timeout):
+        if not self.queued:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+        return self.emit(self.queued.pop(0))
+
+
+class AsyncStubDialog(StubDialog):
+    async def accept(self):
+        self.handled = "accepted"
+
+    async def dismiss(self):
+        self.handled = "dismissed"
+
+
+class AsyncStubPage(StubPage):
+    """Dialogs come from emit_later(), as if raised by the browser while a wait is pending."""
+
+    def __init__(self):
+        super().__init__()
+        self.waiters = []
+
+    def emit(self, dialog):
+        super().emit(dialog)
+        for waiter in self.waiters:
+            if not waiter.done():
+                waiter.set_result(dialog)
+        self.waiters.clear()
+        return dialog
+
+    def emit_later(self, dialog, delay=0.01):
+        asyncio.get_running_loop().call_later(delay, self.emit, dialog)
+        return dialog
+
+    async def wait_for_event(self, event, timeout):
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout / 1000)
+        except asyncio.TimeoutError:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+
+@pytest.fixture
+def page():
+    return StubPage()
+
+
+@pytest.fixture
+def broker(page):
+    return DialogBroker.for_page(page)
+
+
+class TestDialogBroker:
+
+    def test_for_page_returns_one_broker_per_page(self, page, broker):
+        assert DialogBroker.for_page(page) is broker
+        assert DialogBroker.for_page(StubPage()) is not broker
+        assert len(page.listeners) == 1
+
+    def test_every_dialog_is_recorded_and_accepted(self, page, broker):
+        dialog = page.emit(StubDialog("Product added", type="confirm"))
+
+        assert dialog.handled == "accepted"
+        record = broker.records[0]
+        assert (record.type, record.message, record.url) == ("confirm", "Product added", page.url)
+
+    def test_dismissing_broker_dismisses(self, page):
+        broker = DialogBroker(page, accept=False)
+
+        assert page.emit(StubDialog("Sure?", type="confirm")).handled == "dismissed"
+        assert broker.records[0].message == "Sure?"
+
+    def test_dialogs_are_claimed_in_order(self, page, broker):
+        page.emit(StubDialog("Product added."))
+        page.emit(StubDialog("Thank you for your purchase!"))
+
+        assert broker.wait_for().message == "Product added."
+        assert broker.wait_for().message == "Thank you for your purchase!"
+        with pytest.raises(AssertionError):
+            broker.wait_for(timeout=10)
+
+    def test_wait_skips_to_the_first_match(self, page, broker):
+        page.emit(StubDialog("Sure?", type="confirm"))
+        page.emit(StubDialog("Wrong password."))
+        page.emit(StubDialog("Product added."))
+
+        assert broker.wait_for("Product added").message == "Product added."
+        # everything before the claimed dialog is passed over too
+        with pytest.raises(AssertionError):
+            broker.wait_for("Wrong password", timeout=10)
+
+    def test_type_and_callable_matchers(self, page, broker):
+        page.emit(StubDialog("Product added."))
+        page.emit(StubDialog("Sure?", type="confirm"))
+
+        assert broker.wait_for(dialog_type="confirm").message == "Sure?"
+        assert broker.wait_for(lambda record: record.message.endswith("."), dialog_type=None, start=0).type == "alert"
+
+    def test_wait_blocks_until_the_dialog_arrives(self, page, broker):
+        page.queued = [StubDialog("Please fill out Username and Password."), StubDialog("Product added.")]
+
+        assert broker.wait_for("Product added").message == "Product added."
+        assert not page.queued
+
+    def test_expect_dialog_ignores_dialogs_from_before_the_block(self, page, broker):
+        page.emit(StubDialog("Product added."))
+
+        with broker.expect_dialog("Product added", timeout=10) as alert:
+            page.queued.append(StubDialog("Product added!"))
+
+        assert alert.value.message == "Product added!"
+        assert broker.records[0].message == "Product added."
+
+    def test_expect_dialog_sees_dialogs_raised_during_the_block(self, page, broker):
+        with broker.expect_dialog("Product added") as alert:
+            page.emit(StubDialog("Product added."))
+
+        assert alert.value is broker.records[0]
+
+    def test_timeout_lists_the_unclaimed_dialogs(self, page, broker):
+        page.emit(StubDialog("Product added."))
+        broker.wait_for()
+        page.emit(StubDialog("Sure?", type="confirm"))
+        page.emit(StubDialog("Wrong password."))
+
+        with pytest.raises(AssertionError) as error:
+            broker.wait_for("Thank you", timeout=10)
+
+        assert str(error.value) == ("No alert matching 'Thank you' within 10ms "
+                                    "(unclaimed: confirm: 'Sure?', alert: 'Wrong password.')")
+
+    def test_timeout_without_any_dialogs(self, broker):
+        with pytest.raises(AssertionError, match=r"No dialog matching None within 5ms \(unclaimed: none\)"):
+            broker.wait_for(dialog_type=None, timeout=5)
+
+
+class TestAsyncDialogBroker:
+
+    def test_for_page_returns_one_broker_per_page(self):
+        page = AsyncStubPage()
+        broker = AsyncDialogBroker.for_page(page)
+
+        assert AsyncDialogBroker.for_page(page) is broker
+        assert DialogBroker._brokers.get(page) is None
+
+    def test_dialogs_are_claimed_in_order_and_accepted(self):
+        async def scenario():
+            page = AsyncStubPage()
+            broker = AsyncDialogBroker.for_page(page)
+            first = page.emit(AsyncStubDialog("Product added."))
+            page.emit(AsyncStubDialog("Thank you for your purchase!"))
+            messages = [(await broker.wait_for()).message, (await broker.wait_for()).message]
+            await asyncio.sleep(0)
+            return messages, first.handled
+
+        messages, handled = asyncio.run(scenario())
+
+        assert messages == ["Product added.", "Thank you for your purchase!"]
+        assert handled == "accepted"
+
+    def test_dismissing_broker_dismisses(self):
+        async def scenario():
+            page = AsyncStubPage()
+            AsyncDialogBroker(page, accept=False)
+            dialog = page.emit(AsyncStubDialog("Sure?", type="confirm"))
+            await asyncio.sleep(0)
+            return dialog.handled
+
+        assert asyncio.run(scenario()) == "dismissed"
+
+    def test_expect_dialog_waits_for_a_dialog_raised_during_the_block(self):
+        async def scenario():
+            page = AsyncStubPage()
+            broker = AsyncDialogBroker.for_page(page)
+            page.emit(AsyncStubDialog("Product added."))
+            async with broker.expect_dialog("Product added", timeout=1000) as alert:
+                page.emit_later(AsyncStubDialog("Product added!"))
+            return alert.value.message
+
+        assert asyncio.run(scenario()) == "Product added!"
+
+    def test_timeout_lists_the_unclaimed_dialogs(self):
+        async def scenario():
+            page = AsyncStubPage()
+            broker = AsyncDialogBroker.for_page(page)
+            page.emit(AsyncStubDialog("Sure?", type="confirm"))
+            await broker.wait_for("Thank you", timeout=20)
+
+        with pytest.raises(AssertionError, match=r"within 20ms \(unclaimed: confirm: 'Sure\?'\)"):
+            asyncio.run(scenario())
@@ -20,18 +20,14 @@ class TestProductCatalog:
     def test_load_all_product_images_successfully(self, setup_ui):
         home_page = test_helpers.home_page_displayed(setup_ui)
         home_page.wait_for_element(home_page.product_cards)
-        product_count = home_page.get_product_count()
-
-        # Check that all product images are loaded and visible
-        for i in range(product_count):
-            product = home_page.get_product_details(i)
-            # Wait for image to load
-            expect(product["image"]).to_be_visible()
-            # Check that image has proper dimensions
-            image_box = product["image"].bounding_box()
-            assert image_box is not None, f"Product {i} image has no bounding box"
-            assert image_box["width"] > 0, f"Product {i} image has zero width"
-            assert image_box["height"] > 0, f"Product {i} image has zero height"
+        # Wait for every image to finish loading, then read decode status and visibility in two calls
+        home_page.wait_for_images()
+        metrics = home_page.collect_performance("images")
+        products = home_page.get_catalog_snapshot()
+
+        assert metrics.images >= len(products), f"Expected {len(products)} images, found {metrics.images}"
+        assert metrics.images_broken == 0, f"{metrics.images_broken} product images failed to load"
+        home_page.expect_cards_visible(products)
 
     def test_product_count_is_reasonable(self, setup_ui):
         home_page = test_helpers.home_page_displayed(setup_ui)
@@ -1,6 +1,10 @@
 import pytest
 from playwright.sync_api import expect
 from ui.helpers import helpers as test_helpers
+from ui.helpers.async_runner import gather_limited
+from ui.pages.async_pages import AsyncHomePage, AsyncProductDetailsPage
+
+MAX_CONCURRENT_PAGES = 5
 
 
 @pytest.mark.details
@@ -28,23 +32,15 @@ class TestProductDetails:
         actual_price_normalized = actual_price.split()[0]  # Get just the price part
         assert actual_price_normalized == expected_price_normalized, f"Product price mismatch: expected {expected_price_normalized}, got {actual_price_normalized}"
 
-    def test_display_correct_product_details(self, setup_ui, product_details_page):
-        home_page = test_helpers.home_page_displayed(setup_ui)
-
-        home_page.wait_for_element(home_page.product_cards)
-        home_page.click_product(0)
-        product_details_page.wait_for_element(product_details_page.product_name)
+    def test_display_correct_product_details(self, first_product_page_readonly):
+        product_details_page = first_product_page_readonly
 
         assert product_details_page.is_page_loaded(), "Product details page did not load properly"
 
         product_details_page.validate_product_details()
 
-    def test_display_product_image_on_details_page(self, setup_ui, product_details_page):
-        home_page = test_helpers.home_page_displayed(setup_ui)
-
-        home_page.wait_for_element(home_page.product_cards)
-        home_page.click_product(0)
-        product_details_page.wait_for_element(product_details_page.product_name)
+    def test_display_product_image_on_details_page(self, first_product_page_readonly):
+        product_details_page = first_product_page_readonly
 
         assert product_details_page.is_page_loaded(), "Product details page did not load properly"
 
@@ -56,12 +52,8 @@ class TestProductDetails:
         assert image_box["width"] > 0, "Product image has zero width"
         assert image_box["height"] > 0, "Product image has zero height"
 
-    def test_product_description_is_present(self, setup_ui, product_details_page):
-        home_page = test_helpers.home_page_displayed(setup_ui)
-
-        home_page.wait_for_element(home_page.product_cards)
-        home_page.click_product(0)
-        product_details_page.wait_for_element(product_details_page.product_name)
+    def test_product_description_is_present(self, first_product_page_readonly):
+        product_details_page = first_product_page_readonly
 
         assert product_details_page.is_page_loaded(), "Product details page did not load properly"
 
@@ -71,3 +63,26 @@ class TestProductDetails:
         assert description, "Product description is empty"
         assert len(description) > 0, "Product description is empty"
         assert len(description.strip()) > 0, "Product description contains only whitespace"
+
+    def test_all_product_details_match_catalog(self, async_runner, async_context):
+        async def check_catalog():
+            home_page = AsyncHomePage(await async_context.new_page())
+            await home_page.navigate()
+            catalog = await home_page.get_catalog_snapshot()
+            assert catalog, "Catalog is empty"
+
+            async def open_details(card):
+                details_page = AsyncProductDetailsPage(await async_context.new_page())
+                try:
+                    await details_page.navigate(card.link_href)
+                    await details_page.validate_product_details()
+                    return card, await details_page.get_product_name(), await details_page.get_product_price()
+                finally:
+                    await details_page.page.close()
+
+            return await gather_limited((open_details(card) for card in catalog), MAX_CONCURRENT_PAGES)
+
+        for card, name, price in async_runner.run(check_catalog()):
+            assert name == card.name, f"Product name mismatch: expected {card.name}, got {name}"
+            assert price.split()[0] == card.price.split()[0], \
+                f"Product price mismatch for {card.name}: expected {card.price}, got {price}"